@@ -0,0 +1,434 @@
+import argparse
+import ast
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.corpus_generator import CorpusGenerator
+from call_graph.call_graph_builder import CallGraphBuilder
+from call_graph.call_graph_extractor import CallGraphExtractor
+from components.inspector import Inspector
+from components.project_analyzer import ProjectAnalyzer
+from components.run_metrics import RunMetrics
+from utils.file_utils import FileUtils
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def _peak_rss_mb(children: bool = False) -> float | None:
+    """
+    Returns the peak resident set size of the current process (or of its
+    largest terminated child process), in MiB, or None if unknown.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(
+        resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    ).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _bench_inspector(corpus_dir: str, workers: int, output_dir: str) -> dict:
+    inspector = Inspector(output_path=output_dir)
+    filenames = [
+        filename
+        for project in sorted(os.listdir(corpus_dir))
+        for filename in FileUtils.get_python_files(
+            os.path.join(corpus_dir, project)
+        )
+    ]
+    # An untimed warm-up inspection imports what `inspect` loads on
+    # demand (e.g., pandas, to build its DataFrame), as the inspector was
+    # measured before those imports were deferred
+    if filenames:
+        inspector.inspect(filenames[0])
+        inspector.metrics = RunMetrics()
+    started = time.perf_counter()
+    for filename in filenames:
+        inspector.inspect(filename)
+    return {
+        "files": len(filenames),
+        "seconds": time.perf_counter() - started,
+        "metrics": inspector.metrics.summary(),
+    }
+
+
+def _bench_project_analyzer(
+    corpus_dir: str, workers: int, output_dir: str
+) -> dict:
+    analyzer = ProjectAnalyzer(output_dir)
+    started = time.perf_counter()
+    if workers > 1:
+        analyzer.analyze_projects_parallel(corpus_dir, max_workers=workers)
+    else:
+        analyzer.analyze_projects_sequential(corpus_dir)
+    analyzer.close()
+    return {
+        "files": analyzer.metrics.files,
+        "seconds": time.perf_counter() - started,
+        "metrics": analyzer.metrics.summary(),
+    }
+
+
+def _bench_callgraph(corpus_dir: str, workers: int, output_dir: str) -> dict:
+    extractor = CallGraphExtractor()
+    builder = CallGraphBuilder()
+    files = 0
+    started = time.perf_counter()
+    for project in sorted(os.listdir(corpus_dir)):
+        project_path = os.path.join(corpus_dir, project)
+        if not os.path.isdir(project_path):
+            continue
+        fragments = []
+        for filename in FileUtils.get_python_files(project_path):
+            with open(filename, encoding="utf-8") as file:
+                tree = ast.parse(file.read())
+            fragments.append(extractor.extract(tree, filename))
+            files += 1
+        builder.build(fragments, project_root=project_path)
+    return {"files": files, "seconds": time.perf_counter() - started}
+
+
+def run_scenario(scenario: str, corpus_dir: str, workers: int) -> dict:
+    """
+    Runs a benchmark scenario on a corpus. Meant to run in a fresh
+    process, so that its peak memory is not inflated by other scenarios.
+
+    Parameters:
+    - scenario (str): The scenario (see `BenchmarkRunner.SCENARIOS`).
+    - corpus_dir (str): The directory of the projects.
+    - workers (int): Number of worker processes of the parallel analysis.
+
+    Returns:
+    - dict: The analyzed files, the elapsed seconds and throughput, the
+      peak memory and, for the analyses, the seconds spent by each rule.
+    """
+    benchmark, scenario_workers = {
+        "inspector": (_bench_inspector, 1),
+        "project_analyzer_sequential": (_bench_project_analyzer, 1),
+        "project_analyzer_parallel": (_bench_project_analyzer, workers),
+        "callgraph": (_bench_callgraph, 1),
+    }[scenario]
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        # The progress messages of the analysis are not part of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            measured = benchmark(corpus_dir, scenario_workers, output_dir)
+
+    result = {
+        "files": measured["files"],
+        "seconds": round(measured["seconds"], 4),
+        "files_per_second": (
+            round(measured["files"] / measured["seconds"], 2)
+            if measured["seconds"] > 0
+            else 0.0
+        ),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    if scenario_workers > 1:
+        result["workers_peak_rss_mb"] = _peak_rss_mb(children=True)
+    if "metrics" in measured:
+        result["rules"] = {
+            rule: statistics["total"]
+            for rule, statistics in measured["metrics"]["rules"].items()
+        }
+    return result
+
+
+class BenchmarkRunner:
+    """
+    Benchmarks the static analyzer on a synthetic corpus: the files per
+    second, the peak memory and the time spent by each rule of the
+    `Inspector`, of `ProjectAnalyzer` (sequential and parallel) and of
+    the call graph extraction and `CallGraphBuilder`.
+
+    Results are machine-readable (JSON) and can be compared against a
+    stored baseline to catch throughput and memory regressions.
+    """
+
+    SCENARIOS = (
+        "inspector",
+        "project_analyzer_sequential",
+        "project_analyzer_parallel",
+        "callgraph",
+    )
+
+    def __init__(
+        self,
+        generator: CorpusGenerator,
+        workers: int = 2,
+        repeat: int = 1,
+    ):
+        """
+        Initializes the runner.
+
+        Parameters:
+        - generator (CorpusGenerator): Generates the benchmark corpus.
+        - workers (int): Number of worker processes of the parallel
+          analysis.
+        - repeat (int): Number of runs of each scenario; the fastest run
+          is reported.
+        """
+        self.generator = generator
+        self.workers = workers
+        self.repeat = max(1, repeat)
+
+    def run(
+        self,
+        scenarios: list[str] | None = None,
+        corpus_dir: str | None = None,
+    ) -> dict:
+        """
+        Generates the corpus and runs the scenarios, each one in a fresh
+        process.
+
+        Parameters:
+        - scenarios (list[str] | None): The scenarios to run (default:
+          all of them).
+        - corpus_dir (str | None): Where to generate the corpus, which is
+          kept. By default a temporary directory is used.
+
+        Returns:
+        - dict: The environment, the corpus and the result of every
+          scenario.
+        """
+        with tempfile.TemporaryDirectory() as temporary_dir:
+            corpus_dir = corpus_dir or temporary_dir
+            self.generator.generate(corpus_dir)
+            results = {
+                "environment": {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "cpus": os.cpu_count(),
+                },
+                "corpus": {
+                    **self.generator.settings(),
+                    **self._corpus_size(corpus_dir),
+                },
+                "scenarios": {},
+            }
+            for scenario in scenarios or self.SCENARIOS:
+                runs = [
+                    self._run_isolated(scenario, corpus_dir)
+                    for _ in range(self.repeat)
+                ]
+                results["scenarios"][scenario] = max(
+                    runs, key=lambda run: run["files_per_second"]
+                )
+        return results
+
+    def _run_isolated(self, scenario: str, corpus_dir: str) -> dict:
+        """
+        Runs a scenario in a new interpreter process.
+        """
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            return pool.submit(
+                run_scenario, scenario, corpus_dir, self.workers
+            ).result()
+
+    @staticmethod
+    def _corpus_size(corpus_dir: str) -> dict:
+        """
+        Returns the number of files, lines and bytes of a corpus.
+        """
+        files = lines = size = 0
+        for project in os.listdir(corpus_dir):
+            project_path = os.path.join(corpus_dir, project)
+            if not os.path.isdir(project_path):
+                continue
+            for filename in FileUtils.get_python_files(project_path):
+                with open(filename, "rb") as file:
+                    content = file.read()
+                files += 1
+                lines += content.count(b"\n")
+                size += len(content)
+        return {"files": files, "lines": lines, "bytes": size}
+
+    @staticmethod
+    def compare(results: dict, baseline: dict, tolerance: float) -> list:
+        """
+        Compares benchmark results against a baseline.
+
+        Parameters:
+        - results (dict): The results of `run`.
+        - baseline (dict): Results of a previous run.
+        - tolerance (float): Allowed relative slowdown or memory growth
+          (e.g., 0.1 for 10%).
+
+        Returns:
+        - list[str]: A description of every regression.
+        """
+        regressions = []
+        for scenario, result in results["scenarios"].items():
+            reference = baseline.get("scenarios", {}).get(scenario)
+            if reference is None:
+                continue
+            expected = reference["files_per_second"] * (1 - tolerance)
+            if result["files_per_second"] < expected:
+                regressions.append(
+                    f"{scenario}: {result['files_per_second']} files/s, "
+                    f"baseline {reference['files_per_second']} files/s"
+                )
+            for key in ("peak_rss_mb", "workers_peak_rss_mb"):
+                if result.get(key) is None or reference.get(key) is None:
+                    continue
+                if result[key] > reference[key] * (1 + tolerance):
+                    regressions.append(
+                        f"{scenario}: {key} {result[key]} MiB, "
+                        f"baseline {reference[key]} MiB"
+                    )
+        return regressions
+
+    @staticmethod
+    def format_results(results: dict) -> str:
+        """
+        Formats the results of the scenarios as a console table.
+        """
+        corpus = results["corpus"]
+        lines = [
+            f"Corpus: {corpus['files']} files, {corpus['lines']} lines",
+            "",
+            f"{'Scenario':<28}  {'Files/s':>9}  {'Seconds':>8}  "
+            f"{'Peak RSS (MiB)':>14}",
+        ]
+        for scenario, result in results["scenarios"].items():
+            peak = result["peak_rss_mb"]
+            lines.append(
+                f"{scenario:<28}  {result['files_per_second']:>9.1f}  "
+                f"{result['seconds']:>8.2f}  "
+                f"{'n/a' if peak is None else peak:>14}"
+            )
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the Code Smile static analyzer "
+        "on a synthetic corpus."
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=50,
+        help="Number of files of each project (default: 50)",
+    )
+    parser.add_argument(
+        "--functions",
+        type=int,
+        default=10,
+        help="Number of functions of each file (default: 10)",
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=0,
+        help="Nesting depth of the function bodies (default: 0)",
+    )
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=0.3,
+        help="Fraction of smelly functions (default: 0.3)",
+    )
+    parser.add_argument(
+        "--projects",
+        type=int,
+        default=4,
+        help="Number of projects (default: 4)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed (default: 0)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Worker processes of the parallel analysis (default: 2)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Runs of each scenario, the fastest is kept (default: 1)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=BenchmarkRunner.SCENARIOS,
+        default=None,
+        help="Scenarios to run (default: all)",
+    )
+    parser.add_argument(
+        "--corpus",
+        type=str,
+        default=None,
+        help="Directory where the corpus is generated and kept",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Path of the JSON results",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        help="Path of the JSON results to compare against",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed relative regression (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(
+        files_per_project=args.files,
+        functions_per_file=args.functions,
+        nesting_depth=args.depth,
+        smell_density=args.density,
+        projects=args.projects,
+        seed=args.seed,
+    )
+    runner = BenchmarkRunner(
+        generator, workers=args.workers, repeat=args.repeat
+    )
+    results = runner.run(args.scenarios, corpus_dir=args.corpus)
+    print(BenchmarkRunner.format_results(results))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline.get("corpus") != results["corpus"]:
+            print("Warning: the baseline was measured on another corpus.")
+        regressions = BenchmarkRunner.compare(
+            results, baseline, args.tolerance
+        )
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
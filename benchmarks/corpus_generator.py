@@ -0,0 +1,206 @@
+import ast
+import copy
+import os
+import random
+import textwrap
+from data_preparation.code_smell_injector import CodeSmellInjector
+
+
+class CorpusGenerator:
+    """
+    Generates synthetic ML projects to benchmark the static analyzer.
+
+    Smelly functions are taken from the examples of the code smell
+    injector and from the example project; clean functions are drawn
+    from a few library-free templates. Every generated file imports the
+    libraries used by the templates, so no file is skipped by the
+    library filters, and ends with a function calling all the others,
+    which gives the call graph some edges.
+    """
+
+    EXAMPLES_PATH = "input/projects/example/Code_Smell_Examples.py"
+
+    # Templates of clean functions
+    CLEAN_TEMPLATES = (
+        """
+        def sum_positive(values):
+            total = 0
+            for value in values:
+                if value > 0:
+                    total += value
+            return total
+        """,
+        """
+        def count_words(text, separator=","):
+            words = [word.strip() for word in text.split(separator)]
+            return {word: len(word) for word in words if word}
+        """,
+        """
+        def group_rows(rows, key):
+            groups = {}
+            for row in rows:
+                groups.setdefault(row[key], []).append(row)
+            return sorted(groups.items())
+        """,
+        """
+        def transpose(matrix):
+            result = []
+            for column in zip(*matrix):
+                result.append(list(column))
+            return result
+        """,
+    )
+
+    def __init__(
+        self,
+        files_per_project: int = 50,
+        functions_per_file: int = 10,
+        nesting_depth: int = 0,
+        smell_density: float = 0.3,
+        projects: int = 1,
+        seed: int = 0,
+    ):
+        """
+        Initializes the generator.
+
+        Parameters:
+        - files_per_project (int): Number of files of each project.
+        - functions_per_file (int): Number of functions of each file,
+          besides the function calling them.
+        - nesting_depth (int): Number of `for`/`if` blocks wrapped around
+          the body of every function.
+        - smell_density (float): Fraction of smelly functions (0 to 1).
+        - projects (int): Number of projects.
+        - seed (int): Seed of the random choices, for reproducible
+          corpora.
+        """
+        self.files_per_project = files_per_project
+        self.functions_per_file = functions_per_file
+        self.nesting_depth = nesting_depth
+        self.smell_density = smell_density
+        self.projects = projects
+        self.seed = seed
+        self.imports, self.smelly_functions = self._load_smelly_templates()
+        self.clean_functions = [
+            ast.parse(textwrap.dedent(template)).body[0]
+            for template in self.CLEAN_TEMPLATES
+        ]
+
+    def settings(self) -> dict:
+        """
+        Returns the parameters of the generated corpus.
+        """
+        return {
+            "files_per_project": self.files_per_project,
+            "functions_per_file": self.functions_per_file,
+            "nesting_depth": self.nesting_depth,
+            "smell_density": self.smell_density,
+            "projects": self.projects,
+            "seed": self.seed,
+        }
+
+    def generate(self, output_dir: str) -> list[str]:
+        """
+        Writes the corpus, one directory per project
+        (`project_<n>/package_<m>/module_<k>.py`).
+
+        Parameters:
+        - output_dir (str): Directory of the corpus.
+
+        Returns:
+        - list[str]: The paths of the project directories.
+        """
+        rng = random.Random(self.seed)
+        project_paths = []
+        for project in range(self.projects):
+            project_path = os.path.join(output_dir, f"project_{project}")
+            for index in range(self.files_per_project):
+                package_path = os.path.join(
+                    project_path, f"package_{index // 20}"
+                )
+                os.makedirs(package_path, exist_ok=True)
+                with open(
+                    os.path.join(package_path, f"module_{index}.py"),
+                    "w",
+                    encoding="utf-8",
+                ) as file:
+                    file.write(self.generate_module(rng))
+            project_paths.append(project_path)
+        return project_paths
+
+    def generate_module(self, rng: random.Random) -> str:
+        """
+        Generates the source code of a file.
+
+        Parameters:
+        - rng (random.Random): The source of the random choices.
+
+        Returns:
+        - str: The source code.
+        """
+        functions = []
+        for index in range(self.functions_per_file):
+            if rng.random() < self.smell_density:
+                template = rng.choice(self.smelly_functions)
+            else:
+                template = rng.choice(self.clean_functions)
+            function = copy.deepcopy(template)
+            function.name = f"{template.name}_{index}"
+            function.body = self._nest(function.body, rng)
+            functions.append(function)
+
+        calls = [f"    {function.name}()" for function in functions]
+        caller = ast.parse(
+            "\n".join(["def run_all():", *(calls or ["    pass"])])
+        ).body[0]
+
+        module = ast.Module(
+            body=[*self.imports, *functions, caller], type_ignores=[]
+        )
+        return ast.unparse(ast.fix_missing_locations(module)) + "\n"
+
+    def _nest(self, body: list[ast.stmt], rng: random.Random) -> list:
+        """
+        Wraps a function body in `nesting_depth` blocks, alternating
+        `for` loops and `if` statements.
+        """
+        for depth in range(self.nesting_depth):
+            if depth % 2 == 0:
+                header = f"for _item_{depth} in range(3):"
+            else:
+                header = f"if {rng.randint(0, 9)} > {depth}:"
+            statement = ast.parse(f"{header}\n    pass").body[0]
+            statement.body = body
+            body = [statement]
+        return body
+
+    def _load_smelly_templates(self):
+        """
+        Collects the smelly example functions, and the imports they use,
+        from the code smell injector and the example project.
+        """
+        sources = [
+            textwrap.dedent(smell["example"])
+            for smell in CodeSmellInjector(
+                llm_model=None
+            ).smell_descriptions.values()
+        ]
+        with open(self.EXAMPLES_PATH, encoding="utf-8") as file:
+            sources.append(file.read())
+
+        imports = {}
+        functions = []
+        for source in sources:
+            for node in ast.walk(ast.parse(source)):
+                if isinstance(node, (ast.Import, ast.ImportFrom)):
+                    imports.setdefault(ast.unparse(node), node)
+                elif isinstance(node, ast.FunctionDef):
+                    functions.append(node)
+        for function in functions:
+            # Imports inside the examples are hoisted to the module
+            function.body = [
+                statement
+                for statement in function.body
+                if not isinstance(statement, (ast.Import, ast.ImportFrom))
+            ] or [ast.Pass()]
+        return list(imports.values()), functions
@@ -1,6 +1,9 @@
 import argparse
+import os
 import sys
 from components.project_analyzer import ProjectAnalyzer
+from components.rule_checker import RuleChecker
+from components.shard_merger import ShardMerger
 
 
 class CodeSmileCLI:
@@ -16,7 +19,32 @@ class CodeSmileCLI:
         - args: Parsed CLI arguments.
         """
         self.args = args
-        self.analyzer = ProjectAnalyzer(args.output)
+        self.cache_dir = self._resolve_cache_dir()
+        self.analyzer = ProjectAnalyzer(
+            args.output,
+            cache_dir=self.cache_dir,
+            jobs=args.jobs,
+            prefilter=args.prefilter,
+            rules=args.rules,
+            skip_rules=args.skip_rules,
+            profile=args.profile,
+            slowest_files=args.slowest_files,
+            executor=args.executor,
+            gitignore=not args.no_gitignore,
+            resume=args.resume,
+            shard_index=args.shard_index,
+            shard_count=args.shard_count,
+        )
+
+    def _resolve_cache_dir(self):
+        """
+        Returns the directory of the result cache, or None if disabled.
+        By default the cache is kept in the output folder, next to (and
+        preserved across) the analysis results.
+        """
+        if self.args.no_cache:
+            return None
+        return self.args.cache_dir or os.path.join(self.args.output, "cache")
 
     def validate_args(self):
         """
@@ -30,6 +58,20 @@ class CodeSmileCLI:
         if self.args.parallel and self.args.max_walkers <= 0:
             raise ValueError("max_walkers must be greater than 0.")
 
+        if self.args.jobs <= 0:
+            raise ValueError("jobs must be greater than 0.")
+
+        if self.args.shard_count <= 0:
+            raise ValueError("shard-count must be greater than 0.")
+
+        if not 0 <= self.args.shard_index < self.args.shard_count:
+            raise ValueError(
+                "shard-index must be between 0 and shard-count - 1."
+            )
+
+        if self.args.partition_by_smell and self.args.format != "parquet":
+            raise ValueError("--partition-by-smell requires --format parquet.")
+
         if self.args.callgraph_output and not self.args.enable_callgraph:
             raise ValueError(
                 "--callgraph-output requires --enable-callgraph."
@@ -47,11 +89,21 @@ class CodeSmileCLI:
         print(f"Parallel execution: {self.args.parallel}")
         print(f"Resume execution: {self.args.resume}")
         print(f"Max Walkers: {self.args.max_walkers}")
+        print(f"Jobs: {self.args.jobs}")
+        print(f"Executor: {self.args.executor}")
         print(f"Analyze multiple projects: {self.args.multiple}")
         print(f"Enable call graph: {self.args.enable_callgraph}")
         print(f"Call graph output: {self.args.callgraph_output}")
         print(f"Exclude paths: {self.args.exclude_paths}")
+        print(f"Honor .gitignore: {not self.args.no_gitignore}")
         print(f"Report format: {self.args.format}")
+        print(f"Result cache: {self.cache_dir or 'disabled'}")
+        print(f"Prefilter: {self.args.prefilter}")
+        print(f"Rules: {self.args.rules or 'all'}")
+        print(f"Skipped rules: {self.args.skip_rules or 'none'}")
+        print(f"Rule profile: {self.args.profile or 'none'}")
+        print(f"Profile rules: {self.args.profile_rules}")
+        print(f"Shard: {self.args.shard_index} of {self.args.shard_count}")
 
         if not self.args.resume:
             self.analyzer.clean_output_directory()
@@ -61,6 +113,7 @@ class CodeSmileCLI:
             "callgraph_output": self.args.callgraph_output,
             "exclude_paths": self.args.exclude_paths,
             "report_format": self.args.format,
+            "resume": self.args.resume,
         }
 
         if self.args.multiple:
@@ -73,7 +126,6 @@ class CodeSmileCLI:
             else:
                 self.analyzer.analyze_projects_sequential(
                     self.args.input,
-                    resume=self.args.resume,
                     **analysis_kwargs,
                 )
         else:
@@ -85,12 +137,67 @@ class CodeSmileCLI:
             )
 
         if self.args.multiple:
-            self.analyzer.merge_all_results(report_format=self.args.format)
+            self.analyzer.merge_all_results(
+                report_format=self.args.format,
+                partition_by_smell=self.args.partition_by_smell,
+            )
+
+        self.analyzer.close()
+
+        self.analyzer.save_metrics()
+        if self.args.profile_rules:
+            print(self.analyzer.metrics.format_report())
 
         print("Analysis results saved successfully.")
 
 
+def merge(argv):
+    """
+    Combines the outputs of the shards of an analysis into one output.
+
+    Parameters:
+    - argv (list[str]): The arguments of the `merge` subcommand.
+    """
+    parser = argparse.ArgumentParser(
+        prog="cli_runner merge",
+        description="Code Smile: merge the outputs of the shards of "
+        "an analysis (see --shard-index and --shard-count).",
+    )
+    parser.add_argument(
+        "shards",
+        nargs="+",
+        help="Output folders of the shards, as given to their analyses",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="Path to the output folder of the merged results",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "json", "jsonl", "parquet"],
+        default="csv",
+        help="Format of the results of the shards (default: csv)",
+    )
+    parser.add_argument(
+        "--partition-by-smell",
+        action="store_true",
+        help="Partition a Parquet overview by smell, besides by project",
+    )
+    args = parser.parse_args(argv)
+
+    ShardMerger(args.shards, args.output).merge(
+        report_format=args.format,
+        partition_by_smell=args.partition_by_smell,
+    )
+
+
 def main():
+    if sys.argv[1:2] == ["merge"]:
+        merge(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Code Smile: AI-specific "
         "code smells detector for Python projects."
@@ -123,6 +230,21 @@ def main():
         help="Analyze multiple projects (default: False)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of workers analyzing the files of a project "
+        "(default: 1)",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=list(ProjectAnalyzer.EXECUTORS),
+        default="process",
+        help="Workers analyzing the files, with more than one job or "
+        "walker (default: process)",
+    )
+
     parser.add_argument(
         "--enable-callgraph",
         action="store_true",
@@ -138,13 +260,112 @@ def main():
         "--exclude-paths",
         nargs="*",
         default=[],
-        help="Paths to exclude from analysis",
+        help=(
+            "Paths or glob patterns (e.g. 'tests/**/fixtures', "
+            "'**/*_pb2.py') to exclude from analysis, relative to the "
+            "project"
+        ),
+    )
+    parser.add_argument(
+        "--no-gitignore",
+        action="store_true",
+        help="Analyze the files ignored by .gitignore (default: False)",
     )
     parser.add_argument(
         "--format",
-        choices=["csv", "json"],
+        choices=["csv", "json", "jsonl", "parquet"],
         default="csv",
-        help="Output format for smells report (default: csv)",
+        help=(
+            "Output format for smells report (default: csv). parquet "
+            "writes datasets partitioned by project (requires pyarrow)"
+        ),
+    )
+    parser.add_argument(
+        "--partition-by-smell",
+        action="store_true",
+        help=(
+            "With --format parquet, also partition the overview of "
+            "multiple projects by smell (default: False)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory of the result cache (default: <output>/cache)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Analyze every file, ignoring cached results (default: False)",
+    )
+    parser.add_argument(
+        "--prefilter",
+        action="store_true",
+        help=(
+            "Skip, without parsing them, files that never mention a "
+            "library the rules are about (default: False)"
+        ),
+    )
+    parser.add_argument(
+        "--rules",
+        nargs="+",
+        default=None,
+        metavar="RULE",
+        help=(
+            "Identifiers of the rules to apply, e.g. chain_indexing "
+            "(default: all the rules)"
+        ),
+    )
+    parser.add_argument(
+        "--skip-rules",
+        nargs="+",
+        default=None,
+        metavar="RULE",
+        help="Identifiers of the rules not to apply",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=list(RuleChecker.PROFILES),
+        default=None,
+        help=(
+            "Apply the rules about a library, in addition to --rules "
+            "(default: none)"
+        ),
+    )
+
+    parser.add_argument(
+        "--profile-rules",
+        action="store_true",
+        help=(
+            "Print the time spent by each rule and stage, and the slowest "
+            "files (default: False)"
+        ),
+    )
+    parser.add_argument(
+        "--slowest-files",
+        type=int,
+        default=10,
+        help="Number of slowest files in the run metrics (default: 10)",
+    )
+
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        default=0,
+        help="Shard analyzed by this run, from 0 to --shard-count - 1 "
+        "(default: 0)",
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        default=1,
+        help=(
+            "Number of shards the files (or the projects, with --multiple) "
+            "are partitioned into by a stable hash of their path, to run on "
+            "separate machines; merge their outputs with the 'merge' "
+            "subcommand (default: 1)"
+        ),
     )
 
     try:
@@ -154,6 +375,23 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    # Rule identifiers are checked once parsed, and only if given: listing
+    # the rules looks up the rule plugins of the installed packages
+    for option, rules in (
+        ("--rules", args.rules),
+        ("--skip-rules", args.skip_rules),
+    ):
+        unknown = [
+            rule
+            for rule in rules or []
+            if rule.lower() not in RuleChecker.RULES
+        ]
+        if unknown:
+            parser.error(
+                f"argument {option}: invalid choice: {', '.join(unknown)} "
+                f"(choose from {', '.join(RuleChecker.RULES)})"
+            )
+
     print("Starting Code Smile analysis...")
     manager = CodeSmileCLI(args)
     manager.execute()
@@ -1,5 +1,5 @@
 import ast
-import pandas as pd
+from typing import Iterable
 
 
 class DataFrameExtractor:
@@ -8,6 +8,9 @@ class DataFrameExtractor:
     from Python code represented as an Abstract Syntax Tree (AST).
     """
 
+    # DataFrame variables are only extracted from files importing these
+    required_libraries = ("pandas",)
+
     def __init__(self, df_dict_path: str = None):
         """
         Initializes the DataFrameExtractor.
@@ -34,11 +37,18 @@ class DataFrameExtractor:
         Returns:
         - None: Updates `self.df_methods` with a list of method names.
         """
+        # Analyses load the compiled `DictionaryIndex` instead, so Pandas
+        # is only imported by callers of this method
+        import pandas as pd
+
         df = pd.read_csv(path, dtype={"method": "string"})
         self.df_methods = df["method"].tolist()
 
     def extract_dataframe_variables(
-        self, fun_node: ast.AST, alias: str
+        self,
+        fun_node: ast.AST,
+        alias: str,
+        nodes: Iterable[ast.AST] | None = None,
     ) -> list[str]:
         """
         Identifies variables initialized as Pandas DataFrames in a function
@@ -47,6 +57,9 @@ class DataFrameExtractor:
         Parameters:
         - fun_node (ast.AST): The AST node representing a Python function.
         - alias (str): The alias used for Pandas (e.g., "pd").
+        - nodes (Iterable[ast.AST] | None): The nodes to inspect instead
+          of the whole subtree of `fun_node` (e.g., the nodes of its
+          scope, without those of nested functions).
 
         Returns:
         - list[str]: A list of variable names identified as DataFrames.
@@ -54,13 +67,13 @@ class DataFrameExtractor:
         dataframe_vars = []
 
         # Include function parameters
-        if isinstance(fun_node, ast.FunctionDef):
+        if isinstance(fun_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             for param in getattr(fun_node.args, "args", []):
                 if isinstance(param, ast.arg):
                     dataframe_vars.append(param.arg)
 
         # Include variables assigned as DataFrames
-        for node in ast.walk(fun_node):
+        for node in ast.walk(fun_node) if nodes is None else nodes:
             if isinstance(node, ast.Assign):
 
                 if isinstance(node.value, ast.Call):
@@ -0,0 +1,242 @@
+import csv
+import hashlib
+import marshal
+import os
+import tempfile
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+# Indexes already loaded by this process, by cache key. Worker processes
+# forked after the first load inherit them and do not load them again.
+_LOADED: dict[str, "DictionaryIndex"] = {}
+
+
+@dataclass(frozen=True)
+class DictionaryIndex:
+    """
+    Immutable, compiled index of the object dictionaries
+    (`obj_dictionaries/dataframes.csv`, `models.csv` and `tensors.csv`).
+
+    Methods are kept in frozensets, so membership tests are O(1), and
+    grouped by library. The index is compiled once from the CSV files and
+    saved to a binary cache keyed by their content, so later runs (and
+    every worker process) load it without parsing the CSV files again.
+
+    Attributes:
+    - dataframe_methods (frozenset[str]): Known Pandas DataFrame methods.
+    - tensor_operations (frozenset[str]): Known tensor operations taking
+      more than one tensor.
+    - model_methods (tuple[str, ...]): Known model methods, as listed in
+      the dictionary (e.g., `Sequential()`).
+    - model_names (frozenset[str]): Known model methods without the
+      parentheses (e.g., `Sequential`).
+    - models (Mapping[str, tuple]): The model dictionary, by column.
+    - methods_by_library (Mapping[str, frozenset[str]]): Maps every library
+      to its known model methods.
+    """
+
+    # Bumped when the layout of the cached index changes
+    VERSION = 1
+
+    dataframe_methods: frozenset[str]
+    tensor_operations: frozenset[str]
+    model_methods: tuple[str, ...]
+    model_names: frozenset[str]
+    models: Mapping[str, tuple]
+    methods_by_library: Mapping[str, frozenset[str]]
+
+    @classmethod
+    def load(
+        cls,
+        dataframes_path: str,
+        models_path: str,
+        tensors_path: str,
+        cache_dir: str | None = None,
+    ) -> "DictionaryIndex":
+        """
+        Loads the index of the dictionaries, from the binary cache when
+        the CSV files did not change since it was written.
+
+        Parameters:
+        - dataframes_path (str): Path to the DataFrame dictionary CSV.
+        - models_path (str): Path to the model dictionary CSV.
+        - tensors_path (str): Path to the tensor operations CSV.
+        - cache_dir (str | None): Directory of the binary cache. Defaults
+          to the user cache directory (`$XDG_CACHE_HOME/codesmile`, or
+          `~/.cache/codesmile`). The index is not cached if the directory
+          cannot be written.
+
+        Returns:
+        - DictionaryIndex: The index.
+
+        Raises:
+        - FileNotFoundError: If a dictionary cannot be found.
+        - ValueError: If a dictionary does not contain the expected
+          columns.
+        """
+        paths = (dataframes_path, models_path, tensors_path)
+        digest = hashlib.sha256(str(cls.VERSION).encode())
+        for path in paths:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Dictionary not found: {path}")
+            with open(path, "rb") as file:
+                digest.update(hashlib.sha256(file.read()).digest())
+        key = digest.hexdigest()
+
+        if key in _LOADED:
+            return _LOADED[key]
+
+        if cache_dir is None:
+            cache_dir = cls._user_cache_dir()
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = os.path.join(
+                cache_dir, f"dictionaries-{key[:16]}.bin"
+            )
+
+        payload = cls._read_cache(cache_path) if cache_path else None
+        if payload is None:
+            payload = cls._compile(*paths)
+            if cache_path:
+                cls._write_cache(cache_path, payload)
+
+        index = cls._from_payload(payload)
+        _LOADED[key] = index
+        return index
+
+    def has_model_method(self, model: str, libraries: list[str]) -> bool:
+        """
+        Checks if a model method belongs to any of the given libraries.
+
+        Parameters:
+        - model (str): The model method (e.g., `Sequential()`).
+        - libraries (list[str]): The library names.
+
+        Returns:
+        - bool: True if the method belongs to one of the libraries.
+        """
+        return any(
+            model in self.methods_by_library.get(library, ())
+            for library in libraries
+        )
+
+    @classmethod
+    def _compile(
+        cls, dataframes_path: str, models_path: str, tensors_path: str
+    ) -> dict:
+        """
+        Parses the CSV files into the plain data of the index (sets,
+        tuples and dictionaries), as saved in the binary cache.
+        """
+        dataframes = cls._read_csv(dataframes_path, ("method",))
+        models = cls._read_csv(models_path, ("library", "method"))
+        tensors = cls._read_csv(
+            tensors_path, ("method_name", "number_of_tensors_input")
+        )
+
+        methods_by_library = {}
+        for row in models:
+            methods_by_library.setdefault(row["library"], set()).add(
+                row["method"]
+            )
+
+        columns = list(models[0]) if models else ["library", "method"]
+        return {
+            "dataframe_methods": frozenset(
+                row["method"] for row in dataframes
+            ),
+            "tensor_operations": frozenset(
+                row["method_name"]
+                for row in tensors
+                if int(row["number_of_tensors_input"]) > 1
+            ),
+            "model_methods": tuple(row["method"] for row in models),
+            "models": {
+                column: tuple(row[column] for row in models)
+                for column in columns
+            },
+            "methods_by_library": {
+                library: frozenset(methods)
+                for library, methods in methods_by_library.items()
+            },
+        }
+
+    @classmethod
+    def _from_payload(cls, payload: dict) -> "DictionaryIndex":
+        return cls(
+            dataframe_methods=payload["dataframe_methods"],
+            tensor_operations=payload["tensor_operations"],
+            model_methods=payload["model_methods"],
+            model_names=frozenset(
+                method.replace("()", "")
+                for method in payload["model_methods"]
+            ),
+            models=MappingProxyType(payload["models"]),
+            methods_by_library=MappingProxyType(
+                payload["methods_by_library"]
+            ),
+        )
+
+    @staticmethod
+    def _read_csv(path: str, columns: tuple[str, ...]) -> list[dict]:
+        """
+        Reads the rows of a dictionary, checking its columns.
+        """
+        with open(path, newline="", encoding="utf-8") as file:
+            reader = csv.DictReader(file)
+            missing = [
+                column
+                for column in columns
+                if column not in (reader.fieldnames or [])
+            ]
+            if missing:
+                raise ValueError(
+                    f"Expected columns {missing} not found in {path}"
+                )
+            return [
+                row for row in reader if all(row[key] for key in columns)
+            ]
+
+    @staticmethod
+    def _user_cache_dir() -> str | None:
+        """
+        Returns the user cache directory of CodeSmile, or None if the user
+        has no home directory.
+        """
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        if not os.path.isabs(base):
+            return None
+        return os.path.join(base, "codesmile")
+
+    @staticmethod
+    def _read_cache(path: str) -> dict | None:
+        """
+        Returns the cached index, or None if missing or unreadable.
+        """
+        try:
+            with open(path, "rb") as file:
+                return marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _write_cache(path: str, payload: dict) -> None:
+        """
+        Saves the index atomically. The cache is an optimization only, so
+        failures (e.g., a read-only folder) are ignored.
+        """
+        temp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path), suffix=".tmp"
+            )
+            with os.fdopen(descriptor, "wb") as file:
+                marshal.dump(payload, file)
+            os.replace(temp_path, path)
+        except OSError:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
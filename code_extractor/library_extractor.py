@@ -7,6 +7,10 @@ class LibraryExtractor:
     from Python code represented as an Abstract Syntax Tree (AST).
     """
 
+    def __init__(self):
+        # The last aliases passed to `get_library_of_node`, reversed
+        self._reversed_aliases = (None, {})
+
     def extract_libraries(self, tree: ast.AST) -> list[dict[str, str]]:
         """
         Extracts all libraries imported in the given AST.
@@ -90,6 +94,61 @@ class LibraryExtractor:
             aliases[name] = alias
         return aliases
 
+    @staticmethod
+    def get_library_by_alias(libraries: dict[str, str]) -> dict[str, str]:
+        """
+        Reverses a mapping of library names to their aliases, so that the
+        library of an alias is found in constant time.
+
+        Parameters:
+        - libraries (dict[str, str]): The imported libraries, as returned
+          by `get_library_aliases`.
+
+        Returns:
+        - dict[str, str]: The aliases mapped to their libraries. When
+          several libraries share an alias, the first one wins.
+
+        Example:
+        ----------
+        Input:
+            {'pandas': 'pd', 'numpy.array': 'numpy.array'}
+
+        Output:
+            {'pd': 'pandas', 'numpy.array': 'numpy.array'}
+        """
+        library_by_alias = {}
+        for library, alias in libraries.items():
+            library_by_alias.setdefault(alias, library)
+        return library_by_alias
+
+    @staticmethod
+    def imports_any(libraries: dict[str, str], names: tuple[str, ...]) -> bool:
+        """
+        Checks whether any of the given libraries, or one of their
+        submodules, is imported.
+
+        Parameters:
+        - libraries (dict[str, str]): The imported libraries, as returned
+          by `get_library_aliases`.
+        - names (tuple[str, ...]): The names of the libraries to look for.
+
+        Returns:
+        - bool: True if any of the libraries is imported.
+
+        Example:
+        ----------
+        Input:
+            {'torch.nn': 'nn', 'os': 'os'}, ('torch',)
+
+        Output:
+            True
+        """
+        prefixes = tuple(f"{name}." for name in names)
+        return any(
+            library in names or library.startswith(prefixes)
+            for library in libraries
+        )
+
     def get_library_of_node(
         self, node: ast.AST, aliases: dict[str, str]
     ) -> str:
@@ -125,20 +184,19 @@ class LibraryExtractor:
           the base object (`pd`) to match it with a library.
         - Returns "Unknown" if the node does not clearly belong to any library.
         """
+        # The aliases of a file are reversed once, not at every call
+        reversed_for, library_by_alias = self._reversed_aliases
+        if reversed_for is not aliases:
+            library_by_alias = self.get_library_by_alias(aliases)
+            self._reversed_aliases = (aliases, library_by_alias)
+
         if isinstance(node, ast.Call):
             if isinstance(node.func, ast.Attribute):  # e.g., pd.read_csv
                 if isinstance(node.func.value, ast.Name):  # e.g., pd
                     base_object = node.func.value.id
-                    for library, alias in aliases.items():
-                        if alias == base_object:
-                            return library
+                    return library_by_alias.get(base_object, "Unknown")
             elif isinstance(
                 node.func, ast.Name
             ):  # Direct function calls without attributes
-                func_name = node.func.id
-                for library, alias in aliases.items():
-                    if (
-                        alias == func_name
-                    ):  # The function name matches a library alias
-                        return library
+                return library_by_alias.get(node.func.id, "Unknown")
         return "Unknown"
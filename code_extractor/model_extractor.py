@@ -1,5 +1,4 @@
 import os
-import pandas as pd
 
 
 class ModelExtractor:
@@ -32,6 +31,8 @@ class ModelExtractor:
         self.tensors_path = tensors_path
         self.model_dict = None
         self.tensor_operations_dict = None
+        # (library, method) pairs, with the model dictionary they index
+        self._model_pairs = (None, frozenset())
 
     def load_model_dict(self) -> dict[str, list]:
         """
@@ -52,6 +53,10 @@ class ModelExtractor:
                 f"Model file not found: {self.models_path}"
             )
 
+        # Analyses load the compiled `DictionaryIndex` instead, so Pandas
+        # is only imported by callers of this method
+        import pandas as pd
+
         df = pd.read_csv(self.models_path)
         if "method" not in df.columns or "library" not in df.columns:
             raise ValueError(
@@ -86,6 +91,8 @@ class ModelExtractor:
                 f"Tensor operations file not found: {self.tensors_path}"
             )
 
+        import pandas as pd
+
         df = pd.read_csv(self.tensors_path)
         if "number_of_tensors_input" not in df.columns:
             raise ValueError(
@@ -140,10 +147,11 @@ class ModelExtractor:
                 "Model dictionary not loaded. Call `load_model_dict` first."
             )
 
-        for lib, method in zip(
-            self.model_dict["library"], self.model_dict["method"]
-        ):
-            if lib in libraries and method == model:
-                return True
+        indexed_dict, pairs = self._model_pairs
+        if indexed_dict is not self.model_dict:
+            pairs = frozenset(
+                zip(self.model_dict["library"], self.model_dict["method"])
+            )
+            self._model_pairs = (self.model_dict, pairs)
 
-        return False
+        return any((lib, model) in pairs for lib in libraries)
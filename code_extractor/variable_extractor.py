@@ -1,4 +1,5 @@
 import ast
+from typing import Iterable
 
 
 class VariableExtractor:
@@ -8,7 +9,7 @@ class VariableExtractor:
     """
 
     def extract_variable_definitions(
-        self, fun_node: ast.AST
+        self, fun_node: ast.AST, nodes: Iterable[ast.AST] | None = None
     ) -> dict[str, ast.Assign]:
         """
         Extracts variable definitions and their
@@ -16,6 +17,9 @@ class VariableExtractor:
 
         Parameters:
         - fun_node (ast.AST): The AST node representing a Python function.
+        - nodes (Iterable[ast.AST] | None): The nodes to inspect instead
+          of the whole subtree of `fun_node` (e.g., the nodes of its
+          scope, without those of nested functions).
 
         Returns:
         - dict[str, ast.Assign]: A dictionary where keys
@@ -23,7 +27,7 @@ class VariableExtractor:
           AST nodes for their definitions.
         """
         definitions = {}
-        for node in ast.walk(fun_node):
+        for node in ast.walk(fun_node) if nodes is None else nodes:
             if isinstance(node, ast.Assign):  # Look for assignment statements
                 for target in node.targets:  # Variables being assigned to
                     if isinstance(
@@ -0,0 +1,369 @@
+import os
+import time
+from typing import TYPE_CHECKING, Callable, Iterable
+from components.result_cache import ResultCache
+from components.result_sink import ResultSink
+from components.run_metrics import RunMetrics
+from utils.file_utils import FileUtils
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+class InlineExecutor:
+    """
+    Runs every task as soon as it is submitted, in the current thread,
+    with the interface of the `concurrent.futures` executors.
+    """
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> "Future":
+        # Imported on demand: the CLI starts without the executors
+        from concurrent.futures import Future
+
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        pass
+
+
+class PipelineProject:
+    """
+    A project flowing through an `AnalysisPipeline`.
+
+    Attributes:
+    - name (str): The name of the project.
+    - path (str): The path of the project.
+    - filenames (list[str]): The Python files of the project.
+    - sink (ResultSink): The sink receiving the smells of the project.
+    - smells (int): The number of smells written to the sink.
+    - callgraph_fragments (list[dict]): The call graph fragments of the
+      files, in file order (if the call graph is enabled).
+    - error (Exception | None): The error that failed the project.
+    - resumed_files (int): The number of files completed by a previous
+      run, and not analyzed again.
+    - positions (dict[str, int] | None): The position of each file among
+      all the files of the project, journaled with it, if `filenames` are
+      only part of them (e.g., a shard, see `ShardMerger`).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        filenames: list[str],
+        sink: ResultSink,
+        positions: dict[str, int] | None = None,
+    ):
+        self.name = name
+        self.path = path
+        self.filenames = filenames
+        self.sink = sink
+        self.positions = positions
+        self.smells = 0
+        self.callgraph_fragments = []
+        self.error = None
+        self.resumed_files = 0
+        # Outcomes of completed files waiting for the preceding files
+        self._completed = {}
+        self._next = 0
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether all the files of the project went through the sink.
+        """
+        return self._next == len(self.filenames)
+
+
+class AnalysisPipeline:
+    """
+    Analyzes the Python files of one or more projects in stages:
+
+    - discover: lists the Python files of a project (`discover`);
+    - inspect: reads, parses and checks each file (see
+      `Inspector.collect`) on an executor: inline, threads or processes.
+      Reading, parsing and detection run in the same task, so that
+      neither sources nor trees are sent across processes;
+    - sink: streams the smells of each project to its `ResultSink` in
+      file order, whatever the order files complete in, and completes
+      the project once its last file is written.
+
+    At most `window` files are submitted and not yet written at any time,
+    so a slow sink holds back the executor instead of letting results
+    pile up (backpressure).
+
+    Every written file is recorded in the journal of its sink, with the
+    hash of its content returned by the inspection, which already read
+    the file (see `ResultSink.record_file`). When resuming, the files a
+    previous run completed, and that did not change since, are not
+    analyzed again: their smells are kept in the sink, and any output
+    written after them is truncated.
+    """
+
+    # Errors failing a single file; other errors fail its project
+    FILE_ERRORS = (SyntaxError, FileNotFoundError)
+
+    def __init__(
+        self,
+        submit: Callable[[str], "Future"],
+        result: Callable[["Future"], object] | None = None,
+        window: int = 1,
+        include_callgraph: bool = False,
+        include_hash: bool = False,
+        largest_first: bool = False,
+        checkpoint_interval: int = 100,
+        metrics: RunMetrics | None = None,
+        on_file_error: Callable[[str, Exception], None] | None = None,
+        on_project: Callable[[PipelineProject], None] | None = None,
+        resume: bool = False,
+    ):
+        """
+        Initializes the pipeline.
+
+        Parameters:
+        - submit (Callable[[str], Future]): Submits the inspection of a
+          file to the executor.
+        - result (Callable[[Future], object] | None): Returns the
+          inspection result of a completed future (or raises its error).
+          Defaults to the result of the future itself.
+        - window (int): Maximum number of files in flight.
+        - include_callgraph (bool): Whether the inspection results include
+          call graph fragments.
+        - include_hash (bool): Whether the inspection results end with
+          the hash of the content of the file (see `Inspector.collect`).
+          Without hashes, resuming analyzes every file again.
+        - largest_first (bool): Whether to submit the largest files first,
+          so that a huge file does not end the run alone.
+        - checkpoint_interval (int): Number of files of a project between
+          two checkpoints of its sink.
+        - metrics (RunMetrics | None): Metrics timing the sink stage.
+        - on_file_error (Callable | None): Called with the name and the
+          error of each file that cannot be analyzed.
+        - on_project (Callable | None): Called with each project once it
+          is complete, or failed (see `PipelineProject.error`). Failed
+          projects are not written any further, and their sinks are left
+          open for the callback to close or discard.
+        - resume (bool): Whether to resume the projects from the journals
+          of their sinks.
+        """
+        self.submit = submit
+        self.result = result or self.result
+        self.window = max(1, window)
+        self.include_callgraph = include_callgraph
+        self.include_hash = include_hash
+        self.largest_first = largest_first
+        self.checkpoint_interval = checkpoint_interval
+        self.metrics = metrics
+        self.on_file_error = on_file_error
+        self.on_project = on_project
+        self.resume = resume
+
+    @staticmethod
+    def result(future: "Future"):
+        """
+        Returns the inspection result of a completed future.
+        """
+        return future.result()
+
+    @staticmethod
+    def discover(
+        project_path: str,
+        exclude_paths=None,
+        gitignore: bool = True,
+        workers: int = 1,
+    ) -> list[str]:
+        """
+        Lists the Python files of a project (see `FileDiscovery`).
+
+        Parameters:
+        - project_path (str): The path of the project.
+        - exclude_paths (list[str] | None): Paths or glob patterns to
+          exclude, absolute or relative to the project.
+        - gitignore (bool): Whether to honor the `.gitignore` files.
+        - workers (int): Number of threads listing directories.
+
+        Returns:
+        - list[str]: The Python files, in a stable order.
+        """
+        return FileUtils.get_python_files(
+            project_path, exclude_paths, gitignore=gitignore, workers=workers
+        )
+
+    def run(self, projects: Iterable[PipelineProject]) -> None:
+        """
+        Analyzes the files of the projects, completing every project.
+        """
+        projects = list(projects)
+        if self.resume:
+            for project in projects:
+                self._resume(project)
+
+        tasks = [
+            (project, index)
+            for project in projects
+            for index in range(project._next, len(project.filenames))
+        ]
+        if self.largest_first:
+            tasks.sort(
+                key=lambda task: self._file_size(
+                    task[0].filenames[task[1]]
+                ),
+                reverse=True,
+            )
+
+        # Projects without files left are complete already
+        for project in projects:
+            if project.done:
+                self._complete(project)
+
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        tasks = iter(tasks)
+        in_flight = {}
+        while True:
+            # Keep the window full, skipping the files of failed projects
+            while len(in_flight) < self.window:
+                task = next(tasks, None)
+                if task is None:
+                    break
+                project, index = task
+                if project.error is None:
+                    future = self.submit(project.filenames[index])
+                    in_flight[future] = task
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            # Completed files are handed to the sink in submission order
+            for future in [f for f in in_flight if f in finished]:
+                project, index = in_flight.pop(future)
+                try:
+                    outcome = self.result(future)
+                except Exception as e:
+                    outcome = e
+                self._deliver(project, index, outcome)
+
+    def _deliver(
+        self, project: PipelineProject, index: int, outcome
+    ) -> None:
+        """
+        Sink stage: writes the completed files of a project that follow
+        the last written one.
+        """
+        if project.error is not None:
+            return
+        project._completed[index] = outcome
+        try:
+            while project._next in project._completed:
+                outcome = project._completed.pop(project._next)
+                self._write(project, project.filenames[project._next], outcome)
+                project._next += 1
+                if project._next % self.checkpoint_interval == 0:
+                    project.sink.checkpoint()
+        except Exception as e:
+            project.error = e
+            project._completed.clear()
+            self._complete(project)
+            return
+
+        if project.done:
+            self._complete(project)
+
+    def _resume(self, project: PipelineProject) -> None:
+        """
+        Skips the files of a project completed by a previous run,
+        restoring their smell counts and call graph fragments.
+        """
+
+        def is_current(index: int, record: dict) -> bool:
+            return (
+                index < len(project.filenames)
+                and record.get("file") == project.filenames[index]
+                and (not self.include_callgraph or "callgraph" in record)
+                and record.get("hash") is not None
+                and record["hash"] == self._content_hash(record["file"])
+            )
+
+        records = project.sink.resume(is_current)
+        project._next = project.resumed_files = len(records)
+        for record in records:
+            project.smells += record["rows"]
+            if record.get("callgraph") is not None:
+                project.callgraph_fragments.append(record["callgraph"])
+
+    def _write(self, project: PipelineProject, filename: str, outcome):
+        """
+        Writes the inspection result of a file to the sink of its project,
+        and records the file in the journal of the sink.
+        """
+        record = {"file": filename, "hash": None}
+        if project.positions is not None:
+            record["position"] = project.positions[filename]
+        if self.include_callgraph:
+            record["callgraph"] = None
+
+        if isinstance(outcome, self.FILE_ERRORS):
+            if self.on_file_error is not None:
+                self.on_file_error(filename, outcome)
+            # The inspection returned no hash: the few files that fail
+            # are hashed here, so that resuming does not stop at them
+            if self.include_hash:
+                record["hash"] = self._content_hash(filename)
+            project.sink.record_file({**record, "rows": 0})
+            return
+        if isinstance(outcome, Exception):
+            raise outcome
+
+        if isinstance(outcome, tuple):
+            smells, *extras = outcome
+        else:
+            smells, extras = outcome, []
+        if self.include_callgraph and extras:
+            callgraph_fragment = extras.pop(0)
+            project.callgraph_fragments.append(callgraph_fragment)
+            record["callgraph"] = callgraph_fragment
+        if self.include_hash and extras:
+            record["hash"] = extras[0]
+
+        smell_count = len(smells)
+        project.smells += smell_count
+        if smell_count > 0:
+            print(f"Found {smell_count} code smells in file: {filename}")
+
+        started = time.perf_counter()
+        project.sink.write_collector(smells)
+        project.sink.record_file({**record, "rows": smell_count})
+        if self.metrics is not None:
+            self.metrics.add_stage("write", time.perf_counter() - started)
+
+    def _complete(self, project: PipelineProject) -> None:
+        if self.on_project is not None:
+            self.on_project(project)
+
+    @staticmethod
+    def _content_hash(filename: str) -> str | None:
+        """
+        Returns the hash of the content of a file, as computed by the
+        inspection (see `ResultCache.content_hash`), or None if it cannot
+        be read.
+        """
+        try:
+            with open(filename, "r", encoding="utf-8") as file:
+                return ResultCache.content_hash(file.read())
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @staticmethod
+    def _file_size(filename: str) -> int:
+        """
+        Returns the size of a file in bytes, or 0 if it cannot be read.
+        """
+        try:
+            return os.path.getsize(filename)
+        except OSError:
+            return 0
@@ -0,0 +1,128 @@
+import ast
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping
+from code_extractor.library_extractor import LibraryExtractor
+
+
+@dataclass(frozen=True)
+class FileContext:
+    """
+    Immutable analysis context of a single file.
+
+    The context is built once per file and shared by reference with every
+    function analyzed in that file, so that file-level data (e.g., the line
+    table or the library aliases) is never recomputed per function.
+
+    Attributes:
+    - filename (str): The name of the analyzed file.
+    - lines (Mapping[int, str]): Maps line numbers to the corresponding
+      source code.
+    - libraries (Mapping[str, str]): Maps library names to their aliases.
+    - library_by_alias (Mapping[str, str]): Maps the names bound by the
+      imports back to the canonical names of the imported modules or
+      symbols: aliases (the first import wins, as in a linear lookup) and
+      names imported from a module (`from x import y` binds `y` to
+      `x.y`).
+    - dataframe_methods (frozenset[str]): Known Pandas DataFrame methods.
+    - tensor_operations (frozenset[str]): Known tensor operations.
+    - models (Mapping[str, list]): The model dictionary, by column.
+    - model_methods (tuple[str, ...]): Known model methods.
+    """
+
+    filename: str
+    lines: Mapping[int, str]
+    libraries: Mapping[str, str]
+    library_by_alias: Mapping[str, str]
+    dataframe_methods: frozenset[str]
+    tensor_operations: frozenset[str]
+    models: Mapping[str, list]
+    model_methods: tuple[str, ...]
+
+    @classmethod
+    def build(
+        cls,
+        filename: str,
+        source: str,
+        tree: ast.AST,
+        libraries: dict[str, str],
+        dataframe_methods: Iterable[str],
+        tensor_operations: Iterable[str],
+        models: dict[str, list],
+        model_methods: list[str],
+    ) -> "FileContext":
+        """
+        Builds the context of a parsed file.
+
+        Parameters:
+        - filename (str): The name of the analyzed file.
+        - source (str): The source code of the file.
+        - tree (ast.AST): The AST of the file.
+        - libraries (dict[str, str]): Library names mapped to their aliases.
+        - dataframe_methods (Iterable[str]): Known Pandas DataFrame methods
+          (frozensets, e.g. from the `DictionaryIndex`, are not copied).
+        - tensor_operations (Iterable[str]): Known tensor operations.
+        - models (dict[str, list]): The model dictionary, by column.
+        - model_methods (list[str]): Known model methods.
+
+        Returns:
+        - FileContext: The context of the file.
+        """
+        source_lines = source.splitlines()
+        lines = {}
+        imports_from = []
+        for node in ast.walk(tree):
+            if hasattr(node, "lineno"):
+                lines[node.lineno] = source_lines[node.lineno - 1]
+                if isinstance(node, ast.ImportFrom) and node.module:
+                    imports_from.append(node)
+
+        libraries = dict(libraries)
+        library_by_alias = LibraryExtractor.get_library_by_alias(libraries)
+        # Symbols imported without alias are bound to their own name
+        for node in imports_from:
+            for name in node.names:
+                if name.asname is None and name.name != "*":
+                    library_by_alias.setdefault(
+                        name.name, f"{node.module}.{name.name}"
+                    )
+
+        return cls(
+            filename=filename,
+            lines=MappingProxyType(lines),
+            libraries=MappingProxyType(libraries),
+            library_by_alias=MappingProxyType(library_by_alias),
+            dataframe_methods=frozenset(dataframe_methods),
+            tensor_operations=frozenset(tensor_operations),
+            models=MappingProxyType(dict(models)),
+            model_methods=tuple(model_methods),
+        )
+
+    def function_data(
+        self, variables: dict[str, ast.AST], dataframe_variables: list[str]
+    ) -> dict[str, any]:
+        """
+        Returns the data extracted for a function of the file, in the
+        format expected by the detection rules (see `Smell.detect`).
+
+        The file-level entries reference the context, they are not copied.
+
+        Parameters:
+        - variables (dict[str, ast.AST]): The variables of the function.
+        - dataframe_variables (list[str]): The DataFrame variables of
+          the function.
+
+        Returns:
+        - dict[str, any]: The extracted data of the function.
+        """
+        return {
+            "libraries": self.libraries,
+            "library_by_alias": self.library_by_alias,
+            "variables": variables,
+            "lines": self.lines,
+            "dataframe_methods": self.dataframe_methods,
+            "dataframe_variables": dataframe_variables,
+            "tensor_operations": self.tensor_operations,
+            "models": self.models,
+            "model_methods": self.model_methods,
+        }
@@ -1,13 +1,60 @@
 import os
+import re
+import sys
 import ast
-import pandas as pd
+import importlib.util
+import math
+import time
+from typing import TYPE_CHECKING, Iterable
 from code_extractor.library_extractor import LibraryExtractor
 from code_extractor.model_extractor import ModelExtractor
 from code_extractor.dataframe_extractor import DataFrameExtractor
+from code_extractor.dictionary_index import DictionaryIndex
 from code_extractor.variable_extractor import VariableExtractor
 from components.rule_checker import RuleChecker
+from components.file_context import FileContext
+from components.smell_collector import SmellCollector
+from components.result_cache import ResultCache
+from components.run_metrics import RunMetrics
+from detection_rules.rule_dispatcher import RuleDispatcher, ScopePartition
 from call_graph.call_graph_extractor import CallGraphExtractor
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Inspector of a batch worker process (see `Inspector.inspect_many`)
+_batch_inspector = None
+
+
+def _init_batch_worker(output_path: str, options: dict) -> None:
+    """
+    Initializes a batch worker process with its own Inspector, whose
+    result cache is closed when the process exits.
+    """
+    from multiprocessing.util import Finalize
+
+    global _batch_inspector
+    _batch_inspector = Inspector(output_path, **options)
+    if _batch_inspector.cache is not None:
+        cache = _batch_inspector.cache
+        Finalize(_batch_inspector, cache.close, exitpriority=0)
+
+
+def _inspect_batch_in_worker(items: list, include_callgraph: bool):
+    """
+    Inspects a chunk of items in a batch worker process.
+
+    Returns the results of the chunk, the number of items skipped by the
+    prefilter and the timings collected by the worker for the chunk.
+    """
+    inspector = _batch_inspector
+    prefiltered = inspector.prefiltered_files
+    results = inspector._inspect_batch(items, include_callgraph)
+    metrics = inspector.metrics
+    inspector.metrics = RunMetrics(metrics.slowest_files)
+    return results, inspector.prefiltered_files - prefiltered, metrics
+
 
 class Inspector:
     """
@@ -21,6 +68,12 @@ class Inspector:
         dataframe_dict_path: str = "obj_dictionaries/dataframes.csv",
         model_dict_path: str = "obj_dictionaries/models.csv",
         tensor_dict_path: str = "obj_dictionaries/tensors.csv",
+        cache_dir: str | None = None,
+        prefilter: bool = False,
+        rules: list[str] | None = None,
+        skip_rules: list[str] | None = None,
+        profile: str | None = None,
+        metrics: RunMetrics | None = None,
     ):
         """
         Initializes the Inspector with the output path for
@@ -31,9 +84,52 @@ class Inspector:
         - dataframe_dict_path (str): Path to the DataFrame dictionary CSV.
         - model_dict_path (str): Path to the model dictionary CSV.
         - tensor_dict_path (str): Path to the tensor operations CSV.
+        - cache_dir (str | None): Directory of the persistent result cache.
+          Results of unchanged files are reused across runs; if None,
+          every file is analyzed.
+        - prefilter (bool): Whether to skip, without parsing them, files
+          whose source never mentions a library the rules are about.
+          Skipped files are counted in `prefiltered_files`.
+        - rules (list[str] | None): Identifiers of the rules to apply.
+        - skip_rules (list[str] | None): Identifiers of the rules
+          not to apply.
+        - profile (str | None): Applies the rules about a library
+          (see `RuleChecker` for the rule selection).
+        - metrics (RunMetrics | None): Collects the time spent by each
+          file in every stage and rule. A new collector is used if None.
         """
         self.output_path = output_path
-        self._setup(dataframe_dict_path, model_dict_path, tensor_dict_path)
+        self.metrics = metrics if metrics is not None else RunMetrics()
+        # The options of the Inspectors of the batch workers
+        self._options = {
+            "dataframe_dict_path": dataframe_dict_path,
+            "model_dict_path": model_dict_path,
+            "tensor_dict_path": tensor_dict_path,
+            "cache_dir": cache_dir,
+            "prefilter": prefilter,
+            "rules": rules,
+            "skip_rules": skip_rules,
+            "profile": profile,
+        }
+        self._setup(
+            dataframe_dict_path,
+            model_dict_path,
+            tensor_dict_path,
+            rules=rules,
+            skip_rules=skip_rules,
+            profile=profile,
+            cache_dir=cache_dir,
+        )
+        self._dictionary_paths = [
+            dataframe_dict_path,
+            model_dict_path,
+            tensor_dict_path,
+        ]
+        self.cache = ResultCache(cache_dir) if cache_dir else None
+        self._fingerprint = None
+        self.prefilter = prefilter
+        self.prefiltered_files = 0
+        self._prefilter_pattern = None
 
     def inspect(self, filename: str, include_callgraph: bool = False):
         """
@@ -48,94 +144,341 @@ class Inspector:
         - pd.DataFrame: A DataFrame containing detected code smells.
         - dict (optional): A call graph fragment for the analyzed file.
         """
-        col = [
-            "filename",
-            "function_name",
-            "smell_name",
-            "line",
-            "description",
-            "additional_info",
-        ]
-        to_save = pd.DataFrame(columns=col)
-        file_path = os.path.abspath(filename)
+        return self._timed_inspect(filename, None, None, include_callgraph)
+
+    def close(self) -> None:
+        """
+        Closes the result cache, if any. The Inspector analyzes files
+        without a cache afterwards.
+        """
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def collect(
+        self,
+        filename: str,
+        include_callgraph: bool = False,
+        include_hash: bool = False,
+    ):
+        """
+        Inspects a file like `inspect`, returning the smells as collected,
+        without converting them to a DataFrame (so Pandas is not needed
+        by callers streaming them to a `ResultSink`).
+
+        Parameters:
+        - filename (str): The name of the file to analyze.
+        - include_callgraph (bool): Whether to return a call graph fragment.
+        - include_hash (bool): Whether to return the hash of the content
+          of the file, computed from the source read for the analysis.
+
+        Returns:
+        - SmellCollector: The detected code smells.
+        - dict (optional): A call graph fragment for the analyzed file.
+        - str (optional): The hash of the content of the file (see
+          `ResultCache.content_hash`).
+        """
+        file_info = {} if include_hash else None
+        smells, callgraph_fragment = self._collect(
+            filename, None, None, include_callgraph, file_info
+        )
+        result = (smells,)
+        if include_callgraph:
+            result += (callgraph_fragment,)
+        if include_hash:
+            result += (file_info["content_hash"],)
+        return result if len(result) > 1 else smells
+
+    def inspect_source(
+        self,
+        source: str | bytes,
+        filename: str,
+        include_callgraph: bool = False,
+    ):
+        """
+        Inspects source code held in memory, without any disk I/O.
+
+        Parameters:
+        - source (str | bytes): The source code. Bytes are decoded as
+          Python does for source files (encoding declaration or UTF-8).
+        - filename (str): The name reported for the source (e.g., the
+          path of the file it was read from, or `<snippet>`).
+        - include_callgraph (bool): Whether to return a call graph fragment.
+
+        Returns:
+        - pd.DataFrame: A DataFrame containing detected code smells.
+        - dict (optional): A call graph fragment for the analyzed source.
+        """
+        if isinstance(source, bytes):
+            source = importlib.util.decode_source(source)
+        return self._timed_inspect(filename, source, None, include_callgraph)
+
+    def inspect_tree(
+        self,
+        tree: ast.AST,
+        source: str,
+        filename: str,
+        include_callgraph: bool = False,
+    ):
+        """
+        Inspects source code already parsed by the caller.
+
+        Parameters:
+        - tree (ast.AST): The AST of the source.
+        - source (str): The source code (the report quotes its lines).
+        - filename (str): The name reported for the source.
+        - include_callgraph (bool): Whether to return a call graph fragment.
+
+        Returns:
+        - pd.DataFrame: A DataFrame containing detected code smells.
+        - dict (optional): A call graph fragment for the analyzed source.
+        """
+        return self._timed_inspect(filename, source, tree, include_callgraph)
+
+    def inspect_many(
+        self,
+        items: Iterable[str | tuple[str, str | bytes]],
+        jobs: int = 1,
+        include_callgraph: bool = False,
+    ) -> tuple["pd.DataFrame", dict[str, dict], dict[str, Exception]]:
+        """
+        Inspects many files or sources with a single call.
+
+        The smells of all the items are collected in a single table, built
+        once at the end, and the errors are collected instead of raised.
+        With more than one job, the items are split into chunks analyzed
+        by worker processes, each with its own Inspector set up once.
+
+        Parameters:
+        - items (Iterable[str | tuple[str, str | bytes]]): The paths of the
+          files to analyze, or `(filename, source)` pairs of sources held
+          in memory (see `inspect_source`).
+        - jobs (int): Number of worker processes. With 1, the items are
+          analyzed in the current process.
+        - include_callgraph (bool): Whether to extract the call graph
+          fragments.
+
+        Returns:
+        - pd.DataFrame: The smells of all the items, in the order of the
+          items.
+        - dict[str, dict]: The call graph fragments, by file name (empty
+          if `include_callgraph` is False).
+        - dict[str, Exception]: The errors, by file name, of the items
+          that could not be analyzed.
+        """
+        items = list(items)
+        if jobs <= 1 or len(items) <= 1:
+            batches = [self._inspect_batch(items, include_callgraph)]
+        else:
+            # A few chunks per worker balance the load without paying the
+            # inter-process round trip for every item
+            size = max(1, math.ceil(len(items) / (jobs * 4)))
+            chunks = [
+                items[start:start + size]
+                for start in range(0, len(items), size)
+            ]
+            # Imported on demand: sequential runs never start a process
+            from concurrent.futures import ProcessPoolExecutor
+
+            batches = []
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_batch_worker,
+                initargs=(self.output_path, self._options),
+            ) as pool:
+                for results, prefiltered, metrics in pool.map(
+                    _inspect_batch_in_worker,
+                    chunks,
+                    [include_callgraph] * len(chunks),
+                ):
+                    batches.append(results)
+                    self.prefiltered_files += prefiltered
+                    self.metrics.merge(metrics)
+
+        smells = SmellCollector()
+        fragments = {}
+        errors = {}
+        for batch_smells, batch_fragments, batch_errors in batches:
+            smells.extend(batch_smells)
+            fragments.update(batch_fragments)
+            errors.update(batch_errors)
+        return smells.to_dataframe(), fragments, errors
+
+    def _inspect_batch(
+        self, items: list, include_callgraph: bool
+    ) -> tuple[SmellCollector, dict[str, dict], dict[str, Exception]]:
+        """
+        Inspects a list of items (see `inspect_many`) in this process.
+        """
+        smells = SmellCollector()
+        fragments = {}
+        errors = {}
+        for item in items:
+            if isinstance(item, tuple):
+                filename, source = item
+                if isinstance(source, bytes):
+                    source = importlib.util.decode_source(source)
+            else:
+                filename, source = os.fspath(item), None
+            try:
+                item_smells, fragment = self._collect(
+                    filename, source, None, include_callgraph
+                )
+            except Exception as e:
+                errors[filename] = e
+                continue
+            smells.extend(item_smells)
+            if include_callgraph:
+                fragments[filename] = fragment
+        return smells, fragments, errors
+
+    def _timed_inspect(
+        self,
+        filename: str,
+        source: str | None,
+        tree: ast.AST | None,
+        include_callgraph: bool,
+    ):
+        """
+        Inspects a file, a source or a tree, recording the time spent in
+        every stage, even on errors.
+        """
+        to_save, callgraph_fragment = self._collect(
+            filename, source, tree, include_callgraph
+        )
+
+        # The collected smells are converted to a DataFrame only once
+        smells_df = to_save.to_dataframe()
+
+        if include_callgraph:
+            return smells_df, callgraph_fragment
+
+        return smells_df
+
+    def _collect(
+        self,
+        filename: str,
+        source: str | None,
+        tree: ast.AST | None,
+        include_callgraph: bool,
+        file_info: dict | None = None,
+    ) -> tuple[SmellCollector, dict | None]:
+        """
+        Inspects a file, a source or a tree (see `_inspect`), recording
+        the time spent in every stage, even on errors.
+
+        Returns:
+        - SmellCollector: The detected smells.
+        - dict | None: The call graph fragment, if requested.
+        """
+        stages = {}
+        rule_timings = {}
+        try:
+            return self._inspect(
+                filename,
+                source,
+                tree,
+                include_callgraph,
+                stages,
+                rule_timings,
+                file_info,
+            )
+        finally:
+            self.metrics.add_file(filename, stages, rule_timings)
+
+    def _inspect(
+        self,
+        filename: str,
+        source: str | None,
+        tree: ast.AST | None,
+        include_callgraph: bool,
+        stages: dict[str, float],
+        rule_timings: dict[str, float],
+        file_info: dict | None = None,
+    ):
+        """
+        Inspects a file (see `inspect`), adding the seconds spent in each
+        stage to `stages` and by each rule to `rule_timings`. The file is
+        only read if no source is given, and only parsed if no tree is
+        given. If `file_info` is given, the hash of the content of the
+        file read is set as its "content_hash".
+
+        Returns:
+        - SmellCollector: The detected smells.
+        - dict | None: The call graph fragment, if requested.
+        """
+        to_save = SmellCollector()
 
         callgraph_fragment = None
+        content_hash = None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                source = file.read()
+            clock = time.perf_counter()
+            if source is None:
+                file_path = os.path.abspath(filename)
+                with open(file_path, "r", encoding="utf-8") as file:
+                    source = file.read()
+                if file_info is not None:
+                    content_hash = ResultCache.content_hash(source)
+                    file_info["content_hash"] = content_hash
+                clock = self._lap(stages, "read", clock)
+
+            # Files that cannot import any library the rules are about
+            # are not even parsed (the call graph needs every file)
+            if (
+                self.prefilter
+                and not include_callgraph
+                and not self._may_apply(source)
+            ):
+                self.prefiltered_files += 1
+                return to_save, None
+
+            # Reuse the results of an unchanged file
+            if self.cache is not None:
+                cache_key = (
+                    filename,
+                    content_hash or ResultCache.content_hash(source),
+                    self._analysis_fingerprint(),
+                )
+                cached = self.cache.get(
+                    *cache_key, include_callgraph=include_callgraph
+                )
+                clock = self._lap(stages, "cache", clock)
+                if cached is not None:
+                    rows, callgraph_fragment = cached
+                    for row in rows:
+                        to_save.add(*row)
+                    return to_save, callgraph_fragment
 
             # Parse the file into an AST
-            tree = ast.parse(source)
-            lines = source.splitlines()
+            if tree is None:
+                try:
+                    tree = ast.parse(source)
+                finally:
+                    clock = self._lap(stages, "parse", clock)
 
             if include_callgraph:
                 callgraph_fragment = self.callgraph_extractor.extract(tree, filename)
+                clock = self._lap(stages, "callgraph", clock)
 
             # Step 1: Extract Libraries
             libraries = self.library_extractor.get_library_aliases(
                 self.library_extractor.extract_libraries(tree)
             )
+            self._lap(stages, "extraction", clock)
 
-            # Step 2: Analyze Functions and Extract Variables
-            variables_by_function = {}
-            dataframe_variables_by_function = {}
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    function_name = node.name
-                    variables_by_function[function_name] = (
-                        self.variable_extractor.extract_variable_definitions(
-                            node
-                        )
-                    )
-                    dataframe_variables_by_function[function_name] = (
-                        self.dataframe_extractor.extract_dataframe_variables(
-                            node, alias=libraries.get("pandas", None)
-                        )
-                    )
-
-            # Step 3: Load Dictionaries (preloaded during setup)
-            models = self.model_extractor.model_dict
-            tensor_operations = self.model_extractor.tensor_operations_dict
-            dataframe_methods = self.dataframe_extractor.df_methods
-
-            # Step 4: Rule Check on Each Function
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    try:
-                        function_data = {
-                            "libraries": libraries,
-                            "variables": variables_by_function[node.name],
-                            "lines": {
-                                n.lineno: lines[n.lineno - 1]
-                                for n in ast.walk(tree)
-                                if hasattr(n, "lineno")
-                            },
-                            "dataframe_methods": dataframe_methods,
-                            "dataframe_variables": (
-                                dataframe_variables_by_function[node.name]
-                            ),
-                            "tensor_operations": tensor_operations.get(
-                                "operation", []
-                            ),
-                            "models": {
-                                model: models[model] for model in models.keys()
-                            },
-                            "model_methods": (
-                                self.model_extractor.load_model_methods()
-                            ),
-                        }
-
-                        # Pass data to the Rule Checker
-                        to_save = self.rule_checker.rule_check(
-                            node, function_data, filename, node.name, to_save
-                        )
-                    except Exception as e:
-                        print(
-                            f"Error processing function '{node.name}' in file "
-                            f"'{filename}': {e}"
-                        )
-                        raise e
+            # Files importing none of the libraries the rules are about
+            # cost a single parse: no rule would apply to them
+            if self.rule_checker.applies_to(libraries):
+                to_save = self._check_rules(
+                    filename,
+                    source,
+                    tree,
+                    libraries,
+                    to_save,
+                    stages=stages,
+                    rule_timings=rule_timings,
+                )
 
         except FileNotFoundError as e:
             print(f"Error: File '{filename}' not found. {e}")
@@ -147,16 +490,206 @@ class Inspector:
             print(f"Unexpected error while analyzing file '{filename}': {e}")
             raise e
 
-        if include_callgraph:
-            return to_save, callgraph_fragment
+        if self.cache is not None:
+            clock = time.perf_counter()
+            self.cache.put(
+                *cache_key,
+                smells=to_save.to_records(),
+                callgraph=callgraph_fragment,
+            )
+            self._lap(stages, "cache", clock)
+
+        return to_save, callgraph_fragment
+
+    def _may_apply(self, source: str) -> bool:
+        """
+        Lexical prefilter: checks whether a rule may apply to a source,
+        i.e. whether it mentions, as a whole word, any library the rules
+        require. Every import of a library spells its name, so a source
+        failing the check cannot import any of them.
+        """
+        if self._prefilter_pattern is None:
+            libraries = self.rule_checker.required_libraries()
+            if libraries is None:
+                # Some rule applies to any file: nothing can be skipped
+                self._prefilter_pattern = re.compile("")
+            else:
+                self._prefilter_pattern = re.compile(
+                    r"\b(?:"
+                    + "|".join(map(re.escape, sorted(libraries)))
+                    + r")\b"
+                )
+        return self._prefilter_pattern.search(source) is not None
 
-        return to_save
+    def _check_rules(
+        self,
+        filename: str,
+        source: str,
+        tree: ast.AST,
+        libraries: dict[str, str],
+        collector: SmellCollector,
+        stages: dict[str, float] | None = None,
+        rule_timings: dict[str, float] | None = None,
+    ) -> SmellCollector:
+        """
+        Extracts the data used by the rules and applies them to each
+        function of a parsed file.
+
+        Parameters:
+        - filename (str): The name of the analyzed file.
+        - source (str): The source code of the file.
+        - tree (ast.AST): The AST of the file.
+        - libraries (dict[str, str]): The libraries imported by the file.
+        - collector (SmellCollector): The collector storing detected smells.
+        - stages (dict[str, float] | None): Seconds spent by stage, to
+          which the extraction and detection times are added.
+        - rule_timings (dict[str, float] | None): Seconds spent by rule.
+
+        Returns:
+        - SmellCollector: The updated collector.
+        """
+        if stages is None:
+            stages = {}
+        clock = time.perf_counter()
+
+        # Step 2: Partition the file into scopes (functions and module)
+        # and Extract Variables of each scope from its own nodes
+        extract_dataframes = (
+            self._extract_dataframes
+            and LibraryExtractor.imports_any(
+                libraries, self.dataframe_extractor.required_libraries
+            )
+        )
+        partition = ScopePartition(tree)
+        scopes = []
+        for scope in partition.scopes:
+            variables = (
+                self.variable_extractor.extract_variable_definitions(
+                    scope.node, nodes=scope.nodes
+                )
+                if self._extract_variables
+                else {}
+            )
+            dataframe_variables = (
+                self.dataframe_extractor.extract_dataframe_variables(
+                    scope.node,
+                    alias=libraries.get("pandas", None),
+                    nodes=scope.nodes,
+                )
+                if extract_dataframes
+                else []
+            )
+            scopes.append((scope, variables, dataframe_variables))
+
+        # Step 3: Build the file context, shared by all the functions
+        # (dictionaries are preloaded during setup)
+        file_context = FileContext.build(
+            filename=filename,
+            source=source,
+            tree=tree,
+            libraries=libraries,
+            dataframe_methods=self.dataframe_extractor.df_methods,
+            tensor_operations=(
+                self.dictionaries.tensor_operations
+                if self._extract_models
+                else ()
+            ),
+            models=self.dictionaries.models if self._extract_models else {},
+            model_methods=(
+                self.dictionaries.model_methods if self._extract_models else ()
+            ),
+        )
+        clock = self._lap(stages, "extraction", clock)
+
+        # Step 4: Rule Check on Each Scope, over its own nodes only
+        for scope, variables, dataframe_variables in scopes:
+            try:
+                function_data = file_context.function_data(
+                    variables=variables,
+                    dataframe_variables=dataframe_variables,
+                )
+
+                # Pass data to the Rule Checker
+                collector = self.rule_checker.rule_check(
+                    scope.node,
+                    function_data,
+                    filename,
+                    scope.name,
+                    collector,
+                    timings=rule_timings,
+                    traversal=partition.traversal(scope),
+                )
+            except Exception as e:
+                print(
+                    f"Error processing function '{scope.qualname}' in file "
+                    f"'{filename}': {e}"
+                )
+                raise e
+        self._lap(stages, "detection", clock)
+
+        return collector
+
+    @staticmethod
+    def _lap(stages: dict[str, float], stage: str, since: float) -> float:
+        """
+        Adds the seconds elapsed since `since` to a stage.
+
+        Returns:
+        - float: The current time, the start of the next stage.
+        """
+        now = time.perf_counter()
+        stages[stage] = stages.get(stage, 0.0) + now - since
+        return now
+
+    def _analysis_fingerprint(self) -> str:
+        """
+        Returns the fingerprint of the analysis performed by the Inspector:
+        the source of the rules and extractors in use and the content of
+        the object dictionaries. Computed once per Inspector.
+        """
+        if self._fingerprint is None:
+            components = [
+                self,
+                self.rule_checker,
+                self.variable_extractor,
+                self.library_extractor,
+                self.model_extractor,
+                self.dataframe_extractor,
+                self.callgraph_extractor,
+                *self.rule_checker.smells,
+            ]
+            classes = [type(component) for component in components] + [
+                DictionaryIndex,
+                FileContext,
+                SmellCollector,
+                RuleDispatcher,
+            ]
+            code_files = []
+            for cls in classes:
+                for base in cls.__mro__:
+                    module = sys.modules.get(base.__module__)
+                    if getattr(module, "__file__", None):
+                        code_files.append(module.__file__)
+            # The selected rules are part of the analysis too
+            self._fingerprint = ResultCache.fingerprint(
+                code_files,
+                self._dictionary_paths,
+                settings=[
+                    type(smell).__qualname__
+                    for smell in self.rule_checker.smells
+                ],
+            )
+        return self._fingerprint
 
     def _setup(
         self,
         dataframe_dict_path: str,
         model_dict_path: str,
         tensor_dict_path: str,
+        rules: list[str] | None = None,
+        skip_rules: list[str] | None = None,
+        profile: str | None = None,
+        cache_dir: str | None = None,
     ) -> None:
         """
         Sets up the necessary components for the Inspector.
@@ -165,9 +698,30 @@ class Inspector:
         - dataframe_dict_path (str): Path to the DataFrame dictionary CSV.
         - model_dict_path (str): Path to the model dictionary CSV.
         - tensor_dict_path (str): Path to the tensor operations CSV.
+        - rules, skip_rules, profile: The selection of rules.
+        - cache_dir (str | None): Directory of the result cache, where the
+          compiled dictionaries are cached too (see `DictionaryIndex`).
         """
-        # Initialize the RuleChecker with smells and extractors
-        self.rule_checker = RuleChecker(self.output_path)
+        # Initialize the RuleChecker with the selected smells
+        self.rule_checker = RuleChecker(
+            self.output_path,
+            rules=rules,
+            skip_rules=skip_rules,
+            profile=profile,
+        )
+
+        # Extractors only run when a selected rule reads their output
+        self._extract_variables = self.rule_checker.requires_data(
+            "variables"
+        )
+        self._extract_dataframes = any(
+            self.rule_checker.requires_data(key)
+            for key in ("dataframe_variables", "dataframe_methods")
+        )
+        self._extract_models = any(
+            self.rule_checker.requires_data(key)
+            for key in ("models", "model_methods", "tensor_operations")
+        )
 
         self.variable_extractor = VariableExtractor()
         self.library_extractor = LibraryExtractor()
@@ -175,13 +729,20 @@ class Inspector:
             models_path=model_dict_path,
             tensors_path=tensor_dict_path,
         )
-        self.dataframe_extractor = DataFrameExtractor(
-            df_dict_path=dataframe_dict_path,
-        )
+        self.dataframe_extractor = DataFrameExtractor()
 
         self.callgraph_extractor = CallGraphExtractor()
 
-        # Preload dictionaries to avoid runtime errors
-        self.model_extractor.load_model_dict()
-        self.model_extractor.load_tensor_operations_dict()
-        self.dataframe_extractor.load_dataframe_dict(dataframe_dict_path)
+        # Load the compiled dictionaries of the extractors in use
+        self.dictionaries = None
+        if self._extract_models or self._extract_dataframes:
+            self.dictionaries = DictionaryIndex.load(
+                dataframe_dict_path,
+                model_dict_path,
+                tensor_dict_path,
+                cache_dir=cache_dir,
+            )
+        if self._extract_dataframes:
+            self.dataframe_extractor.df_methods = (
+                self.dictionaries.dataframe_methods
+            )
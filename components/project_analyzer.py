@@ -1,32 +1,182 @@
 import os
 import time
 import threading
-import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from components.analysis_pipeline import (
+    AnalysisPipeline,
+    InlineExecutor,
+    PipelineProject,
+)
 from components.inspector import Inspector
+from components.result_sink import ResultSink
+from components.run_metrics import RunMetrics
 from utils.file_utils import FileUtils
 from call_graph.call_graph_builder import CallGraphBuilder
 
 
+# Inspector of a file worker (process or thread), kept warm across files
+# and projects
+_worker = threading.local()
+
+
+def _init_file_worker(output_path: str, inspector_options: dict) -> None:
+    """
+    Initializes a file worker with its own Inspector, whose result cache
+    is closed when the worker exits.
+    """
+    from multiprocessing.util import Finalize
+
+    inspector = Inspector(output_path, **inspector_options)
+    if inspector.cache is not None:
+        Finalize(inspector, inspector.cache.close, exitpriority=0)
+    _worker.inspector = inspector
+
+
+def _inspect_in_worker(filename: str, include_callgraph: bool):
+    """
+    Inspects a file in a file worker.
+
+    Returns the inspection result, the number of files skipped by the
+    prefilter (0 or 1) and the timings collected by the worker since its
+    last file, which are counted by the analyzer.
+    """
+    inspector = _worker.inspector
+    prefiltered = inspector.prefiltered_files
+    inspected = inspector.collect(
+        filename, include_callgraph=include_callgraph, include_hash=True
+    )
+    metrics = inspector.metrics
+    inspector.metrics = RunMetrics(metrics.slowest_files)
+    return (
+        inspected,
+        inspector.prefiltered_files - prefiltered,
+        metrics,
+    )
+
+
 class ProjectAnalyzer:
     """
     Handles the analysis of Python projects
     and manages all file-related operations.
+
+    Single projects, and multiple projects analyzed sequentially or in
+    parallel, all go through the same `AnalysisPipeline`: they only
+    differ in the executor analyzing the files and in the order files
+    are scheduled.
     """
 
-    def __init__(self, output_path: str):
+    # Number of analyzed files between two checkpoints of the results
+    CHECKPOINT_INTERVAL = 100
+
+    # Executors analyzing the files with more than one worker
+    EXECUTORS = ("process", "thread")
+
+    # Files in flight per worker, bounding the results held in memory
+    FILES_PER_WORKER = 4
+
+    def __init__(
+        self,
+        output_path: str,
+        cache_dir: str | None = None,
+        jobs: int = 1,
+        prefilter: bool = False,
+        rules: list[str] | None = None,
+        skip_rules: list[str] | None = None,
+        profile: str | None = None,
+        slowest_files: int = 10,
+        executor: str = "process",
+        gitignore: bool = True,
+        resume: bool = False,
+        shard_index: int = 0,
+        shard_count: int = 1,
+    ):
         """
         Initializes the ProjectAnalyzer.
 
         Parameters:
         - output_path (str): Directory where analysis results will be saved.
+        - cache_dir (str | None): Directory of the persistent result cache
+          (disabled if None).
+        - jobs (int): Number of workers analyzing the files of a project.
+          With 1, files are analyzed in the current thread.
+        - prefilter (bool): Whether to skip, without parsing them, files
+          that cannot import any library the rules are about.
+        - rules (list[str] | None): Identifiers of the rules to apply.
+        - skip_rules (list[str] | None): Identifiers of the rules
+          not to apply.
+        - profile (str | None): Applies the rules about a library
+          (see `RuleChecker` for the rule selection).
+        - slowest_files (int): Number of slowest files reported in the
+          run metrics.
+        - executor (str): The workers analyzing the files when there is
+          more than one (see `EXECUTORS`): processes, or threads (e.g.,
+          where processes cannot be started).
+        - gitignore (bool): Whether to skip the files ignored by the
+          `.gitignore` files of the projects.
+        - resume (bool): Whether the analyses resume a previous run,
+          whose output is kept instead of cleaned.
+        - shard_index (int): The shard analyzed by this run, from 0 to
+          `shard_count - 1`.
+        - shard_count (int): The number of shards the files of a project
+          (or the projects, when analyzing multiple projects) are
+          partitioned into, by a stable hash of their path (see
+          `FileUtils.shard_of`). Each shard can run on another machine.
+
+        Raises:
+        - ValueError: If the executor or the shard is invalid.
         """
+        if executor not in self.EXECUTORS:
+            raise ValueError(
+                f"Unknown executor: {executor}. "
+                f"Available executors: {', '.join(self.EXECUTORS)}"
+            )
+        if not 0 <= shard_index < shard_count:
+            raise ValueError(
+                f"Invalid shard {shard_index} of {shard_count}: the index "
+                "must be between 0 and the number of shards minus 1."
+            )
         self.base_output_path = output_path
         self.output_path = os.path.join(output_path, "output")
+        self.cache_dir = cache_dir
+        self.jobs = jobs
+        self.prefilter = prefilter
+        self.executor = executor
+        self.gitignore = gitignore
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self._file_pool = None
+        self._file_pool_size = 0
+        self._worker_prefiltered_files = 0
+
+        # Timings of the files analyzed in this and the worker processes
+        self.metrics = RunMetrics(slowest_files)
+
+        # Options of the Inspectors of this and the worker processes
+        self._inspector_options = {
+            "cache_dir": cache_dir,
+            "prefilter": prefilter,
+            "rules": rules,
+            "skip_rules": skip_rules,
+            "profile": profile,
+        }
+
+        if resume:
+            os.makedirs(self.output_path, exist_ok=True)
+        else:
+            FileUtils.clean_directory(self.base_output_path, "output")
 
-        FileUtils.clean_directory(self.base_output_path, "output")
+        self.inspector = Inspector(
+            self.output_path, metrics=self.metrics, **self._inspector_options
+        )
 
-        self.inspector = Inspector(self.output_path)
+    @property
+    def prefiltered_files(self) -> int:
+        """
+        The number of files skipped by the prefilter, in any process.
+        """
+        if not self.prefilter:
+            return 0
+        return self.inspector.prefiltered_files + self._worker_prefiltered_files
 
     def clean_output_directory(self):
         """
@@ -34,53 +184,138 @@ class ProjectAnalyzer:
         """
         FileUtils.clean_directory(self.base_output_path, "output")
 
-    def _save_results(self, df: pd.DataFrame, filename: str, report_format: str = "csv"):
+    def close(self):
         """
-        Saves the DataFrame to a file in the output root folder.
+        Shuts down the file workers, if any, and closes the result cache.
         """
-        if df.empty:
-            print(f"No results to save for {filename}")
-            return
+        self._shutdown_file_pool()
+        self.inspector.close()
 
-        os.makedirs(self.output_path, exist_ok=True)
+    def _shutdown_file_pool(self):
+        """
+        Shuts down the file workers, if any.
+        """
+        if self._file_pool is not None:
+            self._file_pool.shutdown()
+            self._file_pool = None
+
+    def _get_file_pool(self, workers: int):
+        """
+        Returns the pool of file workers, starting it if needed.
+        Workers are started once and reused across projects.
+        """
+        if self._file_pool is not None and self._file_pool_size != workers:
+            self._shutdown_file_pool()
+        if self._file_pool is None:
+            # Imported on demand: sequential runs never start a worker
+            if self.executor == "thread":
+                from concurrent.futures import ThreadPoolExecutor as Pool
+            else:
+                from concurrent.futures import ProcessPoolExecutor as Pool
+
+            self._file_pool = Pool(
+                max_workers=workers,
+                initializer=_init_file_worker,
+                initargs=(self.output_path, self._inspector_options),
+            )
+            self._file_pool_size = workers
+        return self._file_pool
 
-        base, _ = os.path.splitext(filename)
-        if report_format == "json":
-            file_path = os.path.join(self.output_path, f"{base}.json")
-            df.to_json(file_path, orient="records", indent=2)
+    def _pipeline(
+        self,
+        workers: int,
+        enable_callgraph: bool,
+        largest_first: bool = False,
+        on_project=None,
+        resume: bool = False,
+    ) -> AnalysisPipeline:
+        """
+        Configures the pipeline analyzing files with the given number of
+        workers (with 1, in the current thread).
+        """
+        if workers <= 1:
+            submit = partial(
+                InlineExecutor().submit,
+                self.inspector.collect,
+                include_callgraph=enable_callgraph,
+                include_hash=True,
+            )
+            result = AnalysisPipeline.result
+            window = 1
         else:
-            file_path = os.path.join(self.output_path, f"{base}.csv")
-            df.to_csv(file_path, index=False)
+            submit = partial(
+                self._get_file_pool(workers).submit,
+                _inspect_in_worker,
+                include_callgraph=enable_callgraph,
+            )
+            result = self._worker_result
+            window = workers * self.FILES_PER_WORKER
+        return AnalysisPipeline(
+            submit,
+            result=result,
+            window=window,
+            include_callgraph=enable_callgraph,
+            include_hash=True,
+            largest_first=largest_first,
+            checkpoint_interval=self.CHECKPOINT_INTERVAL,
+            metrics=self.metrics,
+            on_file_error=self._log_file_error,
+            on_project=on_project,
+            resume=resume,
+        )
 
-        print(f"Results saved to {file_path}")
+    def _worker_result(self, future):
+        """
+        Returns the inspection result of a file worker (or raises its
+        error), counting the files the worker skipped and its timings.
+        """
+        inspected, prefiltered, metrics = future.result()
+        self._worker_prefiltered_files += prefiltered
+        self.metrics.merge(metrics)
+        return inspected
 
-    def _normalize_exclude_paths(self, exclude_paths, base_path: str):
-        if not exclude_paths:
-            return []
+    def _log_file_error(self, filename: str, error: Exception) -> None:
+        """
+        Appends the error of a file that cannot be analyzed to `error.txt`.
+        """
+        error_file = os.path.join(self.output_path, "error.txt")
+        os.makedirs(self.output_path, exist_ok=True)
+        with open(error_file, "a") as f:
+            f.write(f"Error in file {filename}: {str(error)}\n")
+        print(f"Error analyzing file: {filename} - {str(error)}")
 
-        normalized = []
-        for p in exclude_paths:
-            if not p:
-                continue
-            abs_p = os.path.abspath(os.path.join(base_path, p)) if not os.path.isabs(p) else os.path.abspath(p)
-            normalized.append(os.path.normpath(abs_p))
-        return normalized
+    def save_metrics(self) -> str:
+        """
+        Saves the timings of the run to `run_metrics.json`, next to the
+        overview of the results.
 
-    def _filter_excluded_files(self, filenames, exclude_paths, base_path: str):
-        if not filenames:
-            return []
+        Returns:
+        - str: The path of the saved metrics.
+        """
+        path = self.metrics.save(self.output_path)
+        print(f"Run metrics saved to {path}")
+        return path
 
-        excluded = self._normalize_exclude_paths(exclude_paths, base_path)
-        if not excluded:
-            return filenames
+    def _report_resumed(self, project: PipelineProject) -> None:
+        """
+        Prints the number of files of a project completed by a previous
+        run, if any.
+        """
+        if project.resumed_files:
+            print(
+                f"Resumed project '{project.name}': "
+                f"{project.resumed_files} files completed by a previous run."
+            )
 
-        kept = []
-        for f in filenames:
-            abs_f = os.path.normpath(os.path.abspath(f))
-            if any(abs_f.startswith(ex + os.sep) or abs_f == ex for ex in excluded):
-                continue
-            kept.append(f)
-        return kept
+    def _report_prefiltered(self, prefiltered_before: int) -> None:
+        """
+        Prints the number of files skipped by the prefilter in a run.
+        """
+        if self.prefilter:
+            print(
+                "Files skipped by the prefilter: "
+                f"{self.prefiltered_files - prefiltered_before}"
+            )
 
     def _resolve_callgraph_output_path(
         self,
@@ -120,6 +355,29 @@ class ProjectAnalyzer:
             ext = ".json"
         return f"{base}_{project_name}{ext}"
 
+    def _save_callgraph(
+        self,
+        project: PipelineProject,
+        callgraph_output: str | None,
+        multiple: bool,
+    ) -> None:
+        """
+        Builds and saves the call graph of an analyzed project.
+        """
+        builder = CallGraphBuilder()
+        callgraph = builder.build(
+            project.callgraph_fragments, project_root=project.path
+        )
+
+        cg_path = self._resolve_callgraph_output_path(
+            project_path=project.path,
+            project_name=project.name,
+            callgraph_output=callgraph_output,
+            multiple=multiple,
+        )
+        builder.save(callgraph, cg_path)
+        print(f"Call graph saved to {cg_path}")
+
     def analyze_project(
         self,
         project_path: str,
@@ -127,12 +385,15 @@ class ProjectAnalyzer:
         callgraph_output: str | None = None,
         exclude_paths=None,
         report_format: str = "csv",
+        resume: bool = False,
     ) -> int:
         """
         Analyzes a single project for code smells.
 
         Parameters:
         - project_path (str): Path to the project to be analyzed.
+        - resume (bool): Whether to skip the files completed, and not
+          changed since, by a previous run.
 
         Returns:
         - int: Total number of code smells found in the project.
@@ -140,75 +401,80 @@ class ProjectAnalyzer:
         project_name = os.path.basename(os.path.normpath(project_path))
 
         print(f"Starting analysis for project: {project_name}")
+        prefiltered_before = self.prefiltered_files
 
-        filenames = FileUtils.get_python_files(project_path)
-        filenames = self._filter_excluded_files(filenames, exclude_paths, project_path)
+        filenames = AnalysisPipeline.discover(
+            project_path,
+            exclude_paths,
+            gitignore=self.gitignore,
+            workers=self.jobs,
+        )
 
         if not filenames:
             raise ValueError(f"The project '{project_path}' contains no Python files.")
 
-        col = [
-            "filename",
-            "function_name",
-            "smell_name",
-            "line",
-            "description",
-            "additional_info",
-        ]
-        to_save = pd.DataFrame(columns=col)
-        total_smells = 0
-
-        callgraph_fragments = []
+        positions = None
+        if self.shard_count > 1:
+            # Merged shards are put back in the order of all the files
+            positions = {
+                filename: position
+                for position, filename in enumerate(filenames)
+            }
+            filenames = [
+                filename
+                for filename in filenames
+                if self._in_shard(os.path.relpath(filename, project_path))
+            ]
+            print(
+                f"Shard {self.shard_index} of {self.shard_count}: "
+                f"{len(filenames)} files"
+            )
 
-        for filename in filenames:
-            try:
-                inspected = self.inspector.inspect(filename, include_callgraph=enable_callgraph)
-
-                if enable_callgraph:
-                    if isinstance(inspected, tuple) and len(inspected) == 2:
-                        result, callgraph_fragment = inspected
-                        callgraph_fragments.append(callgraph_fragment)
-                    else:
-                        result = inspected
-                else:
-                    result = inspected[0] if isinstance(inspected, tuple) else inspected
-
-                smell_count = len(result)
-                total_smells += smell_count
-                if smell_count > 0:
-                    print(
-                        f"Found {smell_count} code smells in file: {filename}"
-                    )
-                to_save = pd.concat([to_save, result], ignore_index=True)
-            except (SyntaxError, FileNotFoundError) as e:
-                error_file = os.path.join(self.output_path, "error.txt")
-                os.makedirs(self.output_path, exist_ok=True)
-                with open(error_file, "a") as f:
-                    f.write(f"Error in file {filename}: {str(e)}\n")
-                print(f"Error analyzing file: {filename} - {str(e)}")
-                continue
+        # Findings are streamed to the overview as each file completes
+        project = PipelineProject(
+            project_name,
+            project_path,
+            filenames,
+            ResultSink.open(
+                os.path.join(self.output_path, "overview"), report_format
+            ),
+            positions=positions,
+        )
+        try:
+            self._pipeline(self.jobs, enable_callgraph, resume=resume).run(
+                [project]
+            )
+        finally:
+            # Even if the analysis fails, the results found so far are kept,
+            # with the journal to resume from. The journal of a shard is
+            # kept for the merge (see `ShardMerger`)
+            project.sink.close(
+                keep_journal=not project.done
+                or project.error is not None
+                or self.shard_count > 1
+            )
+        if project.error is not None:
+            raise project.error
+        self._report_resumed(project)
 
-        self._save_results(to_save, "overview.csv", report_format=report_format)
+        if len(project.sink) > 0:
+            print(f"Results saved to {project.sink.path}")
+        else:
+            print(
+                "No results to save for "
+                f"{os.path.basename(project.sink.path)}"
+            )
 
         if enable_callgraph:
-            builder = CallGraphBuilder()
-            callgraph = builder.build(callgraph_fragments, project_root=project_path)
-
-            cg_path = self._resolve_callgraph_output_path(
-                project_path=project_path,
-                project_name=project_name,
-                callgraph_output=callgraph_output,
-                multiple=False,
-            )
-            builder.save(callgraph, cg_path)
-            print(f"Call graph saved to {cg_path}")
+            self._save_callgraph(project, callgraph_output, multiple=False)
 
         print(f"Finished analysis for project: {project_name}")
+        self._report_prefiltered(prefiltered_before)
         print(
             f"Total code smells found in project "
-            f"'{project_name}': {total_smells}\n"
+            f"'{project_name}': {project.smells}\n"
         )
-        return total_smells
+        return project.smells
 
     def analyze_projects_sequential(
         self,
@@ -220,135 +486,36 @@ class ProjectAnalyzer:
         report_format: str = "csv",
     ):
         """
-        Sequentially analyzes multiple projects.
+        Sequentially analyzes multiple projects: one project at a time,
+        its files in order (by `jobs` workers).
 
         Parameters:
         - base_path (str): Directory containing projects to be analyzed.
-        - resume (bool): Whether to resume from the last analyzed project.
+        - resume (bool): Whether to skip the projects, and the files,
+          completed by a previous run.
         """
-        execution_log_path = os.path.join(base_path, "execution_log.txt")
         if not os.path.exists(base_path):
             os.makedirs(base_path)
 
-        if not resume:
-            FileUtils.initialize_log(execution_log_path)
-
-        last_project = (
-            FileUtils.get_last_logged_project(execution_log_path)
-            if resume
-            else ""
-        )
-
         start_time = time.time()
-        total_smells = 0
-
-        for dirname in os.listdir(base_path):
-            if dirname in {"output", "execution_log.txt"}:
-                continue
-
-            if resume and dirname <= last_project:
-                continue
-
-            project_path = os.path.join(base_path, dirname)
-
-            if not os.path.isdir(project_path):
-                continue
-
-            print(f"Analyzing project '{dirname}' sequentially...")
-            try:
-                filenames = FileUtils.get_python_files(project_path)
-                filenames = self._filter_excluded_files(filenames, exclude_paths, project_path)
-
-                col = [
-                    "filename",
-                    "function_name",
-                    "smell_name",
-                    "line",
-                    "description",
-                    "additional_info",
-                ]
-                to_save = pd.DataFrame(columns=col)
-                project_smells = 0
-                callgraph_fragments = []
-
-                for filename in filenames:
-                    try:
-                        inspected = self.inspector.inspect(filename, include_callgraph=enable_callgraph)
-
-                        if enable_callgraph:
-                            if isinstance(inspected, tuple) and len(inspected) == 2:
-                                result, callgraph_fragment = inspected
-                                callgraph_fragments.append(callgraph_fragment)
-                            else:
-                                result = inspected
-                        else:
-                            result = inspected[0] if isinstance(inspected, tuple) else inspected
-
-                        smell_count = len(result)
-                        project_smells += smell_count
-                        if smell_count > 0:
-                            print(
-                                f"Found {smell_count} code "
-                                f"smells in file: {filename}"
-                            )
-                        to_save = pd.concat(
-                            [to_save, result], ignore_index=True
-                        )
-                    except (SyntaxError, FileNotFoundError) as e:
-                        error_file = os.path.join(
-                            self.output_path, "error.txt"
-                        )
-                        os.makedirs(self.output_path, exist_ok=True)
-                        with open(error_file, "a") as f:
-                            f.write(f"Error in file {filename}: {str(e)}\n")
-                        print(f"Error analyzing file: {filename} - {str(e)}")
-                        continue
-
-                details_path = os.path.join(
-                    self.output_path, "project_details"
-                )
-                os.makedirs(details_path, exist_ok=True)
-
-                if not to_save.empty:
-                    base_name = f"{dirname}_results.csv"
-                    base, _ = os.path.splitext(base_name)
-                    if report_format == "json":
-                        detailed_file_path = os.path.join(details_path, f"{base}.json")
-                        to_save.to_json(detailed_file_path, orient="records", indent=2)
-                    else:
-                        detailed_file_path = os.path.join(details_path, f"{base}.csv")
-                        to_save.to_csv(detailed_file_path, index=False)
-
-                    print(f"Detailed results saved to {detailed_file_path}")
-
-                if enable_callgraph:
-                    builder = CallGraphBuilder()
-                    callgraph = builder.build(callgraph_fragments, project_root=project_path)
-
-                    cg_path = self._resolve_callgraph_output_path(
-                        project_path=project_path,
-                        project_name=dirname,
-                        callgraph_output=callgraph_output,
-                        multiple=True,
-                    )
-                    builder.save(callgraph, cg_path)
-                    print(f"Call graph saved to {cg_path}")
-
-                total_smells += project_smells
-                print(
-                    f"Project '{dirname}' analyzed successfully."
-                    f"Code smells found: {project_smells}\n"
-                )
-
-                FileUtils.append_to_log(execution_log_path, dirname)
-
-            except Exception as e:
-                print(f"Error analyzing project '{dirname}': {str(e)}\n")
+        prefiltered_before = self.prefiltered_files
+
+        total_smells = self._analyze_projects(
+            base_path,
+            workers=self.jobs,
+            mode="sequentially",
+            resume=resume,
+            enable_callgraph=enable_callgraph,
+            callgraph_output=callgraph_output,
+            exclude_paths=exclude_paths,
+            report_format=report_format,
+        )
 
         print(
             "Sequential execution completed in "
             f"{time.time() - start_time:.2f} seconds."
         )
+        self._report_prefiltered(prefiltered_before)
         print(f"Total code smells found in all projects: {total_smells}\n")
 
     def analyze_projects_parallel(
@@ -359,133 +526,220 @@ class ProjectAnalyzer:
         callgraph_output: str | None = None,
         exclude_paths=None,
         report_format: str = "csv",
+        resume: bool = False,
     ):
         """
         Analyzes multiple projects in parallel.
 
+        The files of all the projects are flattened into a single queue,
+        largest first, consumed by a pool of workers: idle workers always
+        pick the next pending file, so a huge project no longer pins a
+        single worker. The results of each project are streamed to its
+        detailed results in file order, and the project is finalized
+        (call graph and log) as soon as its last file completes.
+
         Parameters:
         - base_path (str): Directory containing projects to be analyzed.
-        - max_workers (int): Maximum number of parallel threads.
+        - max_workers (int): Maximum number of workers.
+          With 1, files are analyzed in the current thread.
+        - resume (bool): Whether to skip the projects, and the files,
+          completed by a previous run.
         """
-        execution_log_path = os.path.join(base_path, "execution_log.txt")
         if not os.path.exists(base_path):
             os.makedirs(base_path)
 
-        if not os.path.exists(execution_log_path):
-            FileUtils.initialize_log(execution_log_path)
-
         start_time = time.time()
-        total_smells = 0
+        prefiltered_before = self.prefiltered_files
+
+        total_smells = self._analyze_projects(
+            base_path,
+            workers=max_workers,
+            mode="in parallel",
+            resume=resume,
+            largest_first=True,
+            enable_callgraph=enable_callgraph,
+            callgraph_output=callgraph_output,
+            exclude_paths=exclude_paths,
+            report_format=report_format,
+        )
+
+        print(
+            "Parallel execution completed in "
+            f"{time.time() - start_time:.2f} seconds."
+        )
+        self._report_prefiltered(prefiltered_before)
+        print(f"Total code smells found in all projects: {total_smells}\n")
+
+    def _analyze_projects(
+        self,
+        base_path: str,
+        workers: int,
+        mode: str,
+        resume: bool,
+        enable_callgraph: bool,
+        callgraph_output: str | None,
+        exclude_paths,
+        report_format: str,
+        largest_first: bool = False,
+    ) -> int:
+        """
+        Analyzes the projects in `base_path`, saving their detailed
+        results and logging each completed project.
+
+        When resuming, the projects in the execution log are skipped, and
+        the files completed by the previous run in the other projects are
+        not analyzed again (see `AnalysisPipeline`).
+
+        Returns:
+        - int: The number of code smells found in all the projects.
+        """
+        execution_log_path = self._execution_log_path(base_path)
         lock = threading.Lock()  # Thread-safe lock for logging
+        total_smells = 0
 
-        def analyze_and_count_smells(dirname: str):
-            nonlocal total_smells
+        if resume:
+            completed = FileUtils.get_logged_projects(execution_log_path)
+        else:
+            FileUtils.initialize_log(execution_log_path)
+            completed = set()
+
+        # Discover the files of every project
+        projects = []
+        for dirname in os.listdir(base_path):
             project_path = os.path.join(base_path, dirname)
             if dirname in {"output", "execution_log.txt"} or not os.path.isdir(
                 project_path
             ):
-                return
+                continue
+            if not self._in_shard(dirname):
+                continue
+            if dirname in completed:
+                print(f"Skipping project '{dirname}': already analyzed.")
+                continue
 
-            print(f"Analyzing project '{dirname}' in parallel...")
+            print(f"Analyzing project '{dirname}' {mode}...")
             try:
-                filenames = FileUtils.get_python_files(project_path)
-                filenames = self._filter_excluded_files(filenames, exclude_paths, project_path)
-
-                col = [
-                    "filename",
-                    "function_name",
-                    "smell_name",
-                    "line",
-                    "description",
-                    "additional_info",
-                ]
-                to_save = pd.DataFrame(columns=col)
-                project_smells = 0
-                callgraph_fragments = []
-
-                for filename in filenames:
-                    try:
-                        inspected = self.inspector.inspect(filename, include_callgraph=enable_callgraph)
-
-                        if enable_callgraph:
-                            if isinstance(inspected, tuple) and len(inspected) == 2:
-                                result, callgraph_fragment = inspected
-                                callgraph_fragments.append(callgraph_fragment)
-                            else:
-                                result = inspected
-                        else:
-                            result = inspected[0] if isinstance(inspected, tuple) else inspected
-
-                        smell_count = len(result)
-                        project_smells += smell_count
-                        if smell_count > 0:
-                            print(
-                                f"Found {smell_count} code "
-                                f"smells in file: {filename}"
-                            )
-                        to_save = pd.concat(
-                            [to_save, result], ignore_index=True
-                        )
-                    except (SyntaxError, FileNotFoundError) as e:
-                        error_file = os.path.join(
-                            self.output_path, "error.txt"
-                        )
-                        os.makedirs(self.output_path, exist_ok=True)
-                        with open(error_file, "a") as f:
-                            f.write(f"Error in file {filename}: {str(e)}\n")
-                        print(f"Error analyzing file: {filename} - {str(e)}")
-                        continue
-
-                details_path = os.path.join(
-                    self.output_path, "project_details"
+                filenames = AnalysisPipeline.discover(
+                    project_path,
+                    exclude_paths,
+                    gitignore=self.gitignore,
+                    workers=workers,
                 )
-                os.makedirs(details_path, exist_ok=True)
+            except Exception as e:
+                print(f"Error analyzing project '{dirname}': {str(e)}\n")
+                continue
 
-                if not to_save.empty:
-                    base_name = f"{dirname}_results.csv"
-                    base, _ = os.path.splitext(base_name)
-                    if report_format == "json":
-                        detailed_file_path = os.path.join(details_path, f"{base}.json")
-                        to_save.to_json(detailed_file_path, orient="records", indent=2)
-                    else:
-                        detailed_file_path = os.path.join(details_path, f"{base}.csv")
-                        to_save.to_csv(detailed_file_path, index=False)
-
-                    print(f"Detailed results saved to {detailed_file_path}")
-
-                if enable_callgraph:
-                    builder = CallGraphBuilder()
-                    callgraph = builder.build(callgraph_fragments, project_root=project_path)
-
-                    cg_path = self._resolve_callgraph_output_path(
-                        project_path=project_path,
-                        project_name=dirname,
-                        callgraph_output=callgraph_output,
-                        multiple=True,
-                    )
-                    builder.save(callgraph, cg_path)
-                    print(f"Call graph saved to {cg_path}")
-
-                total_smells += project_smells
-
-                FileUtils.synchronized_append_to_log(
-                    execution_log_path, dirname, lock
+            projects.append(
+                PipelineProject(
+                    dirname,
+                    project_path,
+                    filenames,
+                    ResultSink.open(
+                        FileUtils.project_results_path(
+                            os.path.join(self.output_path, "project_details"),
+                            dirname,
+                            report_format,
+                        ),
+                        report_format,
+                    ),
                 )
+            )
 
-            except Exception as e:
-                print(f"Error analyzing project '{dirname}': {str(e)}\n")
+        def finish(project: PipelineProject) -> None:
+            nonlocal total_smells
+            total_smells += self._finish_project(
+                project,
+                execution_log_path,
+                lock,
+                enable_callgraph=enable_callgraph,
+                callgraph_output=callgraph_output,
+            )
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for dirname in os.listdir(base_path):
-                executor.submit(analyze_and_count_smells, dirname)
+        self._pipeline(
+            workers,
+            enable_callgraph,
+            largest_first=largest_first,
+            on_project=finish,
+            resume=resume,
+        ).run(projects)
+        return total_smells
 
-        print(
-            "Parallel execution completed in "
-            f"{time.time() - start_time:.2f} seconds."
+    def _in_shard(self, key: str) -> bool:
+        """
+        Checks whether a file (by its path in the project) or a project
+        (by its name) belongs to the shard of this run.
+        """
+        if self.shard_count == 1:
+            return True
+        key = key.replace(os.sep, "/")
+        return FileUtils.shard_of(key, self.shard_count) == self.shard_index
+
+    def _execution_log_path(self, base_path: str) -> str:
+        """
+        Returns the execution log of the projects in `base_path`. Every
+        shard has its own, as shards may share the projects folder.
+        """
+        if self.shard_count == 1:
+            return os.path.join(base_path, "execution_log.txt")
+        return os.path.join(
+            base_path,
+            f"execution_log.shard-{self.shard_index}-of-"
+            f"{self.shard_count}.txt",
         )
-        print(f"Total code smells found in all projects: {total_smells}\n")
 
-    def merge_all_results(self, report_format: str = "csv"):
+    def _finish_project(
+        self,
+        project: PipelineProject,
+        execution_log_path: str,
+        lock: threading.Lock,
+        enable_callgraph: bool,
+        callgraph_output: str | None,
+    ) -> int:
+        """
+        Completes a project once all of its files are written: closes its
+        detailed results, saves its call graph and logs it. A failed
+        project leaves no partial results behind.
+
+        Returns:
+        - int: The number of code smells found in the project.
+        """
+        if project.error is not None:
+            print(
+                f"Error analyzing project '{project.name}': "
+                f"{str(project.error)}\n"
+            )
+            project.sink.discard()
+            return 0
+
+        try:
+            details_path = os.path.join(self.output_path, "project_details")
+            os.makedirs(details_path, exist_ok=True)
+            self._report_resumed(project)
+
+            results = project.sink
+            results.close()
+            if len(results) > 0:
+                print(f"Detailed results saved to {results.path}")
+
+            if enable_callgraph:
+                self._save_callgraph(project, callgraph_output, multiple=True)
+
+            print(
+                f"Project '{project.name}' analyzed successfully."
+                f"Code smells found: {project.smells}\n"
+            )
+            FileUtils.synchronized_append_to_log(
+                execution_log_path, project.name, lock
+            )
+            return project.smells
+
+        except Exception as e:
+            print(f"Error analyzing project '{project.name}': {str(e)}\n")
+            return 0
+
+    def merge_all_results(
+        self, report_format: str = "csv", partition_by_smell: bool = False
+    ):
         """
         Merges all result files from multiple projects into a single overview report.
         """
@@ -493,4 +747,5 @@ class ProjectAnalyzer:
             input_dir=os.path.join(self.output_path, "project_details"),
             output_dir=self.output_path,
             report_format=report_format,
+            partition_by_smell=partition_by_smell,
         )
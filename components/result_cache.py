@@ -0,0 +1,265 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from typing import Any, Optional
+
+
+class ResultCache:
+    """
+    Persistent cache of per-file analysis results, backed by SQLite.
+
+    Entries are keyed by the analyzed file name, the hash of its content
+    and a fingerprint of the analysis (rules, extractors and dictionaries),
+    so unchanged files are never parsed again while any change to the file
+    or to the analysis invalidates their results. The file name is part of
+    the key because both the findings and the call graph fragments refer
+    to it. The least recently used entries are evicted once the cache
+    grows beyond its maximum size.
+    """
+
+    # Bump when the layout of the stored results changes.
+    FORMAT_VERSION = 1
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Opens (or creates) the cache in the given directory.
+
+        Parameters:
+        - cache_dir (str): Directory where the cache database is stored.
+        - max_size (int): Maximum size of the stored results, in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+        # Imported on demand: runs without a cache never load SQLite
+        import sqlite3
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(cache_dir, "results.sqlite"),
+            timeout=30,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, "
+            "smells BLOB NOT NULL, "
+            "callgraph BLOB, "
+            "size INTEGER NOT NULL, "
+            "last_used REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_used "
+            "ON results (last_used)"
+        )
+        self._connection.commit()
+        self._size = self._stored_size()
+        # When each entry read since the last write was last used: hits
+        # do not write, their recency is stored with the next write
+        self._used: dict[str, float] = {}
+
+    @staticmethod
+    def content_hash(source: str) -> str:
+        """
+        Returns the hash of the content of a file.
+        """
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def fingerprint(
+        cls,
+        code_files: list[str],
+        data_files: list[str],
+        settings: list[str] = (),
+    ) -> str:
+        """
+        Computes the fingerprint of an analysis setup.
+
+        Parameters:
+        - code_files (list[str]): Source files of the analysis code
+          (e.g., the modules defining the rules).
+        - data_files (list[str]): Data files the analysis depends on
+          (e.g., the object dictionaries).
+        - settings (list[str]): Options changing the results of the
+          analysis (e.g., the selected rules).
+
+        Returns:
+        - str: A digest that changes whenever any of the files does.
+        """
+        digest = hashlib.sha256(f"v{cls.FORMAT_VERSION}".encode())
+        for path in sorted(set(code_files)) + list(data_files):
+            digest.update(os.path.basename(path).encode("utf-8"))
+            try:
+                with open(path, "rb") as file:
+                    digest.update(hashlib.sha256(file.read()).digest())
+            except OSError:
+                digest.update(b"<missing>")
+        for setting in settings:
+            digest.update(b"\0" + setting.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(
+        self,
+        filename: str,
+        content_hash: str,
+        fingerprint: str,
+        include_callgraph: bool = False,
+    ) -> Optional[tuple[list[list], Optional[dict[str, Any]]]]:
+        """
+        Looks up the results of a file.
+
+        Parameters:
+        - filename (str): The name of the analyzed file.
+        - content_hash (str): The hash of the file content.
+        - fingerprint (str): The fingerprint of the analysis.
+        - include_callgraph (bool): Whether the call graph fragment
+          is needed; entries stored without it are then misses.
+
+        Returns:
+        - tuple | None: The stored smell rows and call graph fragment,
+          or None on a cache miss.
+        """
+        import sqlite3
+
+        key = self._key(filename, content_hash, fingerprint)
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT smells, callgraph FROM results WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None or (include_callgraph and row[1] is None):
+                    return None
+                self._used[key] = time.time()
+
+            smells = json.loads(zlib.decompress(row[0]))
+            callgraph = (
+                json.loads(zlib.decompress(row[1]))
+                if row[1] is not None
+                else None
+            )
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            # A broken entry is a miss: the file is analyzed again
+            print(f"Error reading cached results for '{filename}': {e}")
+            return None
+        return smells, callgraph
+
+    def put(
+        self,
+        filename: str,
+        content_hash: str,
+        fingerprint: str,
+        smells: list[list],
+        callgraph: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Stores the results of a file, evicting old entries if needed.
+
+        Parameters:
+        - filename (str): The name of the analyzed file.
+        - content_hash (str): The hash of the file content.
+        - fingerprint (str): The fingerprint of the analysis.
+        - smells (list[list]): The detected smells, one row per smell.
+        - callgraph (dict | None): The call graph fragment of the file.
+        """
+        import sqlite3
+
+        key = self._key(filename, content_hash, fingerprint)
+        smells_blob = zlib.compress(json.dumps(smells).encode("utf-8"))
+        callgraph_blob = (
+            zlib.compress(json.dumps(callgraph).encode("utf-8"))
+            if callgraph is not None
+            else None
+        )
+        size = len(smells_blob) + len(callgraph_blob or b"")
+
+        try:
+            with self._lock:
+                previous = self._connection.execute(
+                    "SELECT size FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO results "
+                    "(key, smells, callgraph, size, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, smells_blob, callgraph_blob, size, time.time()),
+                )
+                self._size += size - (previous[0] if previous else 0)
+                self._used.pop(key, None)
+                if self._size > self.max_size:
+                    self._evict()
+                self._store_used()
+                self._connection.commit()
+        except sqlite3.Error as e:
+            print(f"Error caching results for '{filename}': {e}")
+
+    def close(self) -> None:
+        """
+        Stores when the entries read were last used, and closes the cache
+        database. Closing a closed cache does nothing.
+        """
+        import sqlite3
+
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._store_used()
+                self._connection.commit()
+            except sqlite3.Error as e:
+                print(f"Error saving the cache usage: {e}")
+            self._connection.close()
+            self._connection = None
+
+    def _key(self, filename: str, content_hash: str, fingerprint: str) -> str:
+        return hashlib.sha256(
+            f"{filename}\0{content_hash}\0{fingerprint}".encode("utf-8")
+        ).hexdigest()
+
+    def _store_used(self) -> None:
+        """
+        Stores when the entries read since the last write were last used,
+        in the current transaction.
+        """
+        if self._used:
+            self._connection.executemany(
+                "UPDATE results SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._used.items()],
+            )
+            self._used.clear()
+
+    def _stored_size(self) -> int:
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache is back
+        below 90% of its maximum size.
+        """
+        # The entries read recently are not the least recently used
+        self._store_used()
+        # Other processes may share the database: start from the real size
+        self._size = self._stored_size()
+        target = self.max_size * 0.9
+        rows = self._connection.execute(
+            "SELECT key, size FROM results ORDER BY last_used"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            evicted.append((key,))
+            self._size -= size
+        self._connection.executemany(
+            "DELETE FROM results WHERE key = ?", evicted
+        )
@@ -0,0 +1,545 @@
+import csv
+import json
+import os
+from typing import TYPE_CHECKING, Iterable
+from components.smell_collector import SmellCollector
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def require_pyarrow():
+    """
+    Imports pyarrow, the optional dependency of the Parquet format.
+
+    Returns:
+    - module: The `pyarrow` module, with `pyarrow.parquet` loaded.
+
+    Raises:
+    - ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "The parquet format requires pyarrow (pip install pyarrow)."
+        ) from e
+    return pyarrow
+
+
+class ResultSink:
+    """
+    Streams detected code smells to a report file as they are produced.
+
+    Rows are buffered in memory up to `buffer_size` and then appended to
+    the file, so the memory used by a run no longer grows with the number
+    of findings. `checkpoint` forces the buffered rows to disk (fsync):
+    after a crash, every row written before the last checkpoint is kept.
+
+    The file is created when the first row is flushed, so a run without
+    findings leaves no empty report behind.
+
+    The files whose smells were written can be recorded (`record_file`)
+    in a journal next to the report (`_<report>.journal`), one JSON line
+    per file with the hash of its content, its number of rows and the
+    size of the report after its rows. Records are appended at each
+    checkpoint, once the rows they describe are on disk, so `resume` can
+    reopen the report of an interrupted run and continue after the last
+    recorded file. Recording a file does not flush the buffer: the size
+    of the report after its rows is measured when they are flushed. The
+    journal is removed once the report is complete (see `close`).
+    """
+
+    extension = ""
+
+    DEFAULT_BUFFER_SIZE = 1000
+
+    def __init__(
+        self,
+        path: str,
+        columns: Iterable[str] = SmellCollector.COLUMNS,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """
+        Initializes the sink.
+
+        Parameters:
+        - path (str): Path of the report file.
+        - columns (Iterable[str]): Names of the columns of each row.
+        - buffer_size (int): Maximum number of rows kept in memory before
+          they are written to the file.
+        """
+        self.path = path
+        self.columns = tuple(columns)
+        self.buffer_size = max(1, buffer_size)
+        self.journal_path = self.journal_path_of(path)
+        self.rows_written = 0
+        self._buffer = []
+        self._file = None
+        # Counts the bytes written to the file (see `_CountingWriter`)
+        self._out = None
+        self._journal = None
+        self._journaled = False
+        self._records = []
+        # Records waiting for the flush of their rows, with the number of
+        # rows of the report after them
+        self._pending = []
+
+    @staticmethod
+    def open(base_path: str, report_format: str = "csv", **kwargs):
+        """
+        Creates the sink of a report format.
+
+        Parameters:
+        - base_path (str): Path of the report file, without extension.
+        - report_format (str): "csv" (default), "json", "jsonl" or
+          "parquet".
+
+        Returns:
+        - ResultSink: The sink writing `base_path` plus the format
+          extension.
+        """
+        sink_class = {
+            "json": JsonResultSink,
+            "jsonl": JsonLinesResultSink,
+            "parquet": ParquetResultSink,
+        }.get(report_format, CsvResultSink)
+        return sink_class(f"{base_path}{sink_class.extension}", **kwargs)
+
+    @staticmethod
+    def journal_path_of(path: str) -> str:
+        """
+        Returns the path of the journal of a report. Its name starts with
+        `_`, so readers of datasets (e.g., the folders of Parquet
+        partitions) skip it.
+        """
+        directory, name = os.path.split(path)
+        return os.path.join(directory, f"_{name}.journal")
+
+    def __len__(self) -> int:
+        return self.rows_written + len(self._buffer)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def write_rows(self, rows: Iterable[tuple]) -> None:
+        """
+        Appends rows of values, in the order of `columns`.
+
+        Parameters:
+        - rows (Iterable[tuple]): The rows to append.
+        """
+        for row in rows:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.buffer_size:
+                self.flush()
+
+    def write_collector(self, collector: SmellCollector) -> None:
+        """
+        Appends the smells of a collector.
+
+        Parameters:
+        - collector (SmellCollector): The smells to append.
+        """
+        self.write_rows(collector.to_records())
+
+    def write_frame(self, df: "pd.DataFrame") -> None:
+        """
+        Appends the rows of a DataFrame of smells.
+        Missing columns and missing values are written as empty values.
+
+        Parameters:
+        - df (pd.DataFrame): The smells to append.
+        """
+        if df.empty:
+            return
+        df = df.reindex(columns=list(self.columns)).astype(object)
+        df = df.where(df.notna(), None)
+        self.write_rows(df.itertuples(index=False, name=None))
+
+    def record_file(self, record: dict) -> None:
+        """
+        Records that the smells of a file were written, once all of its
+        rows are. The record is journaled at the next checkpoint.
+
+        Parameters:
+        - record (dict): The file ("file"), the hash of its content
+          ("hash"), its number of rows ("rows") and any other data to
+          restore when resuming (JSON serializable).
+        """
+        record = {**record, "offset": None}
+        self._records.append(record)
+        self._pending.append((record, len(self)))
+        self._journaled = True
+
+    def resume(self, is_current) -> list[dict]:
+        """
+        Reopens the report of a previous run, keeping the rows of the
+        longest sequence of journaled files that are still current, and
+        truncating any row written after them.
+
+        Parameters:
+        - is_current (Callable[[int, dict], bool]): Checks whether the
+          record at the given position still describes the file to
+          analyze at that position.
+
+        Returns:
+        - list[dict]: The records of the files kept, in order.
+        """
+        records = []
+        try:
+            with open(self.journal_path, encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # A record torn by a crash
+                    if not is_current(len(records), record):
+                        break
+                    records.append(record)
+        except FileNotFoundError:
+            pass
+
+        offset = records[-1]["offset"] if records else 0
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size < offset:
+            records, offset = [], 0
+
+        if offset == 0:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        else:
+            with open(self.path, "r+b") as report:
+                report.truncate(offset)
+            self._file = open(self.path, "a", encoding="utf-8", newline="")
+            self._out = _CountingWriter(self._file, offset)
+            self._reopen()
+        self.rows_written = sum(record["rows"] for record in records)
+
+        # The journal is rewritten with the records kept
+        self._records = records
+        self._pending = []
+        self._journaled = True
+        self._write_journal()
+        return records
+
+    def flush(self) -> None:
+        """
+        Writes the buffered rows to the file, and measures the size of the
+        report after the rows of each recorded file.
+        """
+        pending, self._pending = self._pending, []
+        if not self._buffer:
+            for record, _ in pending:
+                record["offset"] = self._out.size if self._out else 0
+            return
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = self._open_file()
+            self._out = _CountingWriter(self._file)
+            self._write_header()
+
+        # The rows are written in segments ending with recorded files
+        buffer, self._buffer = self._buffer, []
+        written = 0
+        for record, rows in pending:
+            end = rows - self.rows_written + written
+            if end > written:
+                self._write(buffer[written:end])
+                self.rows_written += end - written
+                written = end
+            record["offset"] = self._out.size if rows > 0 else 0
+        if written < len(buffer):
+            self._write(buffer[written:])
+            self.rows_written += len(buffer) - written
+
+    def checkpoint(self) -> None:
+        """
+        Flushes the buffered rows and forces them to disk.
+        """
+        self.flush()
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._write_journal()
+
+    def close(self, keep_journal: bool = False) -> None:
+        """
+        Writes the remaining rows, completes and closes the file.
+
+        Parameters:
+        - keep_journal (bool): Whether to keep the journal, e.g. to resume
+          an interrupted run. The journal of a complete report is removed.
+        """
+        if not keep_journal:
+            self._journaled = False
+            self._records = []
+        self.flush()
+        if self._file is not None:
+            self._write_footer()
+            self.checkpoint()
+            self._file.close()
+            self._file = None
+            self._out = None
+        else:
+            self._write_journal()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if not keep_journal and os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def discard(self) -> None:
+        """
+        Drops the buffered rows and removes the partially written file,
+        and its journal.
+        """
+        self._buffer = []
+        self._records = []
+        self._pending = []
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._out = None
+            os.remove(self.path)
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+            os.remove(self.journal_path)
+        self.rows_written = 0
+
+    def _write_journal(self) -> None:
+        """
+        Appends the pending records to the journal and forces them to
+        disk. Called once the rows they describe are on disk.
+        """
+        if not self._journaled or (
+            self._journal is not None and not self._records
+        ):
+            return
+        if self._journal is None:
+            # Replaces the journal of a previous run (see `resume`)
+            directory = os.path.dirname(self.journal_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._journal = open(self.journal_path, "w", encoding="utf-8")
+        self._journal.writelines(
+            json.dumps(record) + "\n" for record in self._records
+        )
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._records = []
+
+    def _open_file(self):
+        """
+        Creates the report file.
+        """
+        return open(self.path, "w", encoding="utf-8", newline="")
+
+    def _reopen(self) -> None:
+        """
+        Prepares the writer of a resumed report, whose header is written.
+        """
+        pass
+
+    def _write_header(self) -> None:
+        pass
+
+    def _write(self, rows: list[tuple]) -> None:
+        raise NotImplementedError
+
+    def _write_footer(self) -> None:
+        pass
+
+
+class _CountingWriter:
+    """
+    Writes text to a report file, counting the bytes written: reports are
+    encoded in UTF-8, without newline translation.
+    """
+
+    def __init__(self, file, size: int = 0):
+        self.file = file
+        self.size = size
+
+    def write(self, text: str) -> int:
+        self.size += len(text.encode("utf-8"))
+        return self.file.write(text)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.write(line)
+
+
+class CsvResultSink(ResultSink):
+    """
+    Streams smells to a CSV file, with a header row.
+    """
+
+    extension = ".csv"
+
+    def _write_header(self) -> None:
+        self._reopen()
+        self._writer.writerow(self.columns)
+
+    def _reopen(self) -> None:
+        self._writer = csv.writer(self._out, lineterminator=os.linesep)
+
+    def _write(self, rows: list[tuple]) -> None:
+        self._writer.writerows(rows)
+
+
+class JsonLinesResultSink(ResultSink):
+    """
+    Streams smells to a JSON Lines file, one object per line.
+    Every complete line is a valid record, even after a crash.
+    """
+
+    extension = ".jsonl"
+
+    def _write(self, rows: list[tuple]) -> None:
+        self._out.writelines(
+            json.dumps(dict(zip(self.columns, row))) + "\n" for row in rows
+        )
+
+
+class JsonResultSink(ResultSink):
+    """
+    Streams smells to a JSON file holding an array of records, the
+    format of the JSON reports. The array is closed by `close`.
+    """
+
+    extension = ".json"
+
+    def _write_header(self) -> None:
+        self._out.write("[")
+
+    def _write(self, rows: list[tuple]) -> None:
+        for index, row in enumerate(rows):
+            record = json.dumps(dict(zip(self.columns, row)), indent=2)
+            separator = "\n" if self.rows_written + index == 0 else ",\n"
+            self._out.write(separator + "  " + record.replace("\n", "\n  "))
+
+    def _write_footer(self) -> None:
+        self._out.write("\n]")
+
+
+class ParquetResultSink(ResultSink):
+    """
+    Streams smells to a Parquet file, one row group per full buffer. The
+    string columns repeating a few values (file, function and smell
+    names, descriptions) are dictionary-encoded.
+
+    A Parquet file is only readable once its footer is written by
+    `close`, so the smells of an interrupted run cannot be kept: resuming
+    analyzes all the files of the report again. Recording files and
+    checkpoints therefore only journal the files, without flushing the
+    buffer into small row groups, which would slow down every read.
+    """
+
+    extension = ".parquet"
+
+    # Rows per row group (the default buffer size)
+    ROW_GROUP_SIZE = 50_000
+
+    # Columns written as integers; the others are written as strings
+    INTEGER_COLUMNS = ("line",)
+
+    DICTIONARY_COLUMNS = (
+        "filename",
+        "function_name",
+        "smell_name",
+        "description",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        columns: Iterable[str] = SmellCollector.COLUMNS,
+        buffer_size: int = ROW_GROUP_SIZE,
+    ):
+        super().__init__(path, columns, buffer_size)
+        self._writer = None
+
+    def record_file(self, record: dict) -> None:
+        self._records.append({**record, "offset": 0})
+        self._journaled = True
+
+    def checkpoint(self) -> None:
+        if self._file is not None and self._writer is None:
+            # The footer is written: the report is complete
+            super().checkpoint()
+        else:
+            self._write_journal()
+
+    def resume(self, is_current) -> list[dict]:
+        # The report of an interrupted run has no footer: none is kept
+        return super().resume(lambda index, record: False)
+
+    def discard(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        super().discard()
+
+    def _open_file(self):
+        return open(self.path, "wb")
+
+    def _write_header(self) -> None:
+        pa = require_pyarrow()
+        self._schema = pa.schema(
+            [
+                (
+                    column,
+                    (
+                        pa.int64()
+                        if column in self.INTEGER_COLUMNS
+                        else pa.string()
+                    ),
+                )
+                for column in self.columns
+            ]
+        )
+        self._writer = pa.parquet.ParquetWriter(
+            self._file,
+            self._schema,
+            use_dictionary=[
+                column
+                for column in self.columns
+                if column in self.DICTIONARY_COLUMNS
+            ],
+        )
+
+    def _write(self, rows: list[tuple]) -> None:
+        pa = require_pyarrow()
+        columns = list(zip(*rows))
+        arrays = []
+        for field, values in zip(self._schema, columns):
+            if field.name in self.INTEGER_COLUMNS:
+                # Values read back from text reports are strings
+                values = [
+                    int(value) if value not in (None, "") else None
+                    for value in values
+                ]
+            else:
+                values = [
+                    str(value) if value is not None else None
+                    for value in values
+                ]
+            arrays.append(pa.array(values, type=field.type))
+        self._writer.write_table(
+            pa.Table.from_arrays(arrays, schema=self._schema)
+        )
+
+    def _write_footer(self) -> None:
+        self._writer.close()
+        self._writer = None
@@ -1,25 +1,7 @@
-import pandas as pd
 import ast
-from detection_rules.api_specific import (
-    chain_indexing_smell,
-    dataframe_conversion_api_misused,
-    gradients_not_cleared_before_backward_propagation,
-    matrix_multiplication_api_misused,
-    pytorch_call_method_misused,
-    tensor_array_not_used,
-)
-from detection_rules.generic import (
-    broadcasting_feature_not_used,
-    columns_and_datatype_not_explicitly_set,
-    deterministic_algorithm_option_not_used,
-    empty_column_misinitialization,
-    hyperparameters_not_explicitly_set,
-    in_place_apis_misused,
-    memory_not_freed,
-    merge_api_parameter_not_explicitly_set,
-    nan_equivalence_comparison_misused,
-    unnecessary_iteration,
-)
+from components.smell_collector import SmellCollector
+from detection_rules.rule_dispatcher import FunctionTraversal, RuleDispatcher
+from detection_rules.rule_registry import RULES
 
 
 class RuleChecker:
@@ -28,15 +10,165 @@ class RuleChecker:
     analysis.
     """
 
-    def __init__(self, output_path: str):
+    # The available rules, by identifier (the lowercase smell name): the
+    # built-in rules and the registered plugins (see `RuleRegistry`).
+    # Rule modules are imported only when the rules are used.
+    RULES = RULES
+
+    # Profiles select the rules about a library
+    PROFILES = {
+        "pandas": "pandas",
+        "pytorch": "torch",
+        "tensorflow": "tensorflow",
+    }
+
+    def __init__(
+        self,
+        output_path: str,
+        rules: list[str] | None = None,
+        skip_rules: list[str] | None = None,
+        profile: str | None = None,
+    ):
         """
         Initializes the RuleChecker.
 
         Parameters:
         - output_path (str): Path where detected smells will be saved.
+        - rules (list[str] | None): Identifiers of the rules to apply
+          (see `RULES`). If neither `rules` nor `profile` is given,
+          all the rules are applied.
+        - skip_rules (list[str] | None): Identifiers of the rules
+          not to apply.
+        - profile (str | None): Applies the rules about a library
+          (see `PROFILES`), in addition to `rules`.
         """
         self.output_path = output_path
-        self._setup_smells()
+        self._setup_smells(self.select_rules(rules, skip_rules, profile))
+
+    @property
+    def smells(self) -> list:
+        """
+        The smell detectors applied by the RuleChecker.
+        """
+        return self._dispatcher.smells
+
+    @smells.setter
+    def smells(self, smells: list) -> None:
+        self._dispatcher = RuleDispatcher(smells)
+        self._dispatchers_by_libraries = {}
+
+    def applies_to(self, libraries: dict[str, str]) -> bool:
+        """
+        Checks whether any smell detector applies to a file, given the
+        libraries it imports (see `Smell.required_libraries`).
+
+        Parameters:
+        - libraries (dict[str, str]): The libraries imported by the file,
+          mapped to their aliases.
+
+        Returns:
+        - bool: False if the file can be skipped altogether.
+        """
+        return bool(self._dispatcher_for(libraries).smells)
+
+    def required_libraries(self) -> frozenset[str] | None:
+        """
+        Returns the libraries a file must import (at least one of them)
+        for any smell detector to apply.
+
+        Returns:
+        - frozenset[str] | None: The libraries, or None if some detector
+          applies to any file.
+        """
+        libraries = set()
+        for smell in self.smells:
+            if not smell.required_libraries:
+                return None
+            libraries.update(smell.required_libraries)
+        return frozenset(libraries)
+
+    def requires_data(self, key: str) -> bool:
+        """
+        Checks whether any smell detector reads an entry of the extracted
+        data (see `Smell.required_data`).
+
+        Parameters:
+        - key (str): The key of the extracted data (e.g., "variables").
+
+        Returns:
+        - bool: False if the extractor computing it can be skipped.
+        """
+        return any(key in smell.required_data for smell in self.smells)
+
+    @classmethod
+    def select_rules(
+        cls,
+        rules: list[str] | None = None,
+        skip_rules: list[str] | None = None,
+        profile: str | None = None,
+    ) -> list[str]:
+        """
+        Resolves a selection of rules (see `__init__`).
+
+        Returns:
+        - list[str]: The identifiers of the selected rules, in the order
+          of `RULES`.
+
+        Raises:
+        - ValueError: If a rule or the profile is unknown.
+        """
+        unknown = [
+            rule
+            for rule in [*(rules or []), *(skip_rules or [])]
+            if rule.lower() not in cls.RULES
+        ]
+        if unknown:
+            raise ValueError(
+                f"Unknown rules: {', '.join(unknown)}. "
+                f"Available rules: {', '.join(cls.RULES)}"
+            )
+        if profile is not None and profile not in cls.PROFILES:
+            raise ValueError(
+                f"Unknown profile: {profile}. "
+                f"Available profiles: {', '.join(cls.PROFILES)}"
+            )
+
+        if rules is None and profile is None:
+            selected = set(cls.RULES)
+        else:
+            selected = {rule.lower() for rule in rules or []}
+        if profile is not None:
+            library = cls.PROFILES[profile]
+            selected.update(
+                rule
+                for rule, smell_class in cls.RULES.items()
+                if library in smell_class.required_libraries
+            )
+        selected.difference_update(rule.lower() for rule in skip_rules or [])
+        return [rule for rule in cls.RULES if rule in selected]
+
+    def _dispatcher_for(self, libraries: dict[str, str]) -> RuleDispatcher:
+        """
+        Returns the dispatcher of the smell detectors that apply to the
+        given libraries. Dispatchers are shared by all the files with the
+        same imports.
+        """
+        key = frozenset(libraries)
+        dispatcher = self._dispatchers_by_libraries.get(key)
+        if dispatcher is None:
+            smells = [
+                smell
+                for smell in self._dispatcher.smells
+                if smell.applies_to(libraries)
+            ]
+            if len(smells) == len(self._dispatcher.smells):
+                dispatcher = self._dispatcher
+            else:
+                dispatcher = RuleDispatcher(smells)
+            if len(self._dispatchers_by_libraries) >= 1024:
+                self._dispatchers_by_libraries.clear()
+            self._dispatchers_by_libraries[key] = dispatcher
+        return dispatcher
 
     def rule_check(
         self,
@@ -44,10 +176,13 @@ class RuleChecker:
         extracted_data: dict[str, any],
         filename: str,
         function_name: str,
-        df_output: pd.DataFrame,
-    ) -> pd.DataFrame:
+        collector: SmellCollector,
+        timings: dict[str, float] | None = None,
+        traversal: FunctionTraversal | None = None,
+    ) -> SmellCollector:
         """
-        Applies all registered smell detectors to the given AST node.
+        Applies the registered smell detectors to the given AST node.
+        Detectors whose required libraries are not imported are skipped.
 
         Parameters:
         - ast_node (ast.AST): The AST node to analyze.
@@ -55,62 +190,50 @@ class RuleChecker:
         (e.g., libraries, variables, etc.).
         - filename (str): The name of the file being analyzed.
         - function_name (str): The name of the function node being analyzed.
-        - df_output (pd.DataFrame): The DataFrame to store detected smells.
+        - collector (SmellCollector): The collector storing detected smells.
+        - timings (dict[str, float] | None): Optional dictionary to which
+          the seconds spent by each applied detector are added, by rule
+          identifier (see `RULES`).
+        - traversal (FunctionTraversal | None): Optional traversal of the
+          node, e.g. restricted to the nodes of its scope.
 
         Returns:
-        - pd.DataFrame: The updated DataFrame containing detected smells.
+        - SmellCollector: The updated collector containing detected smells.
         """
-        for smell in self.smells:
-            try:
-                detected_smells = smell.detect(ast_node, extracted_data)
-                for detected_smell in detected_smells:
-                    df_output.loc[len(df_output)] = {
-                        "filename": filename,
-                        "function_name": function_name,
-                        "smell_name": detected_smell["name"],
-                        "line": detected_smell["line"],
-                        "description": detected_smell["description"],
-                        "additional_info": detected_smell["additional_info"],
-                    }
-            except Exception as e:
-                print(
-                    f"Error in rule checker '{type(smell).__name__}' "
-                    f"for function '{function_name}' "
-                    f"in file '{filename}': {e}"
-                )
-
-        return df_output
-
-    def _setup_smells(self) -> None:
+        def report_error(smell, e):
+            print(
+                f"Error in rule checker '{type(smell).__name__}' "
+                f"for function '{function_name}' "
+                f"in file '{filename}': {e}"
+            )
+
+        # The applicable rules are applied with a single traversal
+        dispatcher = self._dispatcher_for(extracted_data.get("libraries", {}))
+        rule_timings = (
+            [0.0] * len(dispatcher.smells) if timings is not None else None
+        )
+        results = dispatcher.dispatch(
+            ast_node,
+            extracted_data,
+            on_error=report_error,
+            timings=rule_timings,
+            traversal=traversal,
+        )
+        if timings is not None:
+            for smell, seconds in zip(dispatcher.smells, rule_timings):
+                rule = smell.rule_id or smell.name.lower()
+                timings[rule] = timings.get(rule, 0.0) + seconds
+        for detected_smells in results:
+            collector.add_smells(filename, function_name, detected_smells)
+
+        return collector
+
+    def _setup_smells(self, rules: list[str]) -> None:
         """
         Sets up the smells for the RuleChecker
-        by explicitly instantiating them.
-        """
-        # fmt: off
-        self.smells = [
-            # API-Specific Smells
-            chain_indexing_smell.ChainIndexingSmell(),
-            dataframe_conversion_api_misused.DataFrameConversionAPIMisused(),
-            gradients_not_cleared_before_backward_propagation.
-            GradientsNotClearedSmell(),
-            matrix_multiplication_api_misused.MatrixMultiplicationAPIMisused(),
-            pytorch_call_method_misused.PyTorchCallMethodMisusedSmell(),
-            tensor_array_not_used.TensorArrayNotUsedSmell(),
-            # Generic Smells
-            broadcasting_feature_not_used.BroadcastingFeatureNotUsedSmell(),
-            columns_and_datatype_not_explicitly_set.
-            ColumnsAndDatatypeNotExplicitlySetSmell(),
-            deterministic_algorithm_option_not_used.
-            DeterministicAlgorithmOptionSmell(),
-            empty_column_misinitialization.
-            EmptyColumnMisinitializationSmell(),
-            hyperparameters_not_explicitly_set.
-            HyperparametersNotExplicitlySetSmell(),
-            in_place_apis_misused.InPlaceAPIsMisusedSmell(),
-            memory_not_freed.MemoryNotFreedSmell(),
-            merge_api_parameter_not_explicitly_set.
-            MergeAPIParameterNotExplicitlySetSmell(),
-            nan_equivalence_comparison_misused.
-            NanEquivalenceComparisonMisusedSmell(),
-            unnecessary_iteration.UnnecessaryIterationSmell(),
-        ]
+        by instantiating the selected ones only.
+
+        Parameters:
+        - rules (list[str]): Identifiers of the selected rules.
+        """
+        self.smells = [self.RULES[rule]() for rule in rules]
@@ -0,0 +1,276 @@
+import heapq
+import json
+import math
+import os
+import time
+from array import array
+
+
+class RunMetrics:
+    """
+    Collects the timings of an analysis run: the time spent by each file
+    in every stage of the analysis (read, parse, call graph, extraction,
+    detection, result writing) and by every detection rule.
+
+    Timings are kept as compact per-stage and per-rule samples (one per
+    file), so percentiles can be computed at the end of the run, and only
+    the slowest files are remembered with their breakdown. Metrics
+    collected by worker processes are combined with `merge`.
+    """
+
+    FILENAME = "run_metrics.json"
+
+    def __init__(self, slowest_files: int = 10):
+        """
+        Initializes empty metrics.
+
+        Parameters:
+        - slowest_files (int): Number of slowest files to remember.
+        """
+        self.slowest_files = slowest_files
+        self.files = 0
+        self.stages: dict[str, array] = {}
+        self.rules: dict[str, array] = {}
+        self._slowest: list[tuple[float, str, dict]] = []
+        self._started = time.perf_counter()
+
+    def add_file(
+        self,
+        filename: str,
+        stages: dict[str, float],
+        rules: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Records the timings of an analyzed file.
+
+        Parameters:
+        - filename (str): The analyzed file.
+        - stages (dict[str, float]): Seconds spent in each stage.
+        - rules (dict[str, float] | None): Seconds spent by each rule.
+        """
+        self.files += 1
+        for stage, seconds in stages.items():
+            self.add_stage(stage, seconds)
+        for rule, seconds in (rules or {}).items():
+            self.rules.setdefault(rule, array("d")).append(seconds)
+
+        if self.slowest_files <= 0:
+            return
+        entry = (
+            sum(stages.values()),
+            filename,
+            {"stages": dict(stages), "rules": dict(rules or {})},
+        )
+        if len(self._slowest) < self.slowest_files:
+            heapq.heappush(self._slowest, entry)
+        elif entry[0] > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def add_stage(self, stage: str, seconds: float) -> None:
+        """
+        Records the time spent in a stage (e.g., writing the results of
+        a file).
+
+        Parameters:
+        - stage (str): The name of the stage.
+        - seconds (float): The time spent.
+        """
+        self.stages.setdefault(stage, array("d")).append(seconds)
+
+    def merge(self, other: "RunMetrics") -> None:
+        """
+        Adds the metrics collected elsewhere (e.g., by a worker process).
+
+        Parameters:
+        - other (RunMetrics): The metrics to add.
+        """
+        self.files += other.files
+        for samples, other_samples in (
+            (self.stages, other.stages),
+            (self.rules, other.rules),
+        ):
+            for key, values in other_samples.items():
+                samples.setdefault(key, array("d")).extend(values)
+        for entry in other._slowest:
+            if len(self._slowest) < self.slowest_files:
+                heapq.heappush(self._slowest, entry)
+            elif self._slowest and entry[0] > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def summary(self) -> dict:
+        """
+        Aggregates the metrics.
+
+        Returns:
+        - dict: The number of files, the elapsed time and throughput, the
+          statistics of every stage and rule (count, total, p50, p95 and
+          max, in seconds) and the slowest files.
+        """
+        elapsed = time.perf_counter() - self._started
+        return {
+            "files": self.files,
+            "elapsed_seconds": round(elapsed, 6),
+            "files_per_second": (
+                round(self.files / elapsed, 3) if elapsed > 0 else 0.0
+            ),
+            "stages": {
+                stage: self._statistics(samples)
+                for stage, samples in self.stages.items()
+            },
+            "rules": {
+                rule: self._statistics(samples)
+                for rule, samples in sorted(
+                    self.rules.items(), key=lambda item: -sum(item[1])
+                )
+            },
+            "slowest_files": [
+                {
+                    "filename": filename,
+                    "seconds": round(seconds, 6),
+                    "stages": self._rounded(breakdown["stages"]),
+                    "rules": self._rounded(breakdown["rules"]),
+                }
+                for seconds, filename, breakdown in sorted(
+                    self._slowest, key=lambda entry: -entry[0]
+                )
+            ],
+        }
+
+    @staticmethod
+    def combine(summaries: list[dict], slowest_files: int = 10) -> dict:
+        """
+        Combines the summaries of runs analyzing different files at the
+        same time (e.g., the shards of a corpus).
+
+        Counts and totals are added and maxima kept exactly. The samples
+        are not saved, so percentiles cannot be recomputed: the highest
+        percentile of the runs is reported, an upper bound.
+
+        Parameters:
+        - summaries (list[dict]): The summaries (see `summary`).
+        - slowest_files (int): Number of slowest files to keep.
+
+        Returns:
+        - dict: The combined summary, in the format of `summary`.
+        """
+        files = sum(summary["files"] for summary in summaries)
+        elapsed = max(
+            (summary["elapsed_seconds"] for summary in summaries), default=0
+        )
+        combined = {
+            "files": files,
+            "elapsed_seconds": elapsed,
+            "files_per_second": (
+                round(files / elapsed, 3) if elapsed > 0 else 0.0
+            ),
+        }
+        for section in ("stages", "rules"):
+            statistics = {}
+            for summary in summaries:
+                for name, values in summary.get(section, {}).items():
+                    if name not in statistics:
+                        statistics[name] = dict(values)
+                        continue
+                    merged = statistics[name]
+                    merged["count"] += values["count"]
+                    merged["total"] = round(
+                        merged["total"] + values["total"], 6
+                    )
+                    for key in ("p50", "p95", "max"):
+                        merged[key] = max(merged[key], values[key])
+            combined[section] = dict(
+                sorted(statistics.items(), key=lambda item: -item[1]["total"])
+            )
+        combined["slowest_files"] = sorted(
+            (
+                entry
+                for summary in summaries
+                for entry in summary.get("slowest_files", [])
+            ),
+            key=lambda entry: -entry["seconds"],
+        )[:slowest_files]
+        return combined
+
+    def save(self, output_dir: str) -> str:
+        """
+        Saves the aggregated metrics to `run_metrics.json`.
+
+        Parameters:
+        - output_dir (str): Directory of the report.
+
+        Returns:
+        - str: The path of the saved report.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        path = os.path.join(output_dir, self.FILENAME)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=2)
+        return path
+
+    def format_report(self) -> str:
+        """
+        Formats the aggregated metrics as console tables: the rules and
+        stages by total time, and the slowest files.
+
+        Returns:
+        - str: The report.
+        """
+        summary = self.summary()
+        lines = [
+            f"Analyzed {summary['files']} files in "
+            f"{summary['elapsed_seconds']:.2f} seconds "
+            f"({summary['files_per_second']:.1f} files/s)",
+        ]
+        for title, statistics in (
+            ("Rule", summary["rules"]),
+            ("Stage", summary["stages"]),
+        ):
+            width = max([len(title), *map(len, statistics)])
+            lines.append("")
+            lines.append(
+                f"{title:<{width}}  {'Files':>7}  {'Total (s)':>10}  "
+                f"{'p50 (ms)':>9}  {'p95 (ms)':>9}  {'Max (ms)':>9}"
+            )
+            for name, values in sorted(
+                statistics.items(), key=lambda item: -item[1]["total"]
+            ):
+                lines.append(
+                    f"{name:<{width}}  {values['count']:>7}  "
+                    f"{values['total']:>10.3f}  "
+                    f"{values['p50'] * 1000:>9.2f}  "
+                    f"{values['p95'] * 1000:>9.2f}  "
+                    f"{values['max'] * 1000:>9.2f}"
+                )
+
+        if summary["slowest_files"]:
+            lines.append("")
+            lines.append("Slowest files:")
+            for entry in summary["slowest_files"]:
+                lines.append(
+                    f"{entry['seconds']:>10.3f} s  {entry['filename']}"
+                )
+        return "\n".join(lines)
+
+    @staticmethod
+    def _statistics(samples: array) -> dict:
+        """
+        Returns the count, total, median, 95th percentile and maximum of
+        a list of timings (nearest-rank percentiles).
+        """
+        ordered = sorted(samples)
+        count = len(ordered)
+
+        def percentile(p: int) -> float:
+            return ordered[max(0, math.ceil(p / 100 * count) - 1)]
+
+        return {
+            "count": count,
+            "total": round(sum(ordered), 6),
+            "p50": round(percentile(50), 6),
+            "p95": round(percentile(95), 6),
+            "max": round(ordered[-1], 6),
+        }
+
+    @staticmethod
+    def _rounded(timings: dict[str, float]) -> dict[str, float]:
+        return {key: round(seconds, 6) for key, seconds in timings.items()}
@@ -0,0 +1,243 @@
+import json
+import os
+import shutil
+from call_graph.call_graph_builder import CallGraphBuilder
+from components.result_sink import ResultSink
+from components.run_metrics import RunMetrics
+from utils.file_utils import FileUtils
+
+
+class ShardMerger:
+    """
+    Combines the outputs of the shards of an analysis (see the
+    `shard_index` and `shard_count` of `ProjectAnalyzer`) into the output
+    a single run would have written:
+
+    - the detailed results and call graphs of the projects, each analyzed
+      by a single shard, and the overview merged from them;
+    - or, for a single project, the overviews of the shards, with the
+      rows put back in the order of all the files (as journaled by the
+      shards), and the call graph rebuilt from the fragments of all the
+      files, so calls across shards resolve;
+    - the errors and the run metrics of all the shards.
+    """
+
+    def __init__(self, shard_paths: list[str], output_path: str):
+        """
+        Initializes the merger.
+
+        Parameters:
+        - shard_paths (list[str]): The output folders of the shards, as
+          given to their analyses.
+        - output_path (str): Directory where the merged results will be
+          saved (in its `output` folder, as for an analysis).
+        """
+        self.shard_outputs = [
+            os.path.join(path, "output") for path in shard_paths
+        ]
+        self.base_output_path = output_path
+        self.output_path = os.path.join(output_path, "output")
+
+    def merge(
+        self, report_format: str = "csv", partition_by_smell: bool = False
+    ) -> None:
+        """
+        Merges the outputs of the shards.
+
+        Parameters:
+        - report_format (str): The format of the results of the shards:
+          "csv" (default), "json", "jsonl" or "parquet".
+        - partition_by_smell (bool): Whether to partition a Parquet
+          overview of multiple projects by smell, besides by project.
+
+        Raises:
+        - FileNotFoundError: If the output of a shard cannot be found.
+        - ValueError: If two shards wrote the results of the same project.
+        """
+        for shard_output in self.shard_outputs:
+            if not os.path.isdir(shard_output):
+                raise FileNotFoundError(
+                    f"Shard output not found: {shard_output}"
+                )
+        FileUtils.clean_directory(self.base_output_path, "output")
+
+        details = [
+            os.path.join(shard_output, "project_details")
+            for shard_output in self.shard_outputs
+            if os.path.isdir(os.path.join(shard_output, "project_details"))
+        ]
+        if details:
+            merged_details = os.path.join(self.output_path, "project_details")
+            self._copy_project_details(details, merged_details)
+            FileUtils.merge_results(
+                merged_details,
+                self.output_path,
+                report_format,
+                partition_by_smell,
+            )
+        else:
+            overview = "overview" + FileUtils.results_extension(
+                report_format
+            )
+            shard_outputs = [
+                shard_output
+                for shard_output in self.shard_outputs
+                if os.path.exists(os.path.join(shard_output, overview))
+            ]
+            FileUtils.merge_result_files(
+                [
+                    os.path.join(shard_output, overview)
+                    for shard_output in shard_outputs
+                ],
+                self.output_path,
+                report_format,
+                row_positions=self._row_positions(shard_outputs, overview),
+            )
+            self._merge_callgraphs(overview)
+
+        self._merge_errors()
+        self._merge_metrics()
+        print(
+            f"Merged {len(self.shard_outputs)} shards into {self.output_path}"
+        )
+
+    def _copy_project_details(
+        self, details: list[str], merged_details: str
+    ) -> None:
+        """
+        Copies the detailed results of the projects of every shard (files,
+        or the folders of Parquet partitions).
+        """
+        os.makedirs(merged_details, exist_ok=True)
+        for shard_details in details:
+            for filename in sorted(os.listdir(shard_details)):
+                # Journals of interrupted projects are not results
+                if filename.endswith(".journal"):
+                    continue
+                source = os.path.join(shard_details, filename)
+                target = os.path.join(merged_details, filename)
+                if os.path.exists(target):
+                    raise ValueError(
+                        f"'{filename}' was written by more than one shard."
+                    )
+                if os.path.isdir(source):
+                    shutil.copytree(
+                        source,
+                        target,
+                        ignore=shutil.ignore_patterns("*.journal"),
+                    )
+                else:
+                    shutil.copy2(source, target)
+
+    def _row_positions(
+        self, shard_outputs: list[str], overview: str
+    ) -> list[list[int]] | None:
+        """
+        Returns the position, among all the files of the project, of the
+        file of every row of the overview of each shard, or None (merging
+        the overviews in shard order) if a shard did not journal them.
+        """
+        row_positions = []
+        for shard_output in shard_outputs:
+            positions = []
+            for record in self._journal(shard_output, overview):
+                if "position" not in record:
+                    return None
+                positions += [record["position"]] * record.get("rows", 0)
+            row_positions.append(positions)
+        return row_positions
+
+    @staticmethod
+    def _journal(shard_output: str, overview: str) -> list[dict]:
+        """
+        Returns the files journaled by a shard along its overview (see
+        `ResultSink.record_file`), in the order their rows were written.
+        """
+        records = []
+        journal = ResultSink.journal_path_of(
+            os.path.join(shard_output, overview)
+        )
+        if not os.path.exists(journal):
+            return records
+        with open(journal, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+        return records
+
+    def _merge_callgraphs(self, overview: str) -> None:
+        """
+        Rebuilds the call graph of a single project from the call graph
+        fragments journaled by the shards, if the shards built one. The
+        fragments are put back in the order of the files of the project,
+        as for a single run.
+        """
+        callgraphs = [
+            os.path.join(shard_output, "callgraph.json")
+            for shard_output in self.shard_outputs
+        ]
+        if not any(os.path.exists(path) for path in callgraphs):
+            return
+
+        project_root = None
+        records = []
+        for shard_output, callgraph in zip(self.shard_outputs, callgraphs):
+            if os.path.exists(callgraph):
+                with open(callgraph, encoding="utf-8") as file:
+                    project_root = json.load(file).get("project_root")
+
+            records += [
+                record
+                for record in self._journal(shard_output, overview)
+                if record.get("callgraph") is not None
+            ]
+        # The fragments of a single run are in the order of the files
+        if all("position" in record for record in records):
+            records.sort(key=lambda record: record["position"])
+        fragments = [record["callgraph"] for record in records]
+
+        builder = CallGraphBuilder()
+        path = os.path.join(self.output_path, "callgraph.json")
+        builder.save(builder.build(fragments, project_root=project_root), path)
+        print(f"Call graph saved to {path}")
+
+    def _merge_errors(self) -> None:
+        """
+        Concatenates the errors of the shards.
+        """
+        errors = [
+            os.path.join(shard_output, "error.txt")
+            for shard_output in self.shard_outputs
+            if os.path.exists(os.path.join(shard_output, "error.txt"))
+        ]
+        if not errors:
+            return
+        with open(os.path.join(self.output_path, "error.txt"), "w") as merged:
+            for path in errors:
+                with open(path) as file:
+                    shutil.copyfileobj(file, merged)
+
+    def _merge_metrics(self) -> None:
+        """
+        Combines the run metrics of the shards (see `RunMetrics.combine`).
+        """
+        summaries = []
+        for shard_output in self.shard_outputs:
+            path = os.path.join(shard_output, RunMetrics.FILENAME)
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as file:
+                    summaries.append(json.load(file))
+        if not summaries:
+            return
+
+        slowest_files = max(
+            len(summary.get("slowest_files", [])) for summary in summaries
+        )
+        path = os.path.join(self.output_path, RunMetrics.FILENAME)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                RunMetrics.combine(summaries, slowest_files), file, indent=2
+            )
+        print(f"Run metrics saved to {path}")
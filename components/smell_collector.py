@@ -0,0 +1,141 @@
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class SmellCollector:
+    """
+    Collects detected code smells column by column.
+
+    Appending a smell only extends plain Python lists, so collecting scales
+    linearly with the number of findings. The results are converted to a
+    DataFrame (or streamed row by row) once, when they are exported.
+    """
+
+    COLUMNS = (
+        "filename",
+        "function_name",
+        "smell_name",
+        "line",
+        "description",
+        "additional_info",
+    )
+
+    __slots__ = ("_columns",)
+
+    def __init__(self):
+        """
+        Initializes an empty collector.
+        """
+        self._columns = tuple([] for _ in self.COLUMNS)
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def add(
+        self,
+        filename: str,
+        function_name: str,
+        smell_name: str,
+        line: int,
+        description: str,
+        additional_info: str,
+    ) -> None:
+        """
+        Appends a single smell.
+
+        Parameters:
+        - filename (str): The name of the analyzed file.
+        - function_name (str): The name of the analyzed function.
+        - smell_name (str): The name of the detected smell.
+        - line (int): The line where the smell was detected.
+        - description (str): The description of the smell.
+        - additional_info (str): Additional details about the smell.
+        """
+        values = (
+            filename,
+            function_name,
+            smell_name,
+            line,
+            description,
+            additional_info,
+        )
+        for column, value in zip(self._columns, values):
+            column.append(value)
+
+    def add_smells(
+        self,
+        filename: str,
+        function_name: str,
+        smells: list[dict[str, any]],
+    ) -> None:
+        """
+        Appends the smells detected by a rule in a function.
+
+        Parameters:
+        - filename (str): The name of the analyzed file.
+        - function_name (str): The name of the analyzed function.
+        - smells (list[dict]): The smells, as returned by `Smell.detect`.
+        """
+        for smell in smells:
+            self.add(
+                filename,
+                function_name,
+                smell["name"],
+                smell["line"],
+                smell["description"],
+                smell["additional_info"],
+            )
+
+    def extend(self, other: "SmellCollector") -> None:
+        """
+        Appends all the smells of another collector.
+
+        Parameters:
+        - other (SmellCollector): The collector to append.
+        """
+        for column, values in zip(self._columns, other._columns):
+            column.extend(values)
+
+    def extend_frame(self, df: "pd.DataFrame") -> None:
+        """
+        Appends the rows of a DataFrame of smells.
+        Missing columns are filled with None.
+
+        Parameters:
+        - df (pd.DataFrame): The smells to append.
+        """
+        for name, column in zip(self.COLUMNS, self._columns):
+            if name in df.columns:
+                column.extend(df[name].tolist())
+            else:
+                column.extend([None] * len(df))
+
+    def rows(self) -> Iterator[dict[str, any]]:
+        """
+        Yields the collected smells as dictionaries, in insertion order.
+        """
+        for values in zip(*self._columns):
+            yield dict(zip(self.COLUMNS, values))
+
+    def to_records(self) -> list[tuple]:
+        """
+        Returns the collected smells as tuples of values, in the order
+        of `COLUMNS`.
+        """
+        return list(zip(*self._columns))
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Converts the collected smells to a DataFrame.
+
+        Returns:
+        - pd.DataFrame: The smells, with one column per collected field.
+        """
+        # Pandas is only imported when the smells are exported
+        import pandas as pd
+
+        return pd.DataFrame(
+            dict(zip(self.COLUMNS, self._columns)), columns=self.COLUMNS
+        )
@@ -1,7 +1,6 @@
 import json
 import os
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from components.inspector import Inspector
 
 
@@ -19,7 +18,8 @@ class CodeSmellAnalyzer:
         Args:
             dataset_path (str): Path to the dataset JSON file.
             output_dir (str): Directory to save results.
-            max_workers (int): Maximum number of threads for parallelization.
+            max_workers (int): Maximum number of processes for
+            parallelization.
             log_interval (int): Number of functions
             to process before logging progress.
         """
@@ -105,13 +105,11 @@ class CodeSmellAnalyzer:
 
         # Use cache if the file has already been inspected
         if file_path not in self.file_cache:
-            try:
-                self.file_cache[file_path] = self.inspector.inspect(file_path)
-            except Exception as e:
-                self.logger.error(f"Error analyzing file {file_path}: {e}")
-                return None
+            self.inspect_files([file_path])
 
         results = self.file_cache[file_path]
+        if results is None:
+            return None
         function_smells = results[
             (results["function_name"] == function_data["function_name"])
         ]
@@ -143,43 +141,69 @@ class CodeSmellAnalyzer:
                 "labels": ["No Smell"],
             }
 
+    def inspect_files(self, file_paths):
+        """
+        Inspect files not yet cached with a single batch call, caching
+        the smells of every file (None for files that failed).
+
+        Args:
+            file_paths (list[str]): Paths of the files to inspect.
+        """
+        file_paths = [
+            file_path
+            for file_path in dict.fromkeys(file_paths)
+            if file_path not in self.file_cache
+        ]
+        if not file_paths:
+            return
+
+        smells, _, errors = self.inspector.inspect_many(
+            file_paths, jobs=self.max_workers
+        )
+        by_file = dict(iter(smells.groupby("filename", sort=False)))
+        for file_path in file_paths:
+            if file_path in errors:
+                self.logger.error(
+                    f"Error analyzing file {file_path}: {errors[file_path]}"
+                )
+                self.file_cache[file_path] = None
+            else:
+                self.file_cache[file_path] = by_file.get(
+                    file_path, smells.iloc[0:0]
+                )
+
     def analyze_dataset_parallel(self):
         """
-        Analyze the entire dataset of functions in parallel.
+        Analyze the entire dataset of functions, inspecting the files in
+        parallel.
         """
         self.load_dataset()
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_function = {
-                executor.submit(
-                    self.analyze_function_in_file, function_data
-                ): function_data
-                for function_data in self.dataset
-            }
+        # Every file is inspected once, even if it defines many functions
+        self.inspect_files(
+            function_data["file_path"] for function_data in self.dataset
+        )
 
-            for i, future in enumerate(
-                as_completed(future_to_function), start=1
-            ):
-                function_data = future_to_function[future]
-                try:
-                    result = future.result()
-                    if result is not None:
-                        if "No Smell" in result["labels"]:
-                            self.clean_results.append(result)
-                        else:
-                            self.smelly_results.append(result)
-                except Exception as e:
-                    self.logger.error(
-                        "Error analyzing function "
-                        f"{function_data['function_name']} "
-                        f"in file {function_data['file_path']}: {e}"
-                    )
-
-                # Log progress
-                if i % self.log_interval == 0 or i == len(self.dataset):
-                    self.logger.info(
-                        f"Processed {i}/{len(self.dataset)} functions..."
-                    )
+        for i, function_data in enumerate(self.dataset, start=1):
+            try:
+                result = self.analyze_function_in_file(function_data)
+                if result is not None:
+                    if "No Smell" in result["labels"]:
+                        self.clean_results.append(result)
+                    else:
+                        self.smelly_results.append(result)
+            except Exception as e:
+                self.logger.error(
+                    "Error analyzing function "
+                    f"{function_data['function_name']} "
+                    f"in file {function_data['file_path']}: {e}"
+                )
+
+            # Log progress
+            if i % self.log_interval == 0 or i == len(self.dataset):
+                self.logger.info(
+                    f"Processed {i}/{len(self.dataset)} functions..."
+                )
 
     def save_results(self):
         """
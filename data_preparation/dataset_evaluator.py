@@ -1,7 +1,6 @@
 import os
 import re
 import json
-from matplotlib import pyplot as plt
 import numpy as np
 from components.inspector import Inspector
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -19,8 +18,6 @@ class DatasetEvaluator:
             model_dict_path="obj_dictionaries/models.csv",
             tensor_dict_path="obj_dictionaries/tensors.csv",
         )
-        self.temp_dir = "temp_files"
-        os.makedirs(self.temp_dir, exist_ok=True)
 
     def load_smell_definitions(self, path):
         with open(path, "r", encoding="utf-8") as file:
@@ -44,28 +41,33 @@ class DatasetEvaluator:
 
     def is_valid_syntax_using_inspector(self, code):
         extracted_code = self.extract_python_code(code)
-        temp_file = os.path.join(self.temp_dir, "temp_code.py")
-        with open(temp_file, "w", encoding="utf-8") as f:
-            f.write(extracted_code)
 
+        # Entries are analyzed in memory, without a temporary file
         try:
-            self.inspector.inspect(temp_file)
+            self.inspector.inspect_source(extracted_code, "temp_code.py")
             return True
         except SyntaxError:
             return False
-        finally:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
 
-    def exclude_invalid_syntax(self):
+    def exclude_invalid_syntax(self, jobs=1):
+        # Entries are analyzed with a single batch call
+        _, _, errors = self.inspector.inspect_many(
+            (
+                (f"entry_{i}.py", self.extract_python_code(entry["code"]))
+                for i, entry in enumerate(self.dataset)
+            ),
+            jobs=jobs,
+        )
         valid_entries = []
         invalid_entries = []
-        for entry in self.dataset:
-            code = entry["code"]
-            if self.is_valid_syntax_using_inspector(code):
+        for i, entry in enumerate(self.dataset):
+            error = errors.get(f"entry_{i}.py")
+            if error is None:
                 valid_entries.append(entry)
-            else:
+            elif isinstance(error, SyntaxError):
                 invalid_entries.append(entry)
+            else:
+                raise error
         return valid_entries, invalid_entries
 
     def save_invalid_entries(self, invalid_entries):
@@ -124,6 +126,9 @@ class DatasetEvaluator:
         Traccia un istogramma per visualizzare
         la distribuzione delle similarità.
         """
+        # Matplotlib viene importato solo quando si traccia il grafico
+        from matplotlib import pyplot as plt
+
         # Appiattisci la matrice per considerare
         # solo i valori superiori alla diagonale
         upper_triangle_values = similarity_matrix[np.triu_indices_from(
@@ -13,40 +13,42 @@ class ChainIndexingSmell(Smell):
         df.loc[0, "a"]  # More explicit and efficient
     """
 
+    rule_id = "chain_indexing"
+    node_types = (ast.Subscript,)
+    required_libraries = ("pandas",)
+    required_data = ("dataframe_variables",)
+
     def __init__(self):
         super().__init__(
             name="Chain_Indexing",
             description="Using chain indexing may cause performance issues.",
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Ensure the Pandas library is used
         pandas_alias = extracted_data["libraries"].get("pandas")
         if not pandas_alias:
-            return smells
-
-        dataframe_variables = extracted_data["dataframe_variables"]
-
-        # Traverse the entire AST
-        for node in ast.walk(ast_node):
-            # Check if the node is a chained indexing
-            if (
-                isinstance(node, ast.Subscript)
-                and isinstance(node.value, ast.Subscript)
-                and isinstance(node.value.value, ast.Name)
-                and node.value.value.id in dataframe_variables
-            ):
-                smells.append(
-                    self.format_smell(
-                        line=node.lineno,
-                        additional_info="Chained indexing detected in"
-                        f"variable '{node.value.value.id}'.",
-                    )
+            return None
+
+        return {
+            "smells": [],
+            "dataframe_variables": extracted_data["dataframe_variables"],
+        }
+
+    def visit(self, node: ast.Subscript, state: dict[str, any], traversal):
+        # Check if the node is a chained indexing
+        if (
+            isinstance(node.value, ast.Subscript)
+            and isinstance(node.value.value, ast.Name)
+            and node.value.value.id in state["dataframe_variables"]
+        ):
+            state["smells"].append(
+                self.format_smell(
+                    line=node.lineno,
+                    additional_info="Chained indexing detected in"
+                    f"variable '{node.value.value.id}'.",
                 )
-
-        return smells
+            )
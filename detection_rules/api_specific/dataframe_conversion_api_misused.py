@@ -13,6 +13,11 @@ class DataFrameConversionAPIMisused(Smell):
         Use NumPy arrays or other Pandas methods for conversion.
     """
 
+    rule_id = "dataframe_conversion_api_misused"
+    node_types = (ast.Attribute,)
+    required_libraries = ("pandas",)
+    required_data = ("dataframe_variables",)
+
     def __init__(self):
         super().__init__(
             name="dataframe_conversion_api_misused",
@@ -22,45 +27,46 @@ class DataFrameConversionAPIMisused(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Ensure the Pandas library is used
         pandas_alias = extracted_data["libraries"].get("pandas")
         if not pandas_alias:
-            return smells
+            return None
 
-        dataframe_variables = extracted_data.get("dataframe_variables", [])
-        lines = extracted_data.get("lines", {})
+        return {
+            "smells": [],
+            "dataframe_variables": extracted_data.get(
+                "dataframe_variables", []
+            ),
+            "lines": extracted_data.get("lines", {}),
+        }
 
-        # Traverse the AST
-        for node in ast.walk(ast_node):
-            if (
-                isinstance(node, ast.Attribute)
-                and node.attr == "values"  # Check for the `values` attribute
-                and isinstance(node.value, ast.Name)
-                and node.value.id in dataframe_variables
-            ):
-                # Extract the offending line for additional context
-                code_snippet = lines.get(node.lineno, "<Code not available>")
-                smells.append(
-                    self.format_smell(
-                        line=node.lineno,
-                        additional_info=(
-                            f"Misuse of the 'values' attribute"
-                            "detected in variable "
-                            f"'{node.value.id}'. Please consider"
-                            "using NumPy or explicit "
-                            "methods instead of `values`"
-                            " for DataFrame conversion. The "
-                            "function 'values' is deprecated and its"
-                            " return type is unclear. "
-                            f"Code: {code_snippet}"
-                        ),
-                    )
+    def visit(self, node: ast.Attribute, state: dict[str, any], traversal):
+        if (
+            node.attr == "values"  # Check for the `values` attribute
+            and isinstance(node.value, ast.Name)
+            and node.value.id in state["dataframe_variables"]
+        ):
+            # Extract the offending line for additional context
+            code_snippet = state["lines"].get(
+                node.lineno, "<Code not available>"
+            )
+            state["smells"].append(
+                self.format_smell(
+                    line=node.lineno,
+                    additional_info=(
+                        f"Misuse of the 'values' attribute"
+                        "detected in variable "
+                        f"'{node.value.id}'. Please consider"
+                        "using NumPy or explicit "
+                        "methods instead of `values`"
+                        " for DataFrame conversion. The "
+                        "function 'values' is deprecated and its"
+                        " return type is unclear. "
+                        f"Code: {code_snippet}"
+                    ),
                 )
-
-        return smells
+            )
@@ -15,6 +15,12 @@ class GradientsNotClearedSmell(Smell):
         optimizer.backward()  # Proper sequence
     """
 
+    rule_id = "gradients_not_cleared_before_backward_propagation"
+    cost = "medium"
+    node_types = (ast.For, ast.While, ast.Call)
+    required_libraries = ("torch",)
+    required_data = ("variables",)
+
     def __init__(self):
         super().__init__(
             name="gradients_not_cleared_before_backward_propagation",
@@ -24,60 +30,68 @@ class GradientsNotClearedSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Ensure the Torch library is used
         torch_alias = extracted_data["libraries"].get("torch")
         if not torch_alias:
-            return smells
+            return None
 
-        lines = extracted_data.get("lines", {})
+        # Each loop (for/while) tracks whether `zero_grad` has been called
+        # so far inside it and the smells found in its body, since every
+        # call is evaluated against all of its enclosing loops.
+        return {
+            "lines": extracted_data.get("lines", {}),
+            "variables": extracted_data["variables"],
+            "loops": {},
+        }
 
-        variables = extracted_data["variables"]
+    def visit(self, node: ast.AST, state: dict[str, any], traversal):
+        if isinstance(node, (ast.For, ast.While)):
+            state["loops"][node] = {"zero_grad_called": False, "smells": []}
+            return
 
-        # Traverse the AST to detect improper usage of gradients
-        for node in ast.walk(ast_node):
-            if isinstance(
-                node, (ast.For, ast.While)
-            ):  # Look for loops (for/while)
-                zero_grad_called = False
+        if not (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr in {"zero_grad", "backward"}
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id in state["variables"]
+        ):
+            return
 
-                for subnode in ast.walk(node):
-                    if isinstance(subnode, ast.Call) and isinstance(
-                        subnode.func, ast.Attribute
-                    ):
-                        # Detect `zero_grad` calls
-                        if (
-                            subnode.func.attr == "zero_grad"
-                            and isinstance(subnode.func.value, ast.Name)
-                            and subnode.func.value.id in variables
-                        ):
-                            zero_grad_called = True
+        for ancestor in traversal.enclosing_loops(node):
+            loop = state["loops"].get(ancestor)
+            if loop is None:
+                continue
 
-                        # Detect `backward` calls
-                        if (
-                            subnode.func.attr == "backward"
-                            and isinstance(subnode.func.value, ast.Name)
-                            and subnode.func.value.id
-                            in extracted_data["variables"]
-                            and not zero_grad_called
-                        ):
-                            # Extract the offending line for additional context
-                            code_snippet = lines.get(
-                                subnode.lineno, "<Code not available>"
-                            )
-                            smells.append(
-                                self.format_smell(
-                                    line=subnode.lineno,
-                                    additional_info=(
-                                        f"`zero_grad()` not called before"
-                                        " `backward()` in loop. "
-                                        f"Code: {code_snippet}"
-                                    ),
-                                )
-                            )
-        return smells
+            # Detect `zero_grad` calls
+            if node.func.attr == "zero_grad":
+                loop["zero_grad_called"] = True
+
+            # Detect `backward` calls
+            elif not loop["zero_grad_called"]:
+                # Extract the offending line for additional context
+                code_snippet = state["lines"].get(
+                    node.lineno, "<Code not available>"
+                )
+                loop["smells"].append(
+                    self.format_smell(
+                        line=node.lineno,
+                        additional_info=(
+                            f"`zero_grad()` not called before"
+                            " `backward()` in loop. "
+                            f"Code: {code_snippet}"
+                        ),
+                    )
+                )
+
+    def finish(
+        self, state: dict[str, any], traversal
+    ) -> list[dict[str, any]]:
+        return [
+            smell
+            for loop in state["loops"].values()
+            for smell in loop["smells"]
+        ]
@@ -14,6 +14,10 @@ class MatrixMultiplicationAPIMisused(Smell):
         np.matmul([[1, 2], [3, 4]], [[5, 6], [7, 8]])
     """
 
+    rule_id = "matrix_multiplication_api_misused"
+    node_types = (ast.Call,)
+    required_libraries = ("numpy",)
+
     def __init__(self):
         super().__init__(
             name="matrix_multiplication_api_misused",
@@ -21,46 +25,47 @@ class MatrixMultiplicationAPIMisused(Smell):
             " is discouraged. Use `np.matmul` instead.",
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Ensure NumPy library is used
         numpy_alias = extracted_data["libraries"].get("numpy")
         if not numpy_alias:
-            return smells
+            return None
 
-        lines = extracted_data.get("lines", {})
+        return {
+            "smells": [],
+            "numpy_alias": numpy_alias,
+            "lines": extracted_data.get("lines", {}),
+        }
 
-        for node in ast.walk(ast_node):
-            if isinstance(node, ast.Call) and isinstance(
-                node.func, ast.Attribute
-            ):
-                # Check if `dot` is called using the NumPy alias
-                if (
-                    node.func.attr == "dot"
-                    and isinstance(node.func.value, ast.Name)
-                    and node.func.value.id == numpy_alias
-                ):
-                    # Check if the `dot()` call arguments involve matrices
-                    if self._is_matrix_multiplication(node):
-                        code_snippet = lines.get(
-                            node.lineno, "<Code not available>"
-                        )
-                        smells.append(
-                            self.format_smell(
-                                line=node.lineno,
-                                additional_info=(
-                                    f"Detected misuse of `dot()`"
-                                    " for matrix multiplication. "
-                                    f"Consider using `np.matmul` instead. "
-                                    f"Code: {code_snippet}"
-                                ),
-                            )
-                        )
-        return smells
+    def visit(self, node: ast.Call, state: dict[str, any], traversal):
+        if not isinstance(node.func, ast.Attribute):
+            return
+
+        # Check if `dot` is called using the NumPy alias
+        if (
+            node.func.attr == "dot"
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == state["numpy_alias"]
+        ):
+            # Check if the `dot()` call arguments involve matrices
+            if self._is_matrix_multiplication(node):
+                code_snippet = state["lines"].get(
+                    node.lineno, "<Code not available>"
+                )
+                state["smells"].append(
+                    self.format_smell(
+                        line=node.lineno,
+                        additional_info=(
+                            f"Detected misuse of `dot()`"
+                            " for matrix multiplication. "
+                            f"Consider using `np.matmul` instead. "
+                            f"Code: {code_snippet}"
+                        ),
+                    )
+                )
 
     def _is_matrix_multiplication(self, node: ast.Call) -> bool:
         """
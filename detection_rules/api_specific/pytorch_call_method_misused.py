@@ -13,6 +13,11 @@ class PyTorchCallMethodMisusedSmell(Smell):
         self.net(x)  # Use the model's instance directly.
     """
 
+    rule_id = "pytorch_call_method_misused"
+    node_types = (ast.Call,)
+    required_libraries = ("torch",)
+    required_data = ("variables",)
+
     def __init__(self):
         super().__init__(
             name="pytorch_call_method_misused",
@@ -22,50 +27,52 @@ class PyTorchCallMethodMisusedSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Find all aliases associated with PyTorch
         torch_aliases = extracted_data["libraries"].get("torch")
         if not torch_aliases:
-            return smells
+            return None
+
+        return {
+            "smells": [],
+            "variable_names": set(extracted_data["variables"].keys()),
+        }
 
-        variable_names = set(extracted_data["variables"].keys())
+    def visit(self, node: ast.Call, state: dict[str, any], traversal):
+        if not (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr == "forward"
+        ):
+            return
 
-        for node in ast.walk(ast_node):
-            if (
-                isinstance(node, ast.Call)
-                and isinstance(node.func, ast.Attribute)
-                and node.func.attr == "forward"
-            ):
-                base_name = self._get_base_name(node.func.value)
+        base_name = self._get_base_name(node.func.value)
 
-                # Case 1: Call on `self`
-                if base_name == "self":
-                    smells.append(
-                        self.format_smell(
-                            line=node.lineno,
-                            additional_info=(
-                                "Direct call to `self.forward()` detected. "
-                                "Use the model instance directly instead."
-                            ),
-                        )
-                    )
-                # Case 2: Call on a variable associated with PyTorch models
-                elif base_name in variable_names:
-                    smells.append(
-                        self.format_smell(
-                            line=node.lineno,
-                            additional_info=(
-                                f"Direct call to `{base_name}.forward()` "
-                                "detected. Use the model instance "
-                                "directly instead."
-                            ),
-                        )
-                    )
-        return smells
+        # Case 1: Call on `self`
+        if base_name == "self":
+            state["smells"].append(
+                self.format_smell(
+                    line=node.lineno,
+                    additional_info=(
+                        "Direct call to `self.forward()` detected. "
+                        "Use the model instance directly instead."
+                    ),
+                )
+            )
+        # Case 2: Call on a variable associated with PyTorch models
+        elif base_name in state["variable_names"]:
+            state["smells"].append(
+                self.format_smell(
+                    line=node.lineno,
+                    additional_info=(
+                        f"Direct call to `{base_name}.forward()` "
+                        "detected. Use the model instance "
+                        "directly instead."
+                    ),
+                )
+            )
 
     def _get_base_name(self, node):
         """
@@ -8,6 +8,11 @@ class TensorArrayNotUsedSmell(Smell):
     instead of `tf.TensorArray` in TensorFlow.
     """
 
+    rule_id = "tensor_array_not_used"
+    cost = "medium"
+    node_types = (ast.Assign,)
+    required_libraries = ("tensorflow",)
+
     def __init__(self):
         super().__init__(
             name="tensor_array_not_used",
@@ -19,70 +24,76 @@ class TensorArrayNotUsedSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Check for TensorFlow library alias
         tensorflow_alias = extracted_data["libraries"].get("tensorflow")
         if not tensorflow_alias:
-            return smells
-
-        # Track tensor variables initialized with `tf.constant`
-        tensor_constants = set()
-        # First Pass: Detect `tf.constant` assignments and track the variable
-        for node in ast.walk(ast_node):
-            if isinstance(node, ast.Assign) and isinstance(
-                node.value, ast.Call
-            ):
-                if (
-                    hasattr(node.value.func, "attr")
-                    and node.value.func.attr == "constant"
-                    and hasattr(node.value.func.value, "id")
-                    and node.value.func.value.id == tensorflow_alias
-                ):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name):
-                            tensor_constants.add(target.id)
-
-        # Second Pass: Check if the tracked tensor is modified inside a loop
-        for node in ast.walk(ast_node):
-            if isinstance(node, ast.Assign) and isinstance(
-                node.value, ast.Call
-            ):
-                # Detect `tf.concat` calls
-                if (
-                    hasattr(node.value.func, "attr")
-                    and node.value.func.attr == "concat"
-                    and hasattr(node.value.func.value, "id")
-                    and node.value.func.value.id == tensorflow_alias
-                ):
-
-                    # Extract the tensor names from `tf.concat` arguments
-                    concat_arguments = self._extract_tensor_names_from_concat(
-                        node.value
-                    )
+            return None
+
+        return {
+            "tensorflow_alias": tensorflow_alias,
+            # Tensor variables initialized with `tf.constant`
+            "tensor_constants": set(),
+            # Assignments from `tf.concat`, checked once all the
+            # constants of the function are known
+            "concat_assignments": [],
+        }
+
+    def visit(self, node: ast.Assign, state: dict[str, any], traversal):
+        if not isinstance(node.value, ast.Call):
+            return
+
+        if not (
+            hasattr(node.value.func, "attr")
+            and hasattr(node.value.func.value, "id")
+            and node.value.func.value.id == state["tensorflow_alias"]
+        ):
+            return
+
+        # Detect `tf.constant` assignments and track the variable
+        if node.value.func.attr == "constant":
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    state["tensor_constants"].add(target.id)
+
+        # Detect `tf.concat` calls
+        elif node.value.func.attr == "concat":
+            state["concat_assignments"].append(node)
+
+    def finish(
+        self, state: dict[str, any], traversal
+    ) -> list[dict[str, any]]:
+        smells = []
 
-                    # Filter out the constants that
-                    # are being modified by `tf.concat`
-                    modified_tensors = [
-                        var
-                        for var in concat_arguments
-                        if var in tensor_constants
-                    ]
-
-                    # Smell is only valid if inside a loop
-                    if modified_tensors and self._is_in_loop(node, ast_node):
-                        smells.append(
-                            self.format_smell(
-                                line=node.lineno,
-                                additional_info=(
-                                    "Using `tf.TensorArray` is better"
-                                    " for dynamically growing arrays."
-                                ),
-                            )
-                        )
+        # Check if the tracked tensor is modified inside a loop
+        for node in state["concat_assignments"]:
+            # Extract the tensor names from `tf.concat` arguments
+            concat_arguments = self._extract_tensor_names_from_concat(
+                node.value
+            )
+
+            # Filter out the constants that
+            # are being modified by `tf.concat`
+            modified_tensors = [
+                var
+                for var in concat_arguments
+                if var in state["tensor_constants"]
+            ]
+
+            # Smell is only valid if inside a loop
+            if modified_tensors and traversal.in_loop(node):
+                smells.append(
+                    self.format_smell(
+                        line=node.lineno,
+                        additional_info=(
+                            "Using `tf.TensorArray` is better"
+                            " for dynamically growing arrays."
+                        ),
+                    )
+                )
 
         return smells
 
@@ -117,25 +128,3 @@ class TensorArrayNotUsedSmell(Smell):
         if isinstance(node.func, ast.Name):
             return node.func.id
         return ""
-
-    def _is_in_loop(self, node: ast.AST, root_node: ast.AST) -> bool:
-        current = node
-        while current:
-            parent = self._find_parent_node(current, root_node)
-            if isinstance(
-                parent, (ast.For, ast.While)
-            ):  # Ensure loop is recognized
-
-                return True
-            current = parent
-        return False
-
-    def _find_parent_node(self, node: ast.AST, root_node: ast.AST) -> ast.AST:
-        """
-        Finds the parent node of a given node within the AST.
-        """
-        for parent in ast.walk(root_node):
-            for child in ast.iter_child_nodes(parent):
-                if child == node:
-                    return parent
-        return None
@@ -19,6 +19,10 @@ class BroadcastingFeatureNotUsedSmell(Smell):
         tensor_c = tensor_a + tensor_b  # Broadcasting applied
     """
 
+    rule_id = "broadcasting_feature_not_used"
+    node_types = (ast.Assign, ast.BinOp)
+    required_libraries = ("tensorflow",)
+
     def __init__(self):
         super().__init__(
             name="Broadcasting_Feature_Not_Used",
@@ -30,97 +34,91 @@ class BroadcastingFeatureNotUsedSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Check for TensorFlow library
         tensorflow_alias = extracted_data["libraries"].get("tensorflow", None)
         if not tensorflow_alias:
-            return smells
+            return None
 
-        # Identify variables created by tf.tile
-        tiled_variables = self._tensor_check_tiling(ast_node, tensorflow_alias)
+        return {
+            "tensorflow_alias": tensorflow_alias,
+            # Variables created by tf.tile, mapped to their AST nodes
+            "tiled_variables": {},
+            # Arithmetic operations, checked once all the
+            # tiled variables of the function are known
+            "operations": [],
+        }
 
-        # Check for arithmetic operations involving tiled variables
-        smells.extend(self._check_broadcasting(ast_node, tiled_variables))
+    def visit(self, node: ast.AST, state: dict[str, any], traversal):
+        if isinstance(node, ast.BinOp):
+            # Arithmetic operation (e.g., +, -, *, /)
+            state["operations"].append(node)
+        elif (
+            isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and node.value.func.attr == "tile"
+            and getattr(node.value.func.value, "id", None)
+            == state["tensorflow_alias"]
+        ):
+            if isinstance(node.targets[0], ast.Name):
+                state["tiled_variables"][node.targets[0].id] = node
 
-        return smells
-
-    def _tensor_check_tiling(
-        self, fun_node: ast.AST, tensorflow_alias: str
-    ) -> dict:
-        """
-        Identifies tensor variables that have undergone tiling operations.
-
-        :param fun_node: The AST node representing the function.
-        :param tensorflow_alias: Alias used for
-               TensorFlow in the code (e.g., "tf").
-        :return: Dictionary mapping tiled variable names to their AST nodes.
-        """
-        tiled_variables = {}
-        for node in ast.walk(fun_node):
-            if (
-                isinstance(node, ast.Assign)
-                and isinstance(node.value, ast.Call)
-                and isinstance(node.value.func, ast.Attribute)
-                and node.value.func.attr == "tile"
-                and getattr(node.value.func.value, "id", None)
-                == tensorflow_alias
-            ):
-                if isinstance(node.targets[0], ast.Name):
-                    tiled_variables[node.targets[0].id] = node
-        return tiled_variables
+    def finish(
+        self, state: dict[str, any], traversal
+    ) -> list[dict[str, any]]:
+        # Check for arithmetic operations involving tiled variables
+        return self._check_broadcasting(
+            state["operations"], state["tiled_variables"]
+        )
 
     def _check_broadcasting(
-        self, fun_node: ast.AST, tiled_variables: dict
+        self, operations: list[ast.BinOp], tiled_variables: dict
     ) -> list[dict]:
         smells = []
-        for node in ast.walk(fun_node):
-            if isinstance(
-                node, ast.BinOp
-            ):  # Arithmetic operation (e.g., +, -, *, /)
-                # Check for tiled variables
-                if (
-                    isinstance(node.left, ast.Name)
-                    and node.left.id in tiled_variables
-                ) or (
-                    isinstance(node.right, ast.Name)
-                    and node.right.id in tiled_variables
-                ):
-                    variable_name = (
-                        node.left.id
-                        if isinstance(node.left, ast.Name)
-                        else node.right.id
-                    )
-                    smells.append(
-                        self.format_smell(
-                            line=node.lineno,
-                            additional_info=(
-                                f"Variable '{variable_name}' involves "
-                                "unnecessary tiling. "
-                                "Consider using broadcasting instead."
-                            ),
-                        )
+        for node in operations:
+            # Check for tiled variables
+            if (
+                isinstance(node.left, ast.Name)
+                and node.left.id in tiled_variables
+            ) or (
+                isinstance(node.right, ast.Name)
+                and node.right.id in tiled_variables
+            ):
+                variable_name = (
+                    node.left.id
+                    if isinstance(node.left, ast.Name)
+                    else node.right.id
+                )
+                smells.append(
+                    self.format_smell(
+                        line=node.lineno,
+                        additional_info=(
+                            f"Variable '{variable_name}' involves "
+                            "unnecessary tiling. "
+                            "Consider using broadcasting instead."
+                        ),
                     )
-                # Check for inline tf.tile calls
-                elif (
-                    isinstance(node.left, ast.Call)
-                    and self._is_tile_call(node.left)
-                ) or (
-                    isinstance(node.right, ast.Call)
-                    and self._is_tile_call(node.right)
-                ):
-                    smells.append(
-                        self.format_smell(
-                            line=node.lineno,
-                            additional_info=(
-                                "Inline use of `tf.tile` detected. "
-                                "Consider using broadcasting instead."
-                            ),
-                        )
+                )
+            # Check for inline tf.tile calls
+            elif (
+                isinstance(node.left, ast.Call)
+                and self._is_tile_call(node.left)
+            ) or (
+                isinstance(node.right, ast.Call)
+                and self._is_tile_call(node.right)
+            ):
+                smells.append(
+                    self.format_smell(
+                        line=node.lineno,
+                        additional_info=(
+                            "Inline use of `tf.tile` detected. "
+                            "Consider using broadcasting instead."
+                        ),
                     )
+                )
         return smells
 
     def _is_tile_call(self, node: ast.Call) -> bool:
@@ -16,6 +16,10 @@ class ColumnsAndDatatypeNotExplicitlySetSmell(Smell):
         pd.read_csv("file.csv", dtype={"column1": "int", "column2": "float"})
     """
 
+    rule_id = "columns_and_datatype_not_explicitly_set"
+    node_types = (ast.Call,)
+    required_libraries = ("pandas",)
+
     def __init__(self):
         super().__init__(
             name="columns_and_datatype_not_explicitly_set",
@@ -25,54 +29,53 @@ class ColumnsAndDatatypeNotExplicitlySetSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Ensure Pandas library is used
         pandas_alias = extracted_data["libraries"].get("pandas")
         if not pandas_alias:
-            return smells
+            return None
 
-        # Traverse AST to find calls to DataFrame or read_csv
-        for node in ast.walk(ast_node):
-            if (
-                isinstance(node, ast.Call)
-                and hasattr(node.func, "attr")
-                and node.func.attr
-                in {"DataFrame", "read_csv"}  # Specific methods to check
-                and hasattr(node.func.value, "id")
-                and node.func.value.id == pandas_alias
-            ):
-                # Check for missing or incomplete keyword arguments
-                if not hasattr(node, "keywords") or not node.keywords:
-                    smells.append(
-                        self.format_smell(
-                            line=node.lineno,
-                            additional_info=(
-                                "Missing explicit 'dtype'"
-                                f"in {node.func.attr} call."
-                            ),
-                        )
-                    )
-                else:
-                    # Check if 'dtype' is explicitly set
-                    has_dtype = any(
-                        kw.arg == "dtype"
-                        for kw in node.keywords
-                        if isinstance(kw, ast.keyword)
-                    )
-                    if not has_dtype:
-                        smells.append(
-                            self.format_smell(
-                                line=node.lineno,
-                                additional_info=(
-                                    "'dtype' not explicitly set"
-                                    f"in {node.func.attr} call."
-                                ),
-                            )
-                        )
+        return {"smells": [], "pandas_alias": pandas_alias}
+
+    def visit(self, node: ast.Call, state: dict[str, any], traversal):
+        # Find calls to DataFrame or read_csv
+        if not (
+            hasattr(node.func, "attr")
+            and node.func.attr
+            in {"DataFrame", "read_csv"}  # Specific methods to check
+            and hasattr(node.func.value, "id")
+            and node.func.value.id == state["pandas_alias"]
+        ):
+            return
 
-        return smells
+        # Check for missing or incomplete keyword arguments
+        if not hasattr(node, "keywords") or not node.keywords:
+            state["smells"].append(
+                self.format_smell(
+                    line=node.lineno,
+                    additional_info=(
+                        "Missing explicit 'dtype'"
+                        f"in {node.func.attr} call."
+                    ),
+                )
+            )
+        else:
+            # Check if 'dtype' is explicitly set
+            has_dtype = any(
+                kw.arg == "dtype"
+                for kw in node.keywords
+                if isinstance(kw, ast.keyword)
+            )
+            if not has_dtype:
+                state["smells"].append(
+                    self.format_smell(
+                        line=node.lineno,
+                        additional_info=(
+                            "'dtype' not explicitly set"
+                            f"in {node.func.attr} call."
+                        ),
+                    )
+                )
@@ -15,6 +15,10 @@ class DeterministicAlgorithmOptionSmell(Smell):
         Avoid using this option unless determinism is strictly required.
     """
 
+    rule_id = "deterministic_algorithm_option_not_used"
+    node_types = (ast.Call,)
+    required_libraries = ("torch",)
+
     def __init__(self):
         super().__init__(
             name="deterministic_algorithm_option_not_used",
@@ -26,68 +30,38 @@ class DeterministicAlgorithmOptionSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
-
-        # Retrieve libraries and alias mapping
-        libraries = extracted_data.get("libraries", {})
-
-        # Traverse AST to detect calls to `use_deterministic_algorithms`
-        for node in ast.walk(ast_node):
-            if isinstance(node, ast.Call):
-                # Extract the full function name
-                func_name = self._get_full_function_name(node.func, libraries)
+    ) -> dict[str, any] | None:
 
-                # Match the function name with the target method
-                if func_name in [
-                    "torch.use_deterministic_algorithms",
-                    "use_deterministic_algorithms",
-                ]:
-                    if (
-                        len(node.args) == 1
-                        and isinstance(node.args[0], ast.Constant)
-                        and node.args[0].value is True
-                    ):
-                        smells.append(
-                            self.format_smell(
-                                line=node.lineno,
-                                additional_info=(
-                                    f"Using `{func_name}(True)` detected."
-                                    "Avoid for performance."
-                                ),
-                            )
-                        )
+        # Retrieve the names bound by the imports
+        return {
+            "smells": [],
+            "library_by_alias": self.library_by_alias(extracted_data),
+        }
 
-        return smells
-
-    def _get_full_function_name(self, func: ast.AST, libraries: dict) -> str:
-        """
-        Extracts the full name of a function or method from an AST node,
-        handling library aliases.
-
-        Parameters:
-        - func: The AST node representing the function or method.
-        - libraries: Dictionary of library aliases from extracted_data.
-
-        Returns:
-        - str: The full name of the function
-          (e.g., "torch.use_deterministic_algorithms").
-        """
-        names = []
-        while isinstance(func, ast.Attribute):
-            names.append(func.attr)
-            func = func.value
+    def visit(self, node: ast.Call, state: dict[str, any], traversal):
+        # Extract the full function name
+        func_name = traversal.qualified_name(
+            node.func, state["library_by_alias"]
+        )
 
-        if isinstance(func, ast.Name):
-            # Handle aliases for libraries
-            if func.id in libraries.values():
-                alias = next(
-                    key for key, value in libraries.items() if value == func.id
+        # Match the function name with the target method
+        if func_name in [
+            "torch.use_deterministic_algorithms",
+            "use_deterministic_algorithms",
+        ]:
+            if (
+                len(node.args) == 1
+                and isinstance(node.args[0], ast.Constant)
+                and node.args[0].value is True
+            ):
+                state["smells"].append(
+                    self.format_smell(
+                        line=node.lineno,
+                        additional_info=(
+                            f"Using `{func_name}(True)` detected."
+                            "Avoid for performance."
+                        ),
+                    )
                 )
-                names.append(alias)
-            else:
-                names.append(func.id)
-        return ".".join(reversed(names))
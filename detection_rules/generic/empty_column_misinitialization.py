@@ -17,6 +17,11 @@ class EmptyColumnMisinitializationSmell(Smell):
         # Use NaN for better handling of empty values.
     """
 
+    rule_id = "empty_column_misinitialization"
+    node_types = (ast.Assign,)
+    required_libraries = ("pandas",)
+    required_data = ("dataframe_variables",)
+
     def __init__(self):
         super().__init__(
             name="empty_column_misinitialization",
@@ -27,51 +32,51 @@ class EmptyColumnMisinitializationSmell(Smell):
             ),
         )
 
-    def detect(self, ast_node: ast.AST, extracted_data: dict[str, any]
-               ) -> list[dict[str, any]]:
-        smells = []
+    def start(
+        self, ast_node: ast.AST, extracted_data: dict[str, any]
+    ) -> dict[str, any] | None:
 
         # Ensure Pandas library is used
         pandas_alias = extracted_data["libraries"].get("pandas")
         if not pandas_alias:
-            return smells
+            return None
 
         # Ensure dataframe_variables is always a list
         dataframe_variables = extracted_data.get("dataframe_variables", [])
         if dataframe_variables is None:
             dataframe_variables = []
 
-        # Traversing AST nodes to detect smells
-        for node in ast.walk(ast_node):
-            if (
-                isinstance(node, ast.Assign)  # An assignment statement
-                and len(node.targets) == 1  # Single assignment target
-                and isinstance(node.targets[0], ast.Subscript)
-                and isinstance(node.targets[0].value, ast.Name)
-                and node.targets[0].value.id in dataframe_variables
-            ):
-                # Check the assigned value
-                assigned_value = node.value
-                if isinstance(assigned_value, ast.Constant):
-                    if assigned_value.value in {0, ""}:
-                        # Safely access the column name (slice value)
-                        column_name = None
-                        if isinstance(node.targets[0].slice, ast.Constant):
-                            column_name = node.targets[0].slice.value
-                            if column_name:
-                                smells.append(
-                                    self.format_smell(
-                                        line=node.lineno,
-                                        additional_info=(
-                                            "Column "
-                                            f"'{node.targets[0].slice.value}' "
-                                            "in DataFrame "
-                                            f"'{node.targets[0].value.id}' "
-                                            "is initialized with a zero or "
-                                            "an empty string. "
-                                            "Consider using NaN instead."
-                                        ),
-                                    )
-                                )
+        return {"smells": [], "dataframe_variables": dataframe_variables}
+
+    def visit(self, node: ast.Assign, state: dict[str, any], traversal):
+        if not (
+            len(node.targets) == 1  # Single assignment target
+            and isinstance(node.targets[0], ast.Subscript)
+            and isinstance(node.targets[0].value, ast.Name)
+            and node.targets[0].value.id in state["dataframe_variables"]
+        ):
+            return
 
-        return smells
+        # Check the assigned value
+        assigned_value = node.value
+        if isinstance(assigned_value, ast.Constant):
+            if assigned_value.value in {0, ""}:
+                # Safely access the column name (slice value)
+                column_name = None
+                if isinstance(node.targets[0].slice, ast.Constant):
+                    column_name = node.targets[0].slice.value
+                    if column_name:
+                        state["smells"].append(
+                            self.format_smell(
+                                line=node.lineno,
+                                additional_info=(
+                                    "Column "
+                                    f"'{node.targets[0].slice.value}' "
+                                    "in DataFrame "
+                                    f"'{node.targets[0].value.id}' "
+                                    "is initialized with a zero or "
+                                    "an empty string. "
+                                    "Consider using NaN instead."
+                                ),
+                            )
+                        )
@@ -14,6 +14,13 @@ class HyperparametersNotExplicitlySetSmell(Smell):
         model = Model(hyperparameter=value)  # Explicitly set hyperparameters
     """
 
+    rule_id = "hyperparameters_not_explicitly_set"
+    node_types = (ast.Call,)
+
+    # The libraries of the model dictionary (obj_dictionaries/models.csv)
+    required_libraries = ("tensorflow", "sklearn", "torch", "keras")
+    required_data = ("model_methods",)
+
     def __init__(self):
         super().__init__(
             name="hyperparameters_not_explicitly_set",
@@ -22,74 +29,53 @@ class HyperparametersNotExplicitlySetSmell(Smell):
                 "models to ensure clarity and reproducibility."
             ),
         )
+        # Normalized model methods, with the list they were computed from
+        self._model_methods = None
+        self._normalized_model_methods = frozenset()
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Retrieve model methods and libraries
         model_methods = extracted_data.get("model_methods", [])
         libraries = extracted_data.get("libraries", {})
 
         if not libraries:
-            return smells
-
-        # Normalize model method names (remove '()' if present)
-        normalized_model_methods = [
-            method.replace("()", "") for method in model_methods
-        ]
-
-        # Traverse AST to find calls to model definitions
-        for node in ast.walk(ast_node):
-            if isinstance(node, ast.Call):
-                # Extract the full function name
-                func_name = self._get_full_function_name(node.func, libraries)
-
-                # Match the function name with normalized methods
-                base_func_name = func_name.split(".")[-1]
-                if base_func_name in normalized_model_methods:
-                    if not node.args and not getattr(node, "keywords", None):
-                        smells.append(
-                            self.format_smell(
-                                line=node.lineno,
-                                additional_info=(
-                                    f"Hyperparameters not explicitly "
-                                    f"set for model '{func_name}'. "
-                                    "Consider defining key "
-                                    "hyperparameters for clarity."
-                                ),
-                            )
-                        )
-
-        return smells
-
-    def _get_full_function_name(self, func: ast.AST, libraries: dict) -> str:
-        """
-        Extracts the full name of a function or method from
-        an AST node, handling library aliases.
-
-        Parameters:
-        - func: The AST node representing the function or method.
-        - libraries: Dictionary of library aliases from extracted_data.
-
-        Returns:
-        - str: The full name of the function
-          (e.g., "sklearn.ensemble.RandomForestClassifier").
-        """
-        names = []
-        while isinstance(func, ast.Attribute):
-            names.append(func.attr)
-            func = func.value
+            return None
+
+        # Normalize model method names (remove '()' if present), once for
+        # all the files sharing the same dictionary
+        if model_methods is not self._model_methods:
+            self._model_methods = model_methods
+            self._normalized_model_methods = frozenset(
+                method.replace("()", "") for method in model_methods
+            )
+
+        return {
+            "smells": [],
+            "library_by_alias": self.library_by_alias(extracted_data),
+            "model_methods": self._normalized_model_methods,
+        }
+
+    def visit(self, node: ast.Call, state: dict[str, any], traversal):
+        # Extract the full function name
+        func_name = traversal.qualified_name(
+            node.func, state["library_by_alias"]
+        )
 
-        if isinstance(func, ast.Name):
-            # Handle aliases for libraries
-            if func.id in libraries.values():
-                alias = next(
-                    key for key, value in libraries.items() if value == func.id
+        # Match the function name with normalized methods
+        base_func_name = func_name.split(".")[-1]
+        if base_func_name in state["model_methods"]:
+            if not node.args and not getattr(node, "keywords", None):
+                state["smells"].append(
+                    self.format_smell(
+                        line=node.lineno,
+                        additional_info=(
+                            f"Hyperparameters not explicitly "
+                            f"set for model '{func_name}'. "
+                            "Consider defining key "
+                            "hyperparameters for clarity."
+                        ),
+                    )
                 )
-                names.append(alias)
-            else:
-                names.append(func.id)
-        return ".".join(reversed(names))
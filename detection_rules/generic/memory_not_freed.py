@@ -19,6 +19,11 @@ class MemoryNotFreedSmell(Smell):
             tf.keras.backend.clear_session()  # Free memory explicitly
     """
 
+    rule_id = "memory_not_freed"
+    cost = "medium"
+    node_types = (ast.For, ast.While, ast.Call)
+    required_libraries = ("tensorflow",)
+
     def __init__(self):
         super().__init__(
             name="memory_not_freed",
@@ -30,39 +35,61 @@ class MemoryNotFreedSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Ensure TensorFlow is imported
         tensorflow_alias = extracted_data["libraries"].get("tensorflow")
         if not tensorflow_alias:
-            return smells
-
-        model_methods = ["Sequential", "Model"]
-
-        # Identify loops in the AST
-        loop_nodes = [
-            node
-            for node in ast.walk(ast_node)
-            if isinstance(node, (ast.For, ast.While))
-        ]
-
-        for loop_node in loop_nodes:
-
-            # Check if a model is defined in the loop
-            model_defined = self._is_model_defined_in_loop(
-                loop_node, tensorflow_alias, model_methods
-            )
-
-            # Check if memory is freed with clear_session
-            memory_freed = self._is_memory_freed_in_loop(
-                loop_node, tensorflow_alias
-            )
+            return None
+
+        # Each loop tracks whether a model is defined in it and
+        # whether memory is freed with clear_session
+        return {
+            "tensorflow_alias": tensorflow_alias,
+            "model_methods": ["Sequential", "Model"],
+            "loops": {},
+        }
+
+    def visit(self, node: ast.AST, state: dict[str, any], traversal):
+        if isinstance(node, (ast.For, ast.While)):
+            state["loops"][node] = {
+                "model_defined": False,
+                "memory_freed": False,
+            }
+            return
+
+        tensorflow_alias = state["tensorflow_alias"]
+
+        # Check if any model is being defined using any of the
+        # model methods (e.g., Sequential, Model, etc.)
+        model_defined = any(
+            self._is_nested_call(node, tensorflow_alias, ["keras", method])
+            for method in state["model_methods"]
+        )
+        memory_freed = self._is_nested_call(
+            node, tensorflow_alias, ["keras", "backend", "clear_session"]
+        )
+        if not model_defined and not memory_freed:
+            return
+
+        # The call belongs to every loop enclosing it
+        for ancestor in traversal.enclosing_loops(node):
+            loop = state["loops"].get(ancestor)
+            if loop is None:
+                continue
+            loop["model_defined"] |= model_defined
+            loop["memory_freed"] |= memory_freed
+
+    def finish(
+        self, state: dict[str, any], traversal
+    ) -> list[dict[str, any]]:
+        smells = []
 
+        for loop_node, loop in state["loops"].items():
             # If model is defined but memory is not freed, report it
-            if model_defined and not memory_freed:
+            if loop["model_defined"] and not loop["memory_freed"]:
                 smells.append(
                     self.format_smell(
                         line=loop_node.lineno,
@@ -74,44 +101,6 @@ class MemoryNotFreedSmell(Smell):
                 )
         return smells
 
-    def _is_model_defined_in_loop(
-        self,
-        loop_node: ast.AST,
-        tensorflow_alias: str,
-        model_methods: list[str],
-    ) -> bool:
-        """
-        Check if any model is being defined inside a loop using any of the
-        model methods.
-        """
-        for node in ast.walk(loop_node):
-            if isinstance(node, ast.Call):
-                # Iterate over all possible model methods
-                # (e.g., Sequential, Model, etc.)
-                for method in model_methods:
-                    if self._is_nested_call(
-                        node, tensorflow_alias, ["keras", method]
-                    ):
-                        return True
-        return False
-
-    def _is_memory_freed_in_loop(
-        self, loop_node: ast.AST, tensorflow_alias: str
-    ) -> bool:
-        """
-        Check if memory is cleared using tf.keras.backend.clear_session()
-        inside a loop.
-        """
-        for node in ast.walk(loop_node):
-            if isinstance(node, ast.Call):
-                if self._is_nested_call(
-                    node,
-                    tensorflow_alias,
-                    ["keras", "backend", "clear_session"],
-                ):
-                    return True
-        return False
-
     def _is_nested_call(
         self, node: ast.Call, base: str, attributes: list[str]
     ) -> bool:
@@ -14,6 +14,11 @@ class MergeAPIParameterNotExplicitlySetSmell(Smell):
         df1.merge(df2, how='inner', on='key', validate='one_to_one')
     """
 
+    rule_id = "merge_api_parameter_not_explicitly_set"
+    node_types = (ast.Call,)
+    required_libraries = ("pandas",)
+    required_data = ("dataframe_variables",)
+
     def __init__(self):
         super().__init__(
             name="merge_api_parameter_not_explicitly_set",
@@ -24,74 +29,74 @@ class MergeAPIParameterNotExplicitlySetSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Retrieve library aliases and DataFrame variables
         pandas_alias = extracted_data["libraries"].get("pandas")
         if not pandas_alias:
-            return smells
+            return None
 
-        dataframe_variables = extracted_data.get("dataframe_variables", [])
+        return {
+            "smells": [],
+            "pandas_alias": pandas_alias,
+            "dataframe_variables": extracted_data.get(
+                "dataframe_variables", []
+            ),
+        }
 
-        # Traverse AST nodes to find calls to `merge`
-        for node in ast.walk(ast_node):
-            if (
-                isinstance(node, ast.Call)
-                and hasattr(node.func, "attr")
-                and node.func.attr == "merge"
-            ):
-                # Resolve the base object calling `merge`
-                base_obj = node.func.value
+    def visit(self, node: ast.Call, state: dict[str, any], traversal):
+        # Find calls to `merge`
+        if not (hasattr(node.func, "attr") and node.func.attr == "merge"):
+            return
 
-                # Check if `merge` is called on a DataFrame
-                # variable or Pandas alias
-                is_dataframe_call = (
-                    isinstance(base_obj, ast.Name)
-                    and base_obj.id in dataframe_variables
-                )
-                is_pandas_call = (
-                    isinstance(base_obj, ast.Attribute)
-                    and hasattr(base_obj.value, "id")
-                    and base_obj.value.id == pandas_alias
-                )
+        # Resolve the base object calling `merge`
+        base_obj = node.func.value
 
-                if is_dataframe_call or is_pandas_call:
-                    # Check for missing or incomplete parameters
-                    if not hasattr(node, "keywords") or not isinstance(
-                        node.keywords, list
-                    ):
-                        smells.append(
-                            self.format_smell(
-                                line=node.lineno,
-                                additional_info=(
-                                    "Missing explicit parameters in `merge` "
-                                    "(e.g., 'how', 'on', 'validate')."
-                                ),
-                            )
-                        )
-                    else:
-                        # Ensure keywords are valid before processing
-                        valid_keywords = [
-                            kw.arg
-                            for kw in node.keywords
-                            if isinstance(kw, ast.keyword)
-                            and kw.arg is not None
-                        ]
-                        required_args = {"how", "on", "validate"}
-                        if not required_args.issubset(set(valid_keywords)):
-                            smells.append(
-                                self.format_smell(
-                                    line=node.lineno,
-                                    additional_info=(
-                                        "Incomplete parameters in `merge`. "
-                                        "Consider specifying 'how', 'on', "
-                                        " and 'validate'."
-                                    ),
-                                )
-                            )
+        # Check if `merge` is called on a DataFrame
+        # variable or Pandas alias
+        is_dataframe_call = (
+            isinstance(base_obj, ast.Name)
+            and base_obj.id in state["dataframe_variables"]
+        )
+        is_pandas_call = (
+            isinstance(base_obj, ast.Attribute)
+            and hasattr(base_obj.value, "id")
+            and base_obj.value.id == state["pandas_alias"]
+        )
+        if not (is_dataframe_call or is_pandas_call):
+            return
 
-        return smells
+        # Check for missing or incomplete parameters
+        if not hasattr(node, "keywords") or not isinstance(
+            node.keywords, list
+        ):
+            state["smells"].append(
+                self.format_smell(
+                    line=node.lineno,
+                    additional_info=(
+                        "Missing explicit parameters in `merge` "
+                        "(e.g., 'how', 'on', 'validate')."
+                    ),
+                )
+            )
+        else:
+            # Ensure keywords are valid before processing
+            valid_keywords = [
+                kw.arg
+                for kw in node.keywords
+                if isinstance(kw, ast.keyword) and kw.arg is not None
+            ]
+            required_args = {"how", "on", "validate"}
+            if not required_args.issubset(set(valid_keywords)):
+                state["smells"].append(
+                    self.format_smell(
+                        line=node.lineno,
+                        additional_info=(
+                            "Incomplete parameters in `merge`. "
+                            "Consider specifying 'how', 'on', "
+                            " and 'validate'."
+                        ),
+                    )
+                )
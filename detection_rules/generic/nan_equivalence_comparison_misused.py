@@ -17,6 +17,10 @@ class NanEquivalenceComparisonMisusedSmell(Smell):
         if np.isnan(value):  # Correct
     """
 
+    rule_id = "nan_equivalence_comparison_misused"
+    node_types = (ast.Compare,)
+    required_libraries = ("numpy",)
+
     def __init__(self):
         super().__init__(
             name="nan_equivalence_comparison_misused",
@@ -26,32 +30,28 @@ class NanEquivalenceComparisonMisusedSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
+    ) -> dict[str, any] | None:
 
         library_name = extracted_data["libraries"].get("numpy")
         if not library_name:
-            return smells
-
-        # Traverse AST nodes
-        for node in ast.walk(ast_node):
-            if isinstance(node, ast.Compare):
-                # Check if NaN is misused in equivalence comparison
-                if self._has_nan_comparison(node, library_name):
-                    smells.append(
-                        self.format_smell(
-                            line=node.lineno,
-                            additional_info=(
-                                "Direct equivalence comparison with NaN "
-                                "detected. Use np.isnan() instead."
-                            ),
-                        )
-                    )
-
-        return smells
+            return None
+
+        return {"smells": [], "library_name": library_name}
+
+    def visit(self, node: ast.Compare, state: dict[str, any], traversal):
+        # Check if NaN is misused in equivalence comparison
+        if self._has_nan_comparison(node, state["library_name"]):
+            state["smells"].append(
+                self.format_smell(
+                    line=node.lineno,
+                    additional_info=(
+                        "Direct equivalence comparison with NaN "
+                        "detected. Use np.isnan() instead."
+                    ),
+                )
+            )
 
     def _has_nan_comparison(
         self, node: ast.Compare, library_name: str
@@ -1,5 +1,4 @@
 import ast
-from typing import Optional
 from detection_rules.smell import Smell
 
 
@@ -20,6 +19,12 @@ class UnnecessaryIterationSmell(Smell):
         Use vectorized Pandas operations (e.g., `df["column"] = df["value"]`).
     """
 
+    rule_id = "unnecessary_iteration"
+    cost = "medium"
+    node_types = (ast.For, ast.While, ast.Call)
+    required_libraries = ("pandas",)
+    required_data = ("dataframe_variables",)
+
     def __init__(self):
         super().__init__(
             name="unnecessary_iteration",
@@ -31,55 +36,75 @@ class UnnecessaryIterationSmell(Smell):
             ),
         )
 
-    def detect(
+    def start(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
-    ) -> list[dict[str, any]]:
-
-        smells = []
+    ) -> dict[str, any] | None:
 
         # Check for Pandas library
         pandas_alias = extracted_data["libraries"].get("pandas")
         if not pandas_alias:
-            return smells
-
-        dataframe_variables = set(
-            extracted_data.get("dataframe_variables", [])
-        )
-        inefficient_methods = {"iterrows", "itertuples", "apply", "applymap"}
-
-        loop_nodes = [
-            node
-            for node in ast.walk(ast_node)
-            if isinstance(node, (ast.For, ast.While))
-        ]
-
-        for loop_node in loop_nodes:
-            if isinstance(loop_node, ast.For):
-                # Check for inefficient iterable in `for` loops
-                if self._is_inefficient_iterable(
-                    loop_node, dataframe_variables, inefficient_methods
+            return None
+
+        # Each loop is mapped to the node it is reported at: the loop
+        # itself for an inefficient iterable, or the first inefficient
+        # operation found in its body
+        return {
+            "dataframe_variables": set(
+                extracted_data.get("dataframe_variables", [])
+            ),
+            "inefficient_methods": {
+                "iterrows",
+                "itertuples",
+                "apply",
+                "applymap",
+            },
+            "loops": {},
+        }
+
+    def visit(self, node: ast.AST, state: dict[str, any], traversal):
+        dataframe_variables = state["dataframe_variables"]
+        inefficient_methods = state["inefficient_methods"]
+
+        if isinstance(node, (ast.For, ast.While)):
+            state["loops"][node] = None
+            # Check for inefficient iterable in `for` loops
+            if isinstance(node, ast.For) and self._is_inefficient_iterable(
+                node, dataframe_variables, inefficient_methods
+            ):
+                state["loops"][node] = node
+            return
+
+        # Check the loop bodies for inefficient operations
+        if self._is_inefficient_operation(
+            node, dataframe_variables, inefficient_methods
+        ):
+            for ancestor in traversal.enclosing_loops(node):
+                if (
+                    ancestor in state["loops"]
+                    and state["loops"][ancestor] is None
                 ):
-                    smells.append(
-                        self.format_smell(
-                            line=loop_node.lineno,
-                            additional_info=(
-                                "Inefficient iteration detected. "
-                                "Consider using vectorized operations instead."
-                            ),
-                        )
+                    state["loops"][ancestor] = node
+
+    def finish(
+        self, state: dict[str, any], traversal
+    ) -> list[dict[str, any]]:
+        smells = []
+
+        for loop_node, reported_node in state["loops"].items():
+            if reported_node is loop_node:
+                smells.append(
+                    self.format_smell(
+                        line=loop_node.lineno,
+                        additional_info=(
+                            "Inefficient iteration detected. "
+                            "Consider using vectorized operations instead."
+                        ),
                     )
-                    # Skip further checks for this
-                    # loop since it's already detected
-                    continue
-
-            # Check the loop body for inefficient operations
-            inefficient_operation = self._has_inefficient_operations(
-                loop_node, dataframe_variables, inefficient_methods
-            )
-            if inefficient_operation:
+                )
+            elif reported_node is not None:
                 smells.append(
                     self.format_smell(
-                        line=inefficient_operation.lineno,
+                        line=reported_node.lineno,
                         additional_info=(
                             "Inefficient operation detected inside the loop. "
                             "Consider using vectorized operations instead."
@@ -127,33 +152,25 @@ class UnnecessaryIterationSmell(Smell):
             return True
         return False
 
-    def _has_inefficient_operations(
+    def _is_inefficient_operation(
         self,
-        loop_node: ast.AST,
+        node: ast.Call,
         dataframe_variables: set[str],
         inefficient_methods: set[str],
-    ) -> Optional[ast.Call]:
+    ) -> bool:
         """
-        Checks if the loop body contains
-        inefficient operations on DataFrame objects
-        and returns the node of the first inefficient operation found.
+        Checks if a call is an inefficient operation on a DataFrame object.
 
         Parameters:
-        - loop_node: The AST node representing the loop (For or While).
+        - node: The call node to check.
         - dataframe_variables: Set of known DataFrame variable names.
         - inefficient_methods: Set of methods considered inefficient.
 
         Returns:
-        - ast.Call: The node of the first inefficient operation found, or None.
+        - bool: True if the call is an inefficient operation, False otherwise.
         """
-        for body_node in ast.walk(loop_node):
-            if isinstance(body_node, ast.Call):
-                if (
-                    isinstance(body_node.func, ast.Attribute)
-                    and body_node.func.attr in inefficient_methods
-                    and self._is_dataframe(
-                        body_node.func.value, dataframe_variables
-                    )
-                ):
-                    return body_node  # Return the inefficient operation node
-        return None
+        return (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr in inefficient_methods
+            and self._is_dataframe(node.func.value, dataframe_variables)
+        )
@@ -0,0 +1,393 @@
+import ast
+import time
+from collections import deque
+from typing import Callable, Iterator, Mapping, Optional
+
+
+class FunctionTraversal:
+    """
+    Performs a single breadth-first traversal of an AST node, visiting
+    nodes in the same order as `ast.walk`, and records the parent of every
+    visited node so that rules can reason about enclosing constructs
+    (e.g., loops) without walking subtrees again.
+
+    On top of the parents, the traversal indexes the blocks (loops, `with`
+    statements and functions) enclosing each node: the stack of a node is
+    built from the stack of its parent, so every query is answered in
+    constant time after the first one on the same branch. The qualified
+    names of the called functions are computed once per node as well, and
+    shared by all the rules.
+    """
+
+    LOOP_TYPES = (ast.For, ast.AsyncFor, ast.While)
+    BLOCK_TYPES = LOOP_TYPES + (
+        ast.With,
+        ast.AsyncWith,
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+        ast.Lambda,
+    )
+
+    def __init__(self, root: ast.AST):
+        """
+        Initializes the traversal for the given root node.
+
+        Parameters:
+        - root (ast.AST): The node to traverse (typically a function).
+        """
+        self.root = root
+        self.parents: dict[ast.AST, ast.AST] = {}
+        self._blocks: dict[ast.AST, tuple[ast.AST, ...]] = {}
+        # The name of each expression, with the alias map it was
+        # resolved through (kept, so that its identity is not reused)
+        self._names: dict[ast.AST, tuple[Mapping[str, str], str]] = {}
+
+    def walk(self) -> Iterator[ast.AST]:
+        """
+        Yields every node below (and including) the root in `ast.walk`
+        order. A node is always yielded after all of its ancestors, so
+        `parent()` and `ancestors()` are available for it.
+        """
+        parents = self.parents
+        todo = deque([self.root])
+        while todo:
+            node = todo.popleft()
+            for child in ast.iter_child_nodes(node):
+                parents[child] = node
+                todo.append(child)
+            yield node
+
+    def parent(self, node: ast.AST) -> Optional[ast.AST]:
+        """
+        Returns the parent of a visited node, or None for the root.
+        """
+        return self.parents.get(node)
+
+    def ancestors(self, node: ast.AST) -> Iterator[ast.AST]:
+        """
+        Yields the ancestors of a visited node, innermost first.
+        """
+        parent = self.parents.get(node)
+        while parent is not None:
+            yield parent
+            parent = self.parents.get(parent)
+
+    def blocks(self, node: ast.AST) -> tuple[ast.AST, ...]:
+        """
+        Returns the loops, `with` statements and functions enclosing a
+        visited node (the node itself excluded), innermost first.
+        """
+        blocks = self._blocks
+        if node in blocks:
+            return blocks[node]
+
+        # Climb to the nearest node whose stack is known (or the root)
+        branch = []
+        current = node
+        while current is not None and current not in blocks:
+            branch.append(current)
+            current = self.parent(current)
+
+        # Fill the stacks downwards, each from the stack of its parent
+        for child in reversed(branch):
+            parent = self.parent(child)
+            stack = blocks.get(parent, ())
+            if isinstance(parent, self.BLOCK_TYPES):
+                stack = (parent,) + stack
+            blocks[child] = stack
+        return stack
+
+    def enclosing_loops(self, node: ast.AST) -> Iterator[ast.AST]:
+        """
+        Yields the loops enclosing a visited node, innermost first.
+        """
+        for block in self.blocks(node):
+            if isinstance(block, self.LOOP_TYPES):
+                yield block
+
+    def in_loop(self, node: ast.AST) -> bool:
+        """
+        Returns whether a visited node is inside a loop.
+        """
+        return next(self.enclosing_loops(node), None) is not None
+
+    def qualified_name(
+        self, node: ast.AST, library_by_alias: Mapping[str, str]
+    ) -> str:
+        """
+        Returns the dotted name of a name or attribute expression (e.g.,
+        the function of a call), with the name at its base resolved
+        through the imports of the file.
+
+        Parameters:
+        - node (ast.AST): The expression.
+        - library_by_alias (Mapping[str, str]): The names bound by the
+          imports of the file, mapped to the canonical names of the
+          imported modules or symbols.
+
+        Returns:
+        - str: The qualified name (e.g., `numpy.dot` for `np.dot`
+          after `import numpy as np`). Names are memoized for the alias
+          map they were resolved through.
+        """
+        cached = self._names.get(node)
+        if cached is not None and cached[0] is library_by_alias:
+            return cached[1]
+
+        names = []
+        base = node
+        while isinstance(base, ast.Attribute):
+            names.append(base.attr)
+            base = base.value
+        if isinstance(base, ast.Name):
+            names.append(library_by_alias.get(base.id, base.id))
+        name = ".".join(reversed(names))
+        self._names[node] = (library_by_alias, name)
+        return name
+
+    def is_assigned(self, node: ast.AST) -> bool:
+        """
+        Returns whether a visited expression is the value of an
+        assignment (e.g., `df = df.drop(...)`).
+        """
+        parent = self.parent(node)
+        return (
+            isinstance(parent, (ast.Assign, ast.AnnAssign, ast.AugAssign))
+            and parent.value is node
+        )
+
+
+class Scope:
+    """
+    A scope of a file: a function (or method, sync or async), or the
+    module itself. The nodes of a scope are those evaluated in it: nested
+    functions are scopes of their own, while class bodies, lambdas and
+    comprehensions belong to the enclosing scope.
+    """
+
+    MODULE = "<module>"
+
+    def __init__(self, qualname: str, node: ast.AST):
+        """
+        Initializes an empty scope.
+
+        Parameters:
+        - qualname (str): The qualified name of the scope, as in
+          `__qualname__` (e.g., `Class.method`, `outer.<locals>.inner`).
+        - node (ast.AST): The function or module node.
+        """
+        self.qualname = qualname
+        self.node = node
+        self.nodes: list[ast.AST] = []
+
+    @property
+    def name(self) -> str:
+        """
+        The bare name of the function, or `<module>`.
+        """
+        return getattr(self.node, "name", self.MODULE)
+
+
+class ScopePartition:
+    """
+    Assigns every node of a file to exactly one scope, its innermost
+    enclosing function or the module, with a single breadth-first walk.
+
+    Rules are applied to each scope over its own nodes only, so the code
+    of a nested function is analyzed (and reported) once, no matter how
+    deeply it is nested. The parents recorded by the walk are shared by
+    the traversals of all the scopes.
+    """
+
+    SCOPE_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+    def __init__(self, tree: ast.AST):
+        """
+        Partitions the nodes of a parsed file.
+
+        Parameters:
+        - tree (ast.AST): The AST of the file.
+        """
+        self.parents: dict[ast.AST, ast.AST] = {}
+        module = Scope(Scope.MODULE, tree)
+        functions = []
+
+        # Each entry: a node, its scope and the qualified name prefix
+        todo = deque([(tree, module, "")])
+        while todo:
+            node, scope, prefix = todo.popleft()
+            if node is not tree and isinstance(node, self.SCOPE_TYPES):
+                scope = Scope(prefix + node.name, node)
+                prefix = f"{scope.qualname}.<locals>."
+                functions.append(scope)
+            elif isinstance(node, ast.ClassDef):
+                prefix = f"{prefix}{node.name}."
+            scope.nodes.append(node)
+            for child in ast.iter_child_nodes(node):
+                self.parents[child] = node
+                todo.append((child, scope, prefix))
+
+        # Functions in `ast.walk` order, then the module-level code
+        self.scopes: list[Scope] = functions + [module]
+
+    def traversal(self, scope: Scope) -> "ScopeTraversal":
+        """
+        Returns the traversal of the nodes of a scope.
+        """
+        return ScopeTraversal(scope, self.parents)
+
+
+class ScopeTraversal(FunctionTraversal):
+    """
+    A traversal restricted to the nodes of a single scope (see
+    `ScopePartition`), in `ast.walk` order. Ancestors stop at the scope
+    node, as for a traversal rooted at it.
+    """
+
+    def __init__(self, scope: Scope, parents: dict[ast.AST, ast.AST]):
+        """
+        Initializes the traversal of a scope.
+
+        Parameters:
+        - scope (Scope): The scope, with its nodes.
+        - parents (dict[ast.AST, ast.AST]): The parents of the nodes of
+          the file.
+        """
+        super().__init__(scope.node)
+        self.scope = scope
+        self.parents = parents
+
+    def walk(self) -> Iterator[ast.AST]:
+        return iter(self.scope.nodes)
+
+    def parent(self, node: ast.AST) -> Optional[ast.AST]:
+        if node is self.root:
+            return None
+        return self.parents.get(node)
+
+    def ancestors(self, node: ast.AST) -> Iterator[ast.AST]:
+        while node is not self.root:
+            node = self.parents.get(node)
+            if node is None:
+                return
+            yield node
+
+
+class RuleDispatcher:
+    """
+    Runs a set of smell rules over an AST node with a single traversal.
+
+    Each rule declares the AST node types it is interested in through
+    `Smell.node_types`; every node of the traversal is dispatched only to
+    the rules registered for its type. Rules that do not declare any node
+    type are treated as legacy rules and run through their own `detect`.
+    """
+
+    def __init__(self, smells: list):
+        """
+        Initializes the dispatcher.
+
+        Parameters:
+        - smells (list[Smell]): The rules to dispatch nodes to.
+        """
+        self.smells = list(smells)
+        self._rules_by_type: dict[type, tuple[int, ...]] = {}
+
+    def dispatch(
+        self,
+        ast_node: ast.AST,
+        extracted_data: dict[str, any],
+        on_error: Optional[Callable] = None,
+        timings: Optional[list[float]] = None,
+        traversal: Optional[FunctionTraversal] = None,
+    ) -> list[list[dict[str, any]]]:
+        """
+        Applies every rule to the given AST node.
+
+        Parameters:
+        - ast_node (ast.AST): The AST node to analyze.
+        - extracted_data (dict): Pre-extracted data
+          (e.g., libraries, variables, etc.).
+        - on_error (callable): Optional callback invoked as
+          `on_error(smell, exception)` when a rule fails. The failing rule
+          reports no smells. If omitted, the exception is raised.
+        - timings (list[float]): Optional list, one entry per rule, to
+          which the seconds spent by each rule are added.
+        - traversal (FunctionTraversal): Optional traversal of `ast_node`
+          (e.g., of the nodes of a single scope, see `ScopePartition`).
+          By default, the whole subtree of `ast_node` is traversed.
+
+        Returns:
+        - list[list[dict]]: The detected smells, one list per rule,
+          in the same order as the rules.
+        """
+        results = [[] for _ in self.smells]
+        states = [None] * len(self.smells)
+
+        def fail(index, exception):
+            states[index] = None
+            results[index] = []
+            if on_error is None:
+                raise exception
+            on_error(self.smells[index], exception)
+
+        clock = time.perf_counter
+        if traversal is None:
+            traversal = FunctionTraversal(ast_node)
+        visitors = 0
+        for index, smell in enumerate(self.smells):
+            started = clock() if timings is not None else 0.0
+            try:
+                if not smell.node_types:
+                    results[index] = smell.detect(ast_node, extracted_data)
+                else:
+                    states[index] = smell.start(ast_node, extracted_data)
+                    if states[index] is not None:
+                        visitors += 1
+            except Exception as e:
+                fail(index, e)
+            if timings is not None:
+                timings[index] += clock() - started
+
+        if visitors:
+            for node in traversal.walk():
+                for index in self._rules_for(type(node)):
+                    state = states[index]
+                    if state is None:
+                        continue
+                    started = clock() if timings is not None else 0.0
+                    try:
+                        self.smells[index].visit(node, state, traversal)
+                    except Exception as e:
+                        fail(index, e)
+                    if timings is not None:
+                        timings[index] += clock() - started
+
+        for index, smell in enumerate(self.smells):
+            state = states[index]
+            if state is None:
+                continue
+            started = clock() if timings is not None else 0.0
+            try:
+                results[index] = smell.finish(state, traversal)
+            except Exception as e:
+                fail(index, e)
+            if timings is not None:
+                timings[index] += clock() - started
+
+        return results
+
+    def _rules_for(self, node_type: type) -> tuple[int, ...]:
+        """
+        Returns the indices of the rules interested in a node type.
+        """
+        indices = self._rules_by_type.get(node_type)
+        if indices is None:
+            indices = tuple(
+                index
+                for index, smell in enumerate(self.smells)
+                if smell.node_types
+                and issubclass(node_type, tuple(smell.node_types))
+            )
+            self._rules_by_type[node_type] = indices
+        return indices
@@ -0,0 +1,238 @@
+import importlib
+from typing import Iterator, Mapping
+
+# The rules shipped with CodeSmile, by identifier (the lowercase smell
+# name), as "module:class" targets imported when the rule is first used
+# fmt: off
+BUILTIN_RULES = {
+    # API-Specific Smells
+    "chain_indexing":
+        "detection_rules.api_specific.chain_indexing_smell:"
+        "ChainIndexingSmell",
+    "dataframe_conversion_api_misused":
+        "detection_rules.api_specific.dataframe_conversion_api_misused:"
+        "DataFrameConversionAPIMisused",
+    "gradients_not_cleared_before_backward_propagation":
+        "detection_rules.api_specific."
+        "gradients_not_cleared_before_backward_propagation:"
+        "GradientsNotClearedSmell",
+    "matrix_multiplication_api_misused":
+        "detection_rules.api_specific.matrix_multiplication_api_misused:"
+        "MatrixMultiplicationAPIMisused",
+    "pytorch_call_method_misused":
+        "detection_rules.api_specific.pytorch_call_method_misused:"
+        "PyTorchCallMethodMisusedSmell",
+    "tensor_array_not_used":
+        "detection_rules.api_specific.tensor_array_not_used:"
+        "TensorArrayNotUsedSmell",
+    # Generic Smells
+    "broadcasting_feature_not_used":
+        "detection_rules.generic.broadcasting_feature_not_used:"
+        "BroadcastingFeatureNotUsedSmell",
+    "columns_and_datatype_not_explicitly_set":
+        "detection_rules.generic.columns_and_datatype_not_explicitly_set:"
+        "ColumnsAndDatatypeNotExplicitlySetSmell",
+    "deterministic_algorithm_option_not_used":
+        "detection_rules.generic.deterministic_algorithm_option_not_used:"
+        "DeterministicAlgorithmOptionSmell",
+    "empty_column_misinitialization":
+        "detection_rules.generic.empty_column_misinitialization:"
+        "EmptyColumnMisinitializationSmell",
+    "hyperparameters_not_explicitly_set":
+        "detection_rules.generic.hyperparameters_not_explicitly_set:"
+        "HyperparametersNotExplicitlySetSmell",
+    "in_place_apis_misused":
+        "detection_rules.generic.in_place_apis_misused:"
+        "InPlaceAPIsMisusedSmell",
+    "memory_not_freed":
+        "detection_rules.generic.memory_not_freed:MemoryNotFreedSmell",
+    "merge_api_parameter_not_explicitly_set":
+        "detection_rules.generic.merge_api_parameter_not_explicitly_set:"
+        "MergeAPIParameterNotExplicitlySetSmell",
+    "nan_equivalence_comparison_misused":
+        "detection_rules.generic.nan_equivalence_comparison_misused:"
+        "NanEquivalenceComparisonMisusedSmell",
+    "unnecessary_iteration":
+        "detection_rules.generic.unnecessary_iteration:"
+        "UnnecessaryIterationSmell",
+}
+# fmt: on
+
+
+class RuleRegistry(Mapping):
+    """
+    Maps rule identifiers to `Smell` subclasses, importing each rule only
+    when it is first used.
+
+    Rules come from three sources:
+    - the built-in rules (`BUILTIN_RULES`);
+    - `Smell` subclasses declaring a `rule_id`, which register themselves
+      when their module is imported;
+    - the `codesmile.rules` entry points of the installed packages, named
+      after the rule identifier, e.g.:
+
+          [project.entry-points."codesmile.rules"]
+          slow_loop = "my_rules.loops:SlowLoopSmell"
+
+    Listing the identifiers (e.g., for the CLI choices) imports no rule.
+    """
+
+    ENTRY_POINT_GROUP = "codesmile.rules"
+
+    def __init__(self, rules: dict[str, str] | None = None):
+        """
+        Initializes the registry.
+
+        Parameters:
+        - rules (dict[str, str] | None): Rules registered lazily, as
+          "module:class" targets by identifier.
+        """
+        # Identifier -> "module:class" target, or the class once loaded
+        self._rules = dict(rules or {})
+        self._discovered = False
+
+    def __getitem__(self, rule_id: str) -> type:
+        self._discover()
+        target = self._rules[rule_id]
+        if isinstance(target, str):
+            return self._load(rule_id, target)
+        return target
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(list(self._rules))
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._rules)
+
+    def __contains__(self, rule_id: object) -> bool:
+        self._discover()
+        return rule_id in self._rules
+
+    def register(self, smell_class: type) -> type:
+        """
+        Registers a rule under its `rule_id`. Called by `Smell` when a
+        subclass declaring a `rule_id` is defined; usable as a decorator.
+
+        Parameters:
+        - smell_class (type): The `Smell` subclass.
+
+        Returns:
+        - type: The registered class.
+
+        Raises:
+        - ValueError: If another rule has the same identifier.
+        """
+        rule_id = smell_class.rule_id
+        target = f"{smell_class.__module__}:{smell_class.__qualname__}"
+        registered = self._rules.get(rule_id)
+        if registered is not None and self._target(registered) != target:
+            raise ValueError(
+                f"Rule '{rule_id}' is already registered by "
+                f"{self._target(registered)}"
+            )
+        self._rules[rule_id] = smell_class
+        return smell_class
+
+    def register_lazy(self, rule_id: str, target: str) -> None:
+        """
+        Registers a rule to import when it is first used.
+
+        Parameters:
+        - rule_id (str): The identifier of the rule.
+        - target (str): The "module:class" path of its `Smell` subclass.
+
+        Raises:
+        - ValueError: If another rule has the same identifier.
+        """
+        registered = self._rules.get(rule_id)
+        if registered is not None and self._target(registered) != target:
+            raise ValueError(
+                f"Rule '{rule_id}' is already registered by "
+                f"{self._target(registered)}"
+            )
+        self._rules.setdefault(rule_id, target)
+
+    def is_loaded(self, rule_id: str) -> bool:
+        """
+        Checks whether the class of a rule was imported already.
+        """
+        return not isinstance(self._rules.get(rule_id, ""), str)
+
+    def metadata(self, rule_id: str) -> dict[str, any]:
+        """
+        Describes a rule (importing it, if needed).
+
+        Parameters:
+        - rule_id (str): The identifier of the rule.
+
+        Returns:
+        - dict[str, any]: The identifier, the "module:class" target, the
+          required libraries, the names of the AST node types the rule
+          visits and its cost class (see `Smell.cost`).
+        """
+        smell_class = self[rule_id]
+        return {
+            "id": rule_id,
+            "target": self._target(smell_class),
+            "required_libraries": tuple(smell_class.required_libraries),
+            "node_types": tuple(
+                node_type.__name__ for node_type in smell_class.node_types
+            ),
+            "cost": smell_class.cost,
+        }
+
+    def _discover(self) -> None:
+        """
+        Registers the rules of the `codesmile.rules` entry points, once.
+        Entry points cannot replace a rule with the same identifier.
+        """
+        if self._discovered:
+            return
+        self._discovered = True
+
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=self.ENTRY_POINT_GROUP):
+            try:
+                self.register_lazy(entry_point.name, entry_point.value)
+            except ValueError as e:
+                print(f"Ignoring rule plugin '{entry_point.value}': {e}")
+
+    def _load(self, rule_id: str, target: str) -> type:
+        """
+        Imports the class of a rule registered lazily.
+
+        Raises:
+        - TypeError: If the target is not a `Smell` subclass declaring
+          the identifier of the rule.
+        """
+        from detection_rules.smell import Smell
+
+        module_name, _, class_name = target.partition(":")
+        smell_class = importlib.import_module(module_name)
+        for attribute in class_name.split("."):
+            smell_class = getattr(smell_class, attribute)
+
+        if not (
+            isinstance(smell_class, type) and issubclass(smell_class, Smell)
+        ):
+            raise TypeError(f"Rule '{rule_id}' ({target}) is not a Smell")
+        if smell_class.rule_id != rule_id:
+            raise TypeError(
+                f"Rule '{rule_id}' ({target}) declares the identifier "
+                f"'{smell_class.rule_id}'"
+            )
+        self._rules[rule_id] = smell_class
+        return smell_class
+
+    @staticmethod
+    def _target(registered: str | type) -> str:
+        if isinstance(registered, str):
+            return registered
+        return f"{registered.__module__}:{registered.__qualname__}"
+
+
+# The registry of the rules applied by `RuleChecker`
+RULES = RuleRegistry(BUILTIN_RULES)
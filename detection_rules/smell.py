@@ -1,13 +1,55 @@
-from abc import ABC, abstractmethod
+from abc import ABC
 import ast
+from code_extractor.library_extractor import LibraryExtractor
+from detection_rules.rule_dispatcher import FunctionTraversal, RuleDispatcher
+from detection_rules.rule_registry import RULES
 
 
 class Smell(ABC):
     """
     Abstract base class for detecting code smells.
     Provides a standardized interface for smell detection and formatting.
+
+    Rules are visitors: they declare the AST node types they are
+    interested in (`node_types`) and receive those nodes from a single
+    traversal shared with all the other rules (see `RuleDispatcher`).
+
+    Rules also declare the libraries they are about
+    (`required_libraries`), so that files which import none of them are
+    not analyzed by the rule at all, and the extracted data they read
+    (`required_data`).
+
+    Subclasses declaring a `rule_id` register themselves in the rule
+    registry when they are defined (see `RuleRegistry`), so that rules
+    of other packages can be selected like the built-in ones.
     """
 
+    # Identifier of the rule (the lowercase smell name), under which the
+    # subclass registers itself. None: the subclass is not registered.
+    rule_id: str | None = None
+
+    # Cost class of the rule: "low" for rules checking each visited node
+    # on its own, "medium" for rules also walking up its enclosing blocks
+    # (see `FunctionTraversal.blocks`), "high" for rules walking subtrees.
+    cost: str = "low"
+
+    # AST node types dispatched to `visit` during the traversal.
+    node_types: tuple[type[ast.AST], ...] = ()
+
+    # The rule applies only to files importing at least one of these
+    # libraries (or one of their submodules). Empty: applies to any file.
+    required_libraries: tuple[str, ...] = ()
+
+    # Keys of `extracted_data` computed by extractors that the rule reads
+    # (e.g., "variables", "dataframe_variables"). Extractors whose output
+    # no rule reads are not run.
+    required_data: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("rule_id"):
+            RULES.register(cls)
+
     def __init__(self, name: str, description: str):
         """
         Initializes a Smell instance with its name and description.
@@ -19,16 +61,15 @@ class Smell(ABC):
         self.name = name
         self.description = description
 
-    @abstractmethod
     def detect(
         self, ast_node: ast.AST, extracted_data: dict[str, any]
     ) -> list[dict[str, any]]:
         """
-        Abstract method to detect code smells.
+        Detects code smells by running this rule alone over the AST node.
 
-        This method must be implemented by subclasses and defines
-        how the smell is detected
-        based on the given AST node and the extracted data.
+        The detection logic is defined by `start`, `visit` and `finish`.
+        Legacy subclasses that do not declare `node_types` must override
+        this method instead.
 
         Parameters:
         - ast_node (ast.AST): The AST node being analyzed
@@ -40,6 +81,9 @@ class Smell(ABC):
         ------------------------------
         - `libraries` (dict[str, str]): Maps library names to their aliases
             (e.g., {"pandas": "pd", "numpy": "np", "tensorflow": "tf"}).
+        - `library_by_alias` (dict[str, str]): Maps the names bound by
+            the imports back to the modules or symbols they refer to
+            (e.g., {"pd": "pandas", "SVC": "sklearn.svm.SVC"}).
         - `variables` (dict[str, ast.Assign]): Maps variable
             names to their AST assignment nodes.
             Example:
@@ -88,7 +132,100 @@ class Smell(ABC):
           where each dictionary contains
           information about a detected smell.
         """
-        pass
+        if not self.node_types:
+            raise NotImplementedError(
+                f"{type(self).__name__} must declare `node_types` "
+                "or override `detect`."
+            )
+        return RuleDispatcher([self]).dispatch(ast_node, extracted_data)[0]
+
+    def applies_to(self, libraries: dict[str, str]) -> bool:
+        """
+        Checks whether the rule applies to a file, given its imports.
+
+        Parameters:
+        - libraries (dict[str, str]): The libraries imported by the file,
+          mapped to their aliases.
+
+        Returns:
+        - bool: False if the file imports none of `required_libraries`.
+        """
+        if not self.required_libraries:
+            return True
+        return LibraryExtractor.imports_any(
+            libraries, self.required_libraries
+        )
+
+    def start(
+        self, ast_node: ast.AST, extracted_data: dict[str, any]
+    ) -> dict[str, any] | None:
+        """
+        Prepares the per-run state of the rule before the traversal.
+
+        Parameters:
+        - ast_node (ast.AST): The AST node being analyzed.
+        - extracted_data (dict[str, any]): See `detect`.
+
+        Returns:
+        - dict[str, any] | None: The state passed to `visit` and `finish`,
+          or None if the rule does not apply (e.g., a required library
+          is not imported), in which case no node is dispatched to it.
+        """
+        return {"smells": []}
+
+    def visit(
+        self,
+        node: ast.AST,
+        state: dict[str, any],
+        traversal: FunctionTraversal,
+    ) -> None:
+        """
+        Inspects a single node of one of the declared `node_types`.
+
+        Nodes are dispatched in `ast.walk` order, after their ancestors.
+
+        Parameters:
+        - node (ast.AST): The dispatched node.
+        - state (dict[str, any]): The state returned by `start`.
+        - traversal (FunctionTraversal): The ongoing traversal, which
+          gives access to the parents of the visited nodes.
+        """
+        raise NotImplementedError
+
+    def finish(
+        self, state: dict[str, any], traversal: FunctionTraversal
+    ) -> list[dict[str, any]]:
+        """
+        Completes the detection once every node has been visited.
+
+        Parameters:
+        - state (dict[str, any]): The state returned by `start`.
+        - traversal (FunctionTraversal): The completed traversal.
+
+        Returns:
+        - list[dict[str, any]]: The detected smells.
+        """
+        return state["smells"]
+
+    @staticmethod
+    def library_by_alias(extracted_data: dict[str, any]) -> dict[str, str]:
+        """
+        Returns the names bound by the imports of the file, mapped to the
+        modules or symbols they refer to. They are derived from the
+        libraries when the extracted data does not include them.
+
+        Parameters:
+        - extracted_data (dict[str, any]): The extracted data.
+
+        Returns:
+        - dict[str, str]: The library (or symbol) of every alias.
+        """
+        library_by_alias = extracted_data.get("library_by_alias")
+        if library_by_alias is None:
+            library_by_alias = LibraryExtractor.get_library_by_alias(
+                extracted_data.get("libraries", {})
+            )
+        return library_by_alias
 
     def format_smell(
         self, line: int, additional_info: str = ""
@@ -198,7 +198,9 @@ class CodeSmellDetectorGUI:
             print(f"Resume Execution: {is_resume}")
             print(f"Analyze multiple projects: {is_multiple}")
 
-            self.project_analyzer = ProjectAnalyzer(output_path)
+            self.project_analyzer = ProjectAnalyzer(
+                output_path, resume=is_resume
+            )
 
             if not is_resume:
                 self.project_analyzer.clean_output_directory()
@@ -210,6 +212,7 @@ class CodeSmellDetectorGUI:
                     self.project_analyzer.analyze_projects_parallel(
                         base_path=input_path,
                         max_workers=num_walkers,
+                        resume=is_resume,
                     )
                 else:
                     self.project_analyzer.analyze_projects_sequential(
@@ -219,12 +222,14 @@ class CodeSmellDetectorGUI:
                 self.project_analyzer.merge_all_results()
             else:
                 total_smells = self.project_analyzer.analyze_project(
-                    input_path
+                    input_path, resume=is_resume
                 )
                 print(
                     f"Analysis completed. "
                     f"Total code smells found: {total_smells}"
                 )
 
+            self.project_analyzer.close()
+
         except Exception as e:
             print(f"An error occurred during analysis: {e}")
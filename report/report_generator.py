@@ -1,7 +1,6 @@
 import argparse
 import os
 import sys
-from matplotlib import pyplot as plt
 import pandas as pd
 
 
@@ -13,6 +12,7 @@ class ReportGenerator:
         Parameters:
         - input_path (str): The path to the
           directory or CSV file containing the input data.
+          Parquet results, partitioned by project, are read as well.
         - output_path (str): The directory where the reports will be saved.
         """
         self.input_path = input_path
@@ -22,10 +22,10 @@ class ReportGenerator:
         """
         Checks if the input path is the 'project_details'
         folder or contains it.
-        If found, gathers all CSV files for processing.
+        If found, gathers all CSV (or Parquet) files for processing.
 
         Returns:
-        - list: A list of CSV file paths within the
+        - list: A list of CSV and Parquet file paths within the
          'project_details' directory.
         """
         # Check if the input path is directly the `project_details` folder
@@ -49,15 +49,23 @@ class ReportGenerator:
             for f in os.listdir(project_details_path)
             if f.endswith(".csv")
         ]
-        if not csv_files:
+        # Parquet results are in the `project=<name>` folder of each project
+        parquet_files = [
+            os.path.join(subdir, f)
+            for subdir, _, files in os.walk(project_details_path)
+            for f in sorted(files)
+            if f.endswith(".parquet")
+        ]
+        if not csv_files and not parquet_files:
             raise FileNotFoundError(
-                f"No CSV files found in {project_details_path}."
+                f"No CSV or Parquet files found in {project_details_path}."
             )
-        return csv_files
+        return csv_files + parquet_files
 
     def _load_data(self, file_paths):
         """
-        Loads data from multiple CSV files into a single DataFrame.
+        Loads data from multiple CSV (or Parquet) files
+        into a single DataFrame.
 
         Parameters:
         - file_paths (list): List of file paths to load.
@@ -68,7 +76,11 @@ class ReportGenerator:
         dfs = []
         for file in file_paths:
             print(f"Loading file: {file}")
-            dfs.append(pd.read_csv(file))
+            if file.endswith(".parquet"):
+                # Reading Parquet files requires pyarrow
+                dfs.append(pd.read_parquet(file))
+            else:
+                dfs.append(pd.read_csv(file))
         return pd.concat(dfs, ignore_index=True)
 
     def smell_report(self, df):
@@ -150,6 +162,9 @@ class ReportGenerator:
 
     def visualize_smell_report(self, df):
         """Generates a bar chart for the general smell overview."""
+        # Matplotlib is only imported when a chart is plotted
+        from matplotlib import pyplot as plt
+
         report = (
             df.groupby("smell_name")["filename"]
             .count()
@@ -182,8 +197,8 @@ class ReportGenerator:
         Handles user input and orchestrates report generation.
         """
         try:
-            csv_files = self._find_project_details()
-            df = self._load_data(csv_files)
+            result_files = self._find_project_details()
+            df = self._load_data(result_files)
             choice = self.menu()
             if choice == "1":
                 self.smell_report(df)
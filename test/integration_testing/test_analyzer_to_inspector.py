@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch, call
 import os
 import pandas as pd
 from components.project_analyzer import ProjectAnalyzer
+from components.smell_collector import SmellCollector
 
 
 @pytest.fixture
@@ -38,27 +39,31 @@ def test_project_analyzer_calls_inspect(
 
     mock_fragment = {"file": "test_file1.py", "nodes": [], "edges": []}
 
-    mock_instance.inspect.return_value = (mock_df, mock_fragment)
+    mock_smells = SmellCollector()
+    mock_smells.extend_frame(mock_df)
+    mock_instance.collect.return_value = (mock_smells, mock_fragment)
     mock_inspector_class.return_value = mock_instance
 
     input_path, output_path = project_analyzer_setup
 
     analyzer = ProjectAnalyzer(output_path=output_path)
 
-    # Enable callgraph so Inspector.inspect is called with include_callgraph=True
+    # Enable callgraph so Inspector.collect is called with include_callgraph=True
     total_smells = analyzer.analyze_project(input_path, enable_callgraph=True)
 
     expected_calls = [
         call(
             str(os.path.join(input_path, "test_file1.py")),
             include_callgraph=True,
+            include_hash=True,
         ),
         call(
             str(os.path.join(input_path, "test_file2.py")),
             include_callgraph=True,
+            include_hash=True,
         ),
     ]
-    mock_instance.inspect.assert_has_calls(expected_calls, any_order=True)
+    mock_instance.collect.assert_has_calls(expected_calls, any_order=True)
 
     assert total_smells == 2
 
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import Mock, patch
 from cli.cli_runner import CodeSmileCLI
 
@@ -18,20 +19,49 @@ def test_cli_calls_project_analyzer(mock_analyzer):
         enable_callgraph=False,
         callgraph_output=None,
         exclude_paths=[],
+        no_gitignore=False,
         format="csv",
+        no_cache=False,
+        cache_dir=None,
+        jobs=1,
+        executor="process",
+        prefilter=False,
+        rules=None,
+        skip_rules=None,
+        profile=None,
+        profile_rules=False,
+        slowest_files=10,
+        shard_index=0,
+        shard_count=1,
+        partition_by_smell=False,
     )
 
     cli = CodeSmileCLI(args)
 
     cli.execute()
 
-    mock_analyzer.assert_called_once_with("/fake/output")
+    mock_analyzer.assert_called_once_with(
+        "/fake/output",
+        cache_dir=os.path.join("/fake/output", "cache"),
+        jobs=1,
+        prefilter=False,
+        rules=None,
+        skip_rules=None,
+        profile=None,
+        slowest_files=10,
+        executor="process",
+        gitignore=True,
+        resume=False,
+        shard_index=0,
+        shard_count=1,
+    )
     mock_instance.analyze_project.assert_called_once_with(
         "/fake/input",
         enable_callgraph=False,
         callgraph_output=None,
         exclude_paths=[],
         report_format="csv",
+        resume=False,
     )
 
     print("Test Passed: CLI → ProjectAnalyzer")
@@ -2,6 +2,7 @@ import pytest
 import os
 import pandas as pd
 from unittest.mock import Mock, patch
+from components.smell_collector import SmellCollector
 from cli.cli_runner import CodeSmileCLI
 
 
@@ -27,18 +28,16 @@ def process_data():
 
 @patch("components.rule_checker.RuleChecker.rule_check")
 def test_full_integration_with_cli(mock_rule_check, integration_setup):
-    mock_rule_check.return_value = pd.DataFrame(
-        [
-            {
-                "filename": "test_file.py",
-                "function_name": "process_data",
-                "smell_name": "MockedSmell",
-                "line": 3,
-                "description": "Mocked smell detected",
-                "additional_info": "None",
-            }
-        ]
+    mock_smells = SmellCollector()
+    mock_smells.add(
+        "test_file.py",
+        "process_data",
+        "MockedSmell",
+        3,
+        "Mocked smell detected",
+        "None",
     )
+    mock_rule_check.return_value = mock_smells
 
     input_path, output_path = integration_setup
 
@@ -52,7 +51,19 @@ def test_full_integration_with_cli(mock_rule_check, integration_setup):
         enable_callgraph=False,
         callgraph_output=None,
         exclude_paths=[],
+        no_gitignore=False,
         format="csv",
+        jobs=1,
+        executor="process",
+        prefilter=False,
+        rules=None,
+        skip_rules=None,
+        profile=None,
+        profile_rules=False,
+        slowest_files=10,
+        shard_index=0,
+        shard_count=1,
+        partition_by_smell=False,
     )
 
     cli = CodeSmileCLI(args)
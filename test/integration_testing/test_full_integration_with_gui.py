@@ -3,6 +3,7 @@ import os
 import pandas as pd
 from tkinter import Tk
 from unittest.mock import Mock, patch
+from components.smell_collector import SmellCollector
 from gui.code_smell_detector_gui import CodeSmellDetectorGUI
 
 
@@ -31,18 +32,16 @@ def process_data():
 def test_full_integration_with_gui(
     mock_rule_check, mock_textbox_redirect, integration_setup
 ):
-    mock_rule_check.return_value = pd.DataFrame(
-        [
-            {
-                "filename": "test_file.py",
-                "function_name": "process_data",
-                "smell_name": "MockedSmell",
-                "line": 3,
-                "description": "Mocked smell detected",
-                "additional_info": "None",
-            }
-        ]
+    mock_smells = SmellCollector()
+    mock_smells.add(
+        "test_file.py",
+        "process_data",
+        "MockedSmell",
+        3,
+        "Mocked smell detected",
+        "None",
     )
+    mock_rule_check.return_value = mock_smells
 
     mock_textbox_redirect.return_value.write = Mock()
 
@@ -31,5 +31,7 @@ def test_gui_calls_project_analyzer(mock_analyzer, gui_setup):
         is_multiple=False,
     )
 
-    mock_instance.analyze_project.assert_called_once_with("/fake/input")
+    mock_instance.analyze_project.assert_called_once_with(
+        "/fake/input", resume=False
+    )
     print("Test Passed: GUI → ProjectAnalyzer")
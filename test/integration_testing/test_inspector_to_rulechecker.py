@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import patch
-import pandas as pd
 from components.inspector import Inspector
+from components.smell_collector import SmellCollector
 
 
 @pytest.fixture
@@ -46,32 +46,34 @@ def test_inspector_to_rulechecker(
     }
     mock_model_extractor.return_value.model_dict = {}
 
-    mock_rule_checker.return_value.rule_check.return_value = pd.DataFrame(
-        [
-            {
-                "filename": "test_file.py",
-                "function_name": "main",
-                "smell_name": "MockedSmell",
-                "line": 3,
-                "description": "Mocked smell detected",
-                "additional_info": "None",
-            }
-        ]
+    mock_smells = SmellCollector()
+    mock_smells.add(
+        "test_file.py",
+        "main",
+        "MockedSmell",
+        3,
+        "Mocked smell detected",
+        "None",
     )
+    mock_rule_checker.return_value.rule_check.return_value = mock_smells
 
     inspector = Inspector(output_path="output")
 
     result = inspector.inspect(inspector_setup)
 
     mock_library_extractor.return_value.extract_libraries.assert_called_once()
+    # Data is extracted and rules are checked once per scope:
+    # the function and the module-level code
     mock_dataframe_instance = mock_dataframe_extractor.return_value
-    mock_dataframe_instance.extract_dataframe_variables.assert_called_once()
+    assert mock_dataframe_instance.extract_dataframe_variables.call_count == 2
     mock_variable_instance = mock_variable_extractor.return_value
-    mock_variable_instance.extract_variable_definitions.assert_called_once()
+    assert mock_variable_instance.extract_variable_definitions.call_count == 2
 
-    mock_model_extractor.return_value.load_model_dict.assert_called_once()
+    # The model dictionaries come from the compiled index, not from pandas
+    mock_model_extractor.return_value.load_model_dict.assert_not_called()
+    assert "Sequential()" in inspector.dictionaries.model_methods
 
-    mock_rule_checker.return_value.rule_check.assert_called_once()
+    assert mock_rule_checker.return_value.rule_check.call_count == 2
 
     assert not result.empty
     assert "smell_name" in result.columns
@@ -0,0 +1,48 @@
+from benchmarks.benchmark_runner import BenchmarkRunner, run_scenario
+from benchmarks.corpus_generator import CorpusGenerator
+from components.rule_checker import RuleChecker
+
+
+def test_run_scenario(tmp_path):
+    """
+    Test that a scenario reports its throughput, memory and rule costs.
+    """
+    CorpusGenerator(files_per_project=3, projects=2).generate(str(tmp_path))
+
+    result = run_scenario("inspector", str(tmp_path), workers=1)
+
+    assert result["files"] == 6
+    assert result["files_per_second"] > 0
+    assert result["peak_rss_mb"] is None or result["peak_rss_mb"] > 0
+    assert result["rules"]
+    assert set(result["rules"]) <= set(RuleChecker.RULES)
+
+
+def test_compare_against_baseline():
+    """
+    Test that slowdowns and memory growth beyond the tolerance are
+    reported as regressions.
+    """
+    baseline = {
+        "scenarios": {
+            "inspector": {"files_per_second": 100.0, "peak_rss_mb": 100.0},
+            "callgraph": {"files_per_second": 500.0, "peak_rss_mb": 80.0},
+        }
+    }
+    results = {
+        "scenarios": {
+            "inspector": {"files_per_second": 95.0, "peak_rss_mb": 130.0},
+            "callgraph": {"files_per_second": 400.0, "peak_rss_mb": 80.0},
+            "project_analyzer_parallel": {
+                "files_per_second": 1.0,
+                "peak_rss_mb": 1000.0,
+            },
+        }
+    }
+
+    regressions = BenchmarkRunner.compare(results, baseline, tolerance=0.1)
+
+    assert regressions == [
+        "inspector: peak_rss_mb 130.0 MiB, baseline 100.0 MiB",
+        "callgraph: 400.0 files/s, baseline 500.0 files/s",
+    ]
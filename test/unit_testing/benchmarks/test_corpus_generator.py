@@ -0,0 +1,67 @@
+import ast
+import os
+from benchmarks.corpus_generator import CorpusGenerator
+from components.inspector import Inspector
+
+
+def test_generate_projects(tmp_path):
+    """
+    Test that the corpus has the requested projects, files and functions.
+    """
+    generator = CorpusGenerator(
+        files_per_project=3, functions_per_file=4, projects=2
+    )
+
+    project_paths = generator.generate(str(tmp_path))
+
+    assert sorted(os.listdir(tmp_path)) == ["project_0", "project_1"]
+    for project_path in project_paths:
+        module_path = os.path.join(project_path, "package_0", "module_2.py")
+        with open(module_path) as file:
+            tree = ast.parse(file.read())
+        functions = [
+            node.name for node in tree.body
+            if isinstance(node, ast.FunctionDef)
+        ]
+        assert len(functions) == 5
+        assert functions[-1] == "run_all"
+
+
+def test_generation_is_reproducible(tmp_path):
+    """
+    Test that the same seed generates the same corpus.
+    """
+    for name in ("first", "second"):
+        CorpusGenerator(files_per_project=2, seed=7).generate(
+            str(tmp_path / name)
+        )
+
+    module = os.path.join("project_0", "package_0", "module_1.py")
+    assert (tmp_path / "first" / module).read_text() == (
+        tmp_path / "second" / module
+    ).read_text()
+
+
+def test_smell_density_and_nesting(tmp_path):
+    """
+    Test that smelly functions are only generated with a positive
+    density, and that function bodies are nested as requested.
+    """
+    inspector = Inspector(output_path=str(tmp_path))
+    for density, expect_smells in ((0.0, False), (1.0, True)):
+        generator = CorpusGenerator(
+            files_per_project=1,
+            functions_per_file=20,
+            nesting_depth=2,
+            smell_density=density,
+        )
+        (project_path,) = generator.generate(str(tmp_path / str(density)))
+        module_path = os.path.join(project_path, "package_0", "module_0.py")
+
+        smells = inspector.inspect(module_path)
+
+        assert (len(smells) > 0) == expect_smells
+        with open(module_path) as file:
+            function = ast.parse(file.read()).body[-2]
+        assert isinstance(function.body[0], ast.If)
+        assert isinstance(function.body[0].body[0], ast.For)
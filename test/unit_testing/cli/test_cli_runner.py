@@ -1,4 +1,8 @@
+import os
+import subprocess
+import sys
 import pytest
+import pandas as pd
 from unittest.mock import MagicMock, patch
 from cli.cli_runner import CodeSmileCLI
 
@@ -15,7 +19,22 @@ def _add_cr2_args(args):
     args.enable_callgraph = False
     args.callgraph_output = None
     args.exclude_paths = []
+    args.no_gitignore = False
     args.format = "csv"
+    # Result cache options
+    args.no_cache = True
+    args.cache_dir = None
+    args.jobs = 1
+    args.executor = "process"
+    args.prefilter = False
+    args.rules = None
+    args.skip_rules = None
+    args.profile = None
+    args.profile_rules = False
+    args.slowest_files = 10
+    args.shard_index = 0
+    args.shard_count = 1
+    args.partition_by_smell = False
     return args
 
 
@@ -48,6 +67,7 @@ def test_execute_with_valid_arguments(mock_analyzer):
             callgraph_output=None,
             exclude_paths=[],
             report_format="csv",
+            resume=False,
         )
         mock_print.assert_any_call("Analysis completed. Total code smells found: 2")
 
@@ -129,6 +149,7 @@ def test_execute_with_parallel_execution(mock_analyzer):
             callgraph_output=None,
             exclude_paths=[],
             report_format="csv",
+            resume=False,
         )
         mock_analyzer.merge_all_results.assert_called_once()
         mock_print.assert_any_call("Analysis results saved successfully.")
@@ -162,6 +183,7 @@ def test_execute_with_sequential_execution(mock_analyzer):
             callgraph_output=None,
             exclude_paths=[],
             report_format="csv",
+            resume=False,
         )
         mock_print.assert_any_call("Analysis completed. Total code smells found: 2")
 
@@ -196,6 +218,7 @@ def test_execute_with_resume(mock_analyzer):
             callgraph_output=None,
             exclude_paths=[],
             report_format="csv",
+            resume=True,
         )
         mock_print.assert_any_call("Analysis completed. Total code smells found: 2")
 
@@ -277,3 +300,156 @@ def test_execute_with_invalid_max_walkers_and_parallel(mock_analyzer):
 
     with pytest.raises(ValueError, match="max_walkers must be greater than 0."):
         cli.execute()
+
+
+def test_execute_with_invalid_jobs(mock_analyzer):
+    args = MagicMock()
+    args.input = "mock_input"
+    args.output = "mock_output"
+    args.parallel = False
+    args.max_walkers = 5
+    args.resume = False
+    args.multiple = False
+    _add_cr2_args(args)
+    args.jobs = 0  # Invalid jobs
+
+    cli = CodeSmileCLI(args)
+    cli.analyzer = mock_analyzer  # Inject the mock analyzer
+
+    with pytest.raises(ValueError, match="jobs must be greater than 0."):
+        cli.execute()
+
+
+# Import time budget of the CLI (in microseconds), as measured by
+# `python -X importtime`; importing Pandas alone takes longer
+COLD_START_BUDGET = 300_000
+
+
+def _import_times(code):
+    """
+    Runs Python code with `-X importtime` from the root of the repository.
+
+    Returns the cumulative import time of every module, and the total of
+    the top-level imports, in microseconds.
+    """
+    root = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+
+    # Lines read "import time: <self> | <cumulative> | <module>", the
+    # module indented by its nesting level
+    cumulative = {}
+    total = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, microseconds, module = line.split("|")
+        cumulative[module.strip()] = int(microseconds)
+        if not module.startswith("  "):
+            total += int(microseconds)
+    return cumulative, total
+
+
+def test_cold_start_defers_heavy_imports():
+    cumulative, _ = _import_times("import cli.cli_runner")
+
+    assert "cli.cli_runner" in cumulative
+    for heavy in (
+        "pandas",
+        "numpy",
+        "matplotlib",
+        "concurrent.futures",
+        "sqlite3",
+    ):
+        assert heavy not in cumulative
+    assert cumulative["cli.cli_runner"] < COLD_START_BUDGET
+
+
+def test_help_does_not_discover_rule_plugins():
+    # Building the parser and printing the help neither imports the heavy
+    # libraries nor lists the rules, which looks up the installed plugins
+    cumulative, total = _import_times(
+        "import sys; sys.argv = ['cli_runner', '--help']; "
+        "from cli.cli_runner import main; main()"
+    )
+
+    assert "cli.cli_runner" in cumulative
+    for heavy in ("pandas", "numpy", "matplotlib", "importlib.metadata"):
+        assert heavy not in cumulative
+    assert total < COLD_START_BUDGET
+
+
+def test_unknown_rules_are_rejected(tmp_path):
+    root = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    )
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "cli.cli_runner",
+            "--input",
+            str(tmp_path),
+            "--output",
+            str(tmp_path),
+            "--skip-rules",
+            "chain_indexing",
+            "slow_loop",
+        ],
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+
+    assert completed.returncode == 2
+    assert "argument --skip-rules: invalid choice: slow_loop" in (
+        completed.stderr
+    )
+    assert not (tmp_path / "output").exists()
+
+
+def test_parquet_project_details_are_a_dataset(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+
+    root = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    )
+    projects = tmp_path / "projects"
+    for name in ("alpha", "beta"):
+        (projects / name).mkdir(parents=True)
+        (projects / name / "load.py").write_text(
+            "import pandas as pd\n"
+            "def load():\n"
+            "    df = pd.read_csv('data.csv')\n"
+            "    return df['a'][0]\n"
+        )
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "cli.cli_runner",
+            "--input",
+            str(projects),
+            "--output",
+            str(tmp_path / "results"),
+            "--multiple",
+            "--format",
+            "parquet",
+        ],
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    details = tmp_path / "results" / "output" / "project_details"
+    frame = pd.read_parquet(details)
+    assert sorted(frame["project"].astype(str).unique()) == ["alpha", "beta"]
+    assert ds.dataset(details, partitioning="hive").count_rows() == len(frame)
@@ -0,0 +1,116 @@
+import os
+import pytest
+from utils.file_discovery import FileDiscovery, PathMatcher
+
+
+@pytest.fixture
+def project(tmp_path):
+    """
+    Fixture creating a project with ignored, vendored and nested files.
+    """
+    root = tmp_path / "project"
+    files = [
+        "main.py",
+        "notes.txt",
+        "generated_pb2.py",
+        "src/model.py",
+        "src/scratch.py",
+        "src/keep/scratch.py",
+        "src/tests/fixtures/data.py",
+        "tests/test_model.py",
+        "node_modules/pkg/setup.py",
+        ".tox/py311/site.py",
+        "build/lib/model.py",
+        "docs/site-packages/six.py",
+    ]
+    for filename in files:
+        path = root / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    (root / ".gitignore").write_text("# Generated code\n*_pb2.py\n")
+    (root / "src" / ".gitignore").write_text("scratch.py\n!keep/scratch.py\n")
+    return root
+
+
+def relative(files, root):
+    return sorted(
+        os.path.relpath(filename, root).replace(os.sep, "/")
+        for filename in files
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern, path, is_dir, expected",
+    [
+        ("*.py", "a/b/model.py", False, True),
+        ("/*.py", "a/model.py", False, None),
+        ("src/*.py", "src/model.py", False, True),
+        ("src/*.py", "src/nested/model.py", False, None),
+        ("**/fixtures", "src/tests/fixtures", True, True),
+        ("data/**", "data/a/b.py", False, True),
+        ("a/**/b.py", "a/b.py", False, True),
+        ("a/**/b.py", "a/x/y/b.py", False, True),
+        ("build/", "build", False, None),
+        ("build/", "build", True, True),
+        ("model_[0-9].py", "model_1.py", False, True),
+        ("model_[!0-9].py", "model_1.py", False, None),
+        ("model?.py", "model1.py", False, True),
+    ],
+)
+def test_path_matcher(pattern, path, is_dir, expected):
+    assert PathMatcher([pattern]).match(path, is_dir) is expected
+
+
+def test_path_matcher_last_pattern_wins():
+    matcher = PathMatcher(["*.py", "!keep_*.py", "keep_me_not.py"])
+
+    assert matcher.match("drop.py") is True
+    assert matcher.match("keep_this.py") is False
+    assert matcher.match("keep_me_not.py") is True
+    assert matcher.match("README.md") is None
+
+
+def test_discover_skips_ignored_and_vendored(project):
+    files = FileDiscovery().discover(str(project))
+
+    assert relative(files, project) == [
+        "main.py",
+        "src/keep/scratch.py",
+        "src/model.py",
+        "src/tests/fixtures/data.py",
+        "tests/test_model.py",
+    ]
+    assert all(os.path.isabs(filename) for filename in files)
+
+
+def test_discover_without_gitignore(project):
+    files = FileDiscovery(gitignore=False).discover(str(project))
+
+    assert "generated_pb2.py" in relative(files, project)
+    assert "src/scratch.py" in relative(files, project)
+
+
+def test_discover_excludes_patterns(project):
+    files = FileDiscovery(
+        ["tests", "**/fixtures", str(project / "src" / "model.py")]
+    ).discover(str(project))
+
+    assert relative(files, project) == ["main.py", "src/keep/scratch.py"]
+
+
+def test_discover_in_parallel_keeps_order(project):
+    for index in range(20):
+        (project / "pkg" / f"sub{index}").mkdir(parents=True)
+        (project / "pkg" / f"sub{index}" / "module.py").write_text("")
+
+    assert FileDiscovery(workers=4).discover(
+        str(project)
+    ) == FileDiscovery().discover(str(project))
+
+
+def test_discover_single_file(project):
+    path = str(project / "main.py")
+
+    assert FileDiscovery().discover(path) == [path]
+    assert FileDiscovery(["main.py"]).discover(path) == []
+    assert FileDiscovery().discover(str(project / "notes.txt")) == []
@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 from unittest.mock import mock_open, patch, MagicMock
 import os
+from components.result_sink import ResultSink
 from utils.file_utils import FileUtils
 
 
@@ -23,22 +24,6 @@ def mock_file_system():
         )
 
 
-@pytest.fixture
-def mock_walk():
-    with patch("os.walk") as mock_walk:
-        yield mock_walk
-
-
-@pytest.fixture
-def mock_merge():
-    with patch("os.makedirs") as mock_makedirs, patch(
-        "os.walk"
-    ) as mock_walk, patch("pandas.read_csv") as mock_read_csv, patch(
-        "pandas.DataFrame.to_csv"
-    ) as mock_to_csv:
-        yield mock_makedirs, mock_walk, mock_read_csv, mock_to_csv
-
-
 def test_clean_directory(mock_file_system):
     mock_exists, mock_makedirs, mock_listdir, mock_rmtree, mock_unlink = (
         mock_file_system
@@ -72,24 +57,30 @@ def test_clean_directory(mock_file_system):
     assert cleaned_path == os.path.join(root_path, subfolder_name)
 
 
-def test_get_python_files(mock_walk):
-    # Mock os.walk to simulate directory structure
-    mock_walk.return_value = [
-        ("root", ["subdir1", "subdir2"], ["file1.py", "file2.txt"]),
-        ("root/subdir1", [], ["file3.py"]),
-        ("root/subdir2", [], ["file4.py"]),
-    ]
+def test_get_python_files(tmp_path):
+    # Simulate a directory structure
+    root = tmp_path / "root"
+    for directory in ("subdir1", "subdir2", "venv"):
+        (root / directory).mkdir(parents=True)
+    for filename in (
+        "file1.py",
+        "file2.txt",
+        "subdir1/file3.py",
+        "subdir2/file4.py",
+        "venv/file5.py",
+    ):
+        (root / filename).write_text("")
 
-    path = "root"
+    path = str(root)
 
     # Call the method
     python_files = FileUtils.get_python_files(path)
 
     # Calculate the expected absolute paths dynamically
     expected_files = [
-        os.path.abspath(os.path.join("root", "file1.py")),
-        os.path.abspath(os.path.join("root/subdir1", "file3.py")),
-        os.path.abspath(os.path.join("root/subdir2", "file4.py")),
+        os.path.abspath(os.path.join(path, "file1.py")),
+        os.path.abspath(os.path.join(path, "subdir1", "file3.py")),
+        os.path.abspath(os.path.join(path, "subdir2", "file4.py")),
     ]
 
     # Assert that only Python files are returned with absolute paths
@@ -98,40 +89,85 @@ def test_get_python_files(mock_walk):
     assert expected_files[1] in python_files
     assert expected_files[2] in python_files
     assert (
-        os.path.abspath(os.path.join("root", "file2.txt")) not in python_files
+        os.path.abspath(os.path.join(path, "file2.txt")) not in python_files
     )  # Non-Python file
 
 
-def test_merge_results(mock_merge):
-    mock_makedirs, mock_walk, mock_read_csv, mock_to_csv = mock_merge
+def test_merge_results(tmp_path):
+    input_dir = tmp_path / "project_details"
+    input_dir.mkdir()
+    pd.DataFrame({"filename": ["file1"], "data": [1]}).to_csv(
+        input_dir / "file1.csv", index=False
+    )
+    pd.DataFrame({"filename": ["file2"], "data": [2]}).to_csv(
+        input_dir / "file2.csv", index=False
+    )
+    (input_dir / "empty.csv").write_text("")
+    output_dir = tmp_path / "output"
 
-    # Mock os.walk to simulate the directory structure and files
-    mock_walk.return_value = [("mock_input", [], ["file1.csv", "file2.csv"])]
+    # Call the method
+    FileUtils.merge_results(str(input_dir), str(output_dir))
 
-    # Mock pandas read_csv for the two files
-    mock_read_csv.side_effect = [
-        pd.DataFrame({"filename": ["file1"], "data": [1]}),  # Not empty
-        pd.DataFrame({"filename": ["file2"], "data": [2]}),  # Not empty
-    ]
+    # Assert that the merged result is saved to the correct file
+    merged = pd.read_csv(output_dir / "overview.csv")
+    assert list(merged.columns) == ["filename", "data"]
+    assert sorted(merged["filename"]) == ["file1", "file2"]
+    assert sorted(merged["data"]) == [1, 2]
 
-    # Mock to_csv (no actual file writing will occur)
-    mock_to_csv.return_value = None
 
-    input_dir = "mock_input"
-    output_dir = "mock_output"
+def test_merge_results_json_lines(tmp_path):
+    input_dir = tmp_path / "project_details"
+    input_dir.mkdir()
+    (input_dir / "project1_results.jsonl").write_text(
+        '{"filename": "file1", "line": 1}\n'
+        '{"filename": "file2", "line": 2}\n'
+    )
+    output_dir = tmp_path / "output"
 
-    # Call the method
-    FileUtils.merge_results(input_dir, output_dir)
+    FileUtils.merge_results(
+        str(input_dir), str(output_dir), report_format="jsonl"
+    )
+
+    merged = pd.read_json(output_dir / "overview.jsonl", lines=True)
+    assert merged["filename"].tolist() == ["file1", "file2"]
+    assert merged["line"].tolist() == [1, 2]
 
-    # Assert that makedirs was called for the output directory
-    mock_makedirs.assert_called_once_with(output_dir, exist_ok=True)
 
-    # Assert that to_csv was called to
-    # save the merged result to the correct file
-    mock_to_csv.assert_called_once_with(
-        os.path.join(output_dir, "overview.csv"), index=False
+def test_merge_results_parquet_dataset(tmp_path):
+    pytest.importorskip("pyarrow")
+    input_dir = tmp_path / "project_details"
+    for project, smells in (("alpha", ["smell1", "smell2"]), ("beta", [])):
+        sink = ResultSink.open(
+            FileUtils.project_results_path(
+                str(input_dir), project, "parquet"
+            ),
+            "parquet",
+        )
+        sink.write_rows(
+            (f"{project}/file.py", "func", smell, 1, "desc", None)
+            for smell in smells
+        )
+        sink.close()
+    output_dir = tmp_path / "output"
+
+    FileUtils.merge_results(
+        str(input_dir),
+        str(output_dir),
+        report_format="parquet",
+        partition_by_smell=True,
     )
 
+    overview = output_dir / "overview.parquet"
+    assert sorted(path.name for path in overview.iterdir()) == [
+        "project=alpha"
+    ]
+    assert sorted(
+        path.name for path in (overview / "project=alpha").iterdir()
+    ) == ["smell_name=smell1", "smell_name=smell2"]
+    merged = pd.read_parquet(overview)
+    assert sorted(merged["smell_name"].astype(str)) == ["smell1", "smell2"]
+    assert set(merged["project"].astype(str)) == {"alpha"}
+
 
 def test_initialize_log():
     log_path = "mock_log.txt"
@@ -0,0 +1,107 @@
+import pytest
+from code_extractor import dictionary_index
+from code_extractor.dictionary_index import DictionaryIndex
+
+
+@pytest.fixture
+def dictionaries(tmp_path, monkeypatch):
+    # Every test starts without indexes loaded by the process
+    monkeypatch.setattr(dictionary_index, "_LOADED", {})
+
+    dataframes = tmp_path / "dataframes.csv"
+    dataframes.write_text(
+        "id,library,method,return_type\n"
+        "1,pandas,read_csv,DataFrame\n"
+        "2,pandas,merge,DataFrame\n"
+    )
+    models = tmp_path / "models.csv"
+    models.write_text(
+        "id,library,method\n"
+        "1,tensorflow,Sequential()\n"
+        "2,sklearn,SVC()\n"
+    )
+    tensors = tmp_path / "tensors.csv"
+    tensors.write_text(
+        "id,library,method_name,number_of_tensors_input\n"
+        "1,tensorflow,constant,1\n"
+        "2,tensorflow,matmul,2\n"
+    )
+    return [str(dataframes), str(models), str(tensors)]
+
+
+def test_load_compiles_dictionaries(dictionaries, tmp_path):
+    index = DictionaryIndex.load(*dictionaries, cache_dir=str(tmp_path))
+
+    assert index.dataframe_methods == frozenset({"read_csv", "merge"})
+    assert index.tensor_operations == frozenset({"matmul"})
+    assert index.model_methods == ("Sequential()", "SVC()")
+    assert index.model_names == frozenset({"Sequential", "SVC"})
+    assert index.models["library"] == ("tensorflow", "sklearn")
+    assert index.has_model_method("SVC()", ["sklearn", "torch"])
+    assert not index.has_model_method("SVC()", ["tensorflow"])
+
+
+def test_load_uses_binary_cache(dictionaries, tmp_path, monkeypatch, mocker):
+    cache_dir = tmp_path / "cache"
+    first = DictionaryIndex.load(*dictionaries, cache_dir=str(cache_dir))
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # The same process reuses the loaded index
+    assert DictionaryIndex.load(*dictionaries) is first
+
+    # Another process loads the cache without parsing the CSV files
+    monkeypatch.setattr(dictionary_index, "_LOADED", {})
+    compile_index = mocker.spy(DictionaryIndex, "_compile")
+    second = DictionaryIndex.load(*dictionaries, cache_dir=str(cache_dir))
+    compile_index.assert_not_called()
+    assert second == first
+
+
+def test_load_recompiles_changed_dictionaries(dictionaries, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    DictionaryIndex.load(*dictionaries, cache_dir=cache_dir)
+
+    with open(dictionaries[0], "a") as file:
+        file.write("3,pandas,pivot,DataFrame\n")
+    index = DictionaryIndex.load(*dictionaries, cache_dir=cache_dir)
+
+    assert "pivot" in index.dataframe_methods
+
+
+def test_load_missing_dictionary(dictionaries, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        DictionaryIndex.load(
+            str(tmp_path / "missing.csv"),
+            *dictionaries[1:],
+            cache_dir=str(tmp_path),
+        )
+
+
+def test_load_missing_columns(dictionaries, tmp_path):
+    with open(dictionaries[1], "w") as file:
+        file.write("id,name\n1,Sequential()\n")
+
+    with pytest.raises(ValueError):
+        DictionaryIndex.load(*dictionaries, cache_dir=str(tmp_path))
+
+
+def test_load_defaults_to_user_cache_dir(dictionaries, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "user_cache"))
+
+    DictionaryIndex.load(*dictionaries)
+
+    assert len(list((tmp_path / "user_cache" / "codesmile").iterdir())) == 1
+    assert not (tmp_path / "__pycache__").exists()
+
+
+def test_load_without_writable_cache_dir(dictionaries, tmp_path):
+    # A file where the cache folder should be: the cache cannot be written
+    blocked = tmp_path / "blocked"
+    blocked.write_text("")
+
+    index = DictionaryIndex.load(
+        *dictionaries, cache_dir=str(blocked / "cache")
+    )
+
+    assert index.dataframe_methods == frozenset({"read_csv", "merge"})
+    assert list(tmp_path.glob("**/*.bin")) == []
@@ -57,6 +57,15 @@ def test_get_library_aliases(mocker, extractor):
     assert aliases == expected_aliases
 
 
+def test_get_library_by_alias():
+    """Test reversing the library aliases, the first library winning."""
+    aliases = {"pandas": "pd", "pandas.DataFrame": "pd", "numpy": "np"}
+
+    library_by_alias = LibraryExtractor.get_library_by_alias(aliases)
+
+    assert library_by_alias == {"pd": "pandas", "np": "numpy"}
+
+
 def test_get_library_of_node_method_call(mocker, extractor):
     """Test getting the library for a method call."""
     code = "import pandas as pd; pd.read_csv('file.csv')"
@@ -143,3 +152,14 @@ def test_get_library_of_node_empty(mocker, extractor):
     library_name = extractor.get_library_of_node(node, aliases)
 
     assert library_name == "Unknown"
+
+
+def test_imports_any():
+    """Test checking imported libraries, including their submodules."""
+    libraries = {"torch.nn": "nn", "os": "os", "numpy": "np"}
+
+    assert LibraryExtractor.imports_any(libraries, ("torch",))
+    assert LibraryExtractor.imports_any(libraries, ("pandas", "numpy"))
+    assert not LibraryExtractor.imports_any(libraries, ("pandas",))
+    assert not LibraryExtractor.imports_any({"torchvision": "tv"}, ("torch",))
+    assert not LibraryExtractor.imports_any({}, ("torch",))
@@ -0,0 +1,176 @@
+import json
+import os
+import pytest
+from concurrent.futures import Future
+from components.analysis_pipeline import (
+    AnalysisPipeline,
+    InlineExecutor,
+    PipelineProject,
+)
+from components.result_sink import ResultSink
+from components.smell_collector import SmellCollector
+
+
+def smells_of(filename, count=1):
+    """
+    Returns the smells of a file, as collected by the Inspector.
+    """
+    smells = SmellCollector()
+    for line in range(count):
+        smells.add(
+            filename=filename,
+            function_name="func",
+            smell_name="smell",
+            line=line + 1,
+            description="desc",
+            additional_info="info",
+        )
+    return smells
+
+
+class DeferredExecutor:
+    """
+    Leaves the submitted files pending, recording how many are in flight.
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.max_in_flight = 0
+
+    def submit(self, filename):
+        future = Future()
+        self.pending.append((future, filename))
+        self.max_in_flight = max(self.max_in_flight, len(self.pending))
+        return future
+
+    def wait(self, futures, return_when):
+        # Completes the latest file first, leaving the earlier ones pending
+        future, filename = self.pending.pop()
+        future.set_result(smells_of(filename))
+        return {future}, set()
+
+
+@pytest.fixture
+def project(tmp_path):
+    filenames = [f"module{index}.py" for index in range(5)]
+    return PipelineProject(
+        "project",
+        str(tmp_path),
+        filenames,
+        ResultSink.open(str(tmp_path / "results"), "jsonl"),
+    )
+
+
+def test_results_are_written_in_file_order(project, monkeypatch):
+    executor = DeferredExecutor()
+    monkeypatch.setattr("concurrent.futures.wait", executor.wait)
+    completed = []
+    pipeline = AnalysisPipeline(
+        executor.submit, window=3, on_project=completed.append
+    )
+
+    pipeline.run([project])
+    project.sink.close()
+
+    assert completed == [project]
+    assert executor.max_in_flight == 3
+    assert project.smells == 5
+    with open(project.sink.path) as file:
+        written = [json.loads(line)["filename"] for line in file]
+    assert written == project.filenames
+
+
+def test_file_errors_do_not_fail_the_project(tmp_path):
+    def inspect(filename):
+        if filename == "broken.py":
+            raise SyntaxError("invalid syntax")
+        return smells_of(filename, 2)
+
+    errors = []
+    project = PipelineProject(
+        "project",
+        str(tmp_path),
+        ["module.py", "broken.py"],
+        ResultSink.open(str(tmp_path / "results")),
+    )
+    pipeline = AnalysisPipeline(
+        lambda filename: InlineExecutor().submit(inspect, filename),
+        on_file_error=lambda filename, e: errors.append(filename),
+    )
+
+    pipeline.run([project])
+
+    assert project.error is None
+    assert project.smells == 2
+    assert errors == ["broken.py"]
+
+
+def test_failed_project_stops_being_analyzed(tmp_path):
+    inspected = []
+
+    def inspect(filename):
+        inspected.append(filename)
+        if filename == "failing/a.py":
+            raise PermissionError("denied")
+        return smells_of(filename)
+
+    projects = [
+        PipelineProject(
+            name,
+            str(tmp_path / name),
+            [f"{name}/a.py", f"{name}/b.py"],
+            ResultSink.open(str(tmp_path / name)),
+        )
+        for name in ("failing", "working")
+    ]
+    completed = []
+    pipeline = AnalysisPipeline(
+        lambda filename: InlineExecutor().submit(inspect, filename),
+        on_project=completed.append,
+    )
+
+    pipeline.run(projects)
+
+    assert completed == projects
+    assert isinstance(projects[0].error, PermissionError)
+    assert projects[1].error is None
+    assert projects[1].smells == 2
+    assert inspected == ["failing/a.py", "working/a.py", "working/b.py"]
+
+
+def test_largest_files_are_submitted_first(tmp_path):
+    for name, size in (("small.py", 1), ("large.py", 100), ("mid.py", 10)):
+        (tmp_path / name).write_text("x" * size)
+    filenames = [
+        str(tmp_path / name) for name in ("small.py", "large.py", "mid.py")
+    ]
+    submitted = []
+    project = PipelineProject(
+        "project",
+        str(tmp_path),
+        filenames,
+        ResultSink.open(str(tmp_path / "results")),
+    )
+
+    def submit(filename):
+        submitted.append(os.path.basename(filename))
+        return InlineExecutor().submit(smells_of, filename)
+
+    AnalysisPipeline(submit, largest_first=True).run([project])
+
+    assert submitted == ["large.py", "mid.py", "small.py"]
+    assert project.smells == 3
+
+
+def test_discover_excludes_paths(tmp_path):
+    (tmp_path / "vendor").mkdir()
+    (tmp_path / "vendor" / "lib.py").write_text("")
+    (tmp_path / "main.py").write_text("")
+    (tmp_path / "vendored.py").write_text("")
+
+    filenames = AnalysisPipeline.discover(str(tmp_path), ["vendor"])
+
+    assert sorted(os.path.basename(f) for f in filenames) == [
+        "main.py",
+        "vendored.py",
+    ]
@@ -0,0 +1,107 @@
+import ast
+import pytest
+from components.file_context import FileContext
+
+
+@pytest.fixture
+def source():
+    return (
+        "import pandas as pd\n"
+        "\n"
+        "def first():\n"
+        "    df = pd.DataFrame()\n"
+        "\n"
+        "def second():\n"
+        "    return 1\n"
+    )
+
+
+@pytest.fixture
+def file_context(source):
+    return FileContext.build(
+        filename="mock_file.py",
+        source=source,
+        tree=ast.parse(source),
+        libraries={"pandas": "pd", "pandas.DataFrame": "pd"},
+        dataframe_methods=["drop", "merge"],
+        tensor_operations=["matmul"],
+        models={"method": ["fit"], "library": ["sklearn"]},
+        model_methods=["fit"],
+    )
+
+
+def test_build_line_table(file_context):
+    """
+    Test that the line table maps the lines of the nodes to their code.
+    """
+    assert file_context.lines[1] == "import pandas as pd"
+    assert file_context.lines[4] == "    df = pd.DataFrame()"
+    assert 2 not in file_context.lines  # No node starts on a blank line
+
+
+def test_build_reverse_alias_map(file_context):
+    """
+    Test that aliases are mapped back to the first library using them.
+    """
+    assert file_context.library_by_alias == {"pd": "pandas"}
+
+
+def test_build_binds_imported_symbols():
+    """
+    Test that names imported from a module are mapped to the symbols they
+    refer to, unless they are already an alias.
+    """
+    source = (
+        "import numpy as np\n"
+        "from sklearn.svm import SVC\n"
+        "from torch import nn as neural\n"
+        "from os import *\n"
+        "from . import np\n"
+    )
+    context = FileContext.build(
+        filename="mock_file.py",
+        source=source,
+        tree=ast.parse(source),
+        libraries={
+            "numpy": "np",
+            "sklearn.svm.SVC": "sklearn.svm.SVC",
+            "torch.nn": "neural",
+            "os.*": "os.*",
+            "np": "np",
+        },
+        dataframe_methods=[],
+        tensor_operations=[],
+        models={},
+        model_methods=[],
+    )
+
+    assert context.library_by_alias["np"] == "numpy"
+    assert context.library_by_alias["SVC"] == "sklearn.svm.SVC"
+    assert context.library_by_alias["neural"] == "torch.nn"
+    assert "nn" not in context.library_by_alias
+    assert "*" not in context.library_by_alias
+
+
+def test_context_is_immutable(file_context):
+    """
+    Test that the context and its mappings cannot be modified.
+    """
+    with pytest.raises(AttributeError):
+        file_context.lines = {}
+    with pytest.raises(TypeError):
+        file_context.libraries["numpy"] = "np"
+
+
+def test_function_data_shares_file_data(file_context):
+    """
+    Test that the function data references the file-level data.
+    """
+    first = file_context.function_data({"df": None}, ["df"])
+    second = file_context.function_data({}, [])
+
+    assert first["lines"] is second["lines"] is file_context.lines
+    assert first["libraries"] is file_context.libraries
+    assert first["model_methods"] is file_context.model_methods
+    assert first["variables"] == {"df": None}
+    assert first["dataframe_variables"] == ["df"]
+    assert second["dataframe_variables"] == []
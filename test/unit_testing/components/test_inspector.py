@@ -2,7 +2,9 @@ import os
 import pytest
 import pandas as pd
 import ast
+from code_extractor.dataframe_extractor import DataFrameExtractor
 from components.inspector import Inspector
+from components.smell_collector import SmellCollector
 
 
 @pytest.fixture
@@ -23,6 +25,7 @@ def mock_inspector_dependencies(mocker):
     )
     MockModelExtractor = mocker.patch("components.inspector.ModelExtractor")
     MockRuleChecker = mocker.patch("components.inspector.RuleChecker")
+    mocker.patch("components.inspector.DictionaryIndex")
 
     yield {
         "mock_open": mock_open_file,
@@ -74,34 +77,14 @@ def test_inspect(mock_inspector_dependencies):
         "method1": "details"
     }
 
-    mock_rule_checker.rule_check.return_value = pd.DataFrame(
-        data=[
-            [
-                "mock_file.py",
-                "my_function",
-                "smell1",
-                10,
-                "description1",
-                "info1",
-            ],
-            [
-                "mock_file.py",
-                "my_function",
-                "smell2",
-                15,
-                "description2",
-                "info2",
-            ],
-        ],
-        columns=[
-            "filename",
-            "function_name",
-            "smell_name",
-            "line",
-            "description",
-            "additional_info",
-        ],
+    mock_smells = SmellCollector()
+    mock_smells.add(
+        "mock_file.py", "my_function", "smell1", 10, "description1", "info1"
+    )
+    mock_smells.add(
+        "mock_file.py", "my_function", "smell2", 15, "description2", "info2"
     )
+    mock_rule_checker.rule_check.return_value = mock_smells
 
     # Mock file contents
     mock_file_contents = """\
@@ -153,7 +136,8 @@ def my_function():
         os.path.abspath("mock_file.py"), "r", encoding="utf-8"
     )
     mock_ast_parse.assert_called_once()
-    mock_rule_checker.rule_check.assert_called_once()
+    # Rules are checked once per scope: the function and the module
+    assert mock_rule_checker.rule_check.call_count == 2
 
     # Check result type and structure
     assert isinstance(result, pd.DataFrame)
@@ -167,3 +151,326 @@ def my_function():
     ]
     assert list(result.columns) == expected_columns
     assert len(result) > 0
+
+
+def test_inspect_skips_files_without_analyzed_libraries(tmp_path, mocker):
+    """
+    Test that a file importing none of the libraries the rules are about
+    is only parsed: no data is extracted and no rule is applied.
+    """
+    source_file = tmp_path / "plain.py"
+    source_file.write_text(
+        "import os\n"
+        "def run(path):\n"
+        "    return os.listdir(path)\n"
+    )
+
+    inspector = Inspector(output_path=str(tmp_path))
+    rule_check = mocker.spy(inspector.rule_checker, "rule_check")
+    extract_variables = mocker.spy(
+        inspector.variable_extractor, "extract_variable_definitions"
+    )
+
+    result = inspector.inspect(str(source_file))
+
+    assert result.empty
+    rule_check.assert_not_called()
+    extract_variables.assert_not_called()
+
+
+def test_inspect_prefilter_skips_parsing(tmp_path, mocker):
+    """
+    Test that the prefilter skips, without parsing them, files that never
+    mention a library the rules are about.
+    """
+    plain_file = tmp_path / "plain.py"
+    plain_file.write_text("import os\ndef run():\n    return os.sep\n")
+    pandas_file = tmp_path / "frames.py"
+    pandas_file.write_text(
+        "import pandas as pd\n"
+        "def load():\n"
+        "    df = pd.read_csv('data.csv')\n"
+        "    return df['a'][0]\n"
+    )
+
+    inspector = Inspector(output_path=str(tmp_path), prefilter=True)
+    parse = mocker.spy(ast, "parse")
+
+    assert inspector.inspect(str(plain_file)).empty
+    parse.assert_not_called()
+    assert inspector.prefiltered_files == 1
+
+    assert len(inspector.inspect(str(pandas_file))) > 0
+    assert inspector.prefiltered_files == 1
+
+    # The call graph needs every file to be parsed
+    inspector.inspect(str(plain_file), include_callgraph=True)
+    assert parse.call_count == 2
+    assert inspector.prefiltered_files == 1
+
+
+def test_inspect_profile_runs_only_needed_extractors(tmp_path, mocker):
+    """
+    Test that the extractors are only run when a selected rule reads
+    their output.
+    """
+    source_file = tmp_path / "train.py"
+    source_file.write_text(
+        "import pandas as pd\n"
+        "import torch\n"
+        "def train(data):\n"
+        "    df = pd.read_csv(data)\n"
+        "    optimizer = torch.optim.SGD([], lr=0.01)\n"
+        "    for epoch in range(10):\n"
+        "        loss = torch.tensor(0.0, requires_grad=True)\n"
+        "        loss.backward()\n"
+        "        optimizer.step()\n"
+        "    return df['a'][0]\n"
+    )
+    load_dataframe_dict = mocker.spy(
+        DataFrameExtractor, "load_dataframe_dict"
+    )
+
+    inspector = Inspector(output_path=str(tmp_path), profile="pytorch")
+    extract_dataframes = mocker.spy(
+        inspector.dataframe_extractor, "extract_dataframe_variables"
+    )
+
+    result = inspector.inspect(str(source_file))
+
+    load_dataframe_dict.assert_not_called()
+    extract_dataframes.assert_not_called()
+    assert result["smell_name"].tolist() == [
+        "gradients_not_cleared_before_backward_propagation"
+    ]
+
+
+def test_inspect_records_timings(tmp_path):
+    """
+    Test that the time spent by a file in every stage and rule is
+    recorded, including for files that cannot be parsed.
+    """
+    source_file = tmp_path / "frames.py"
+    source_file.write_text(
+        "import pandas as pd\n"
+        "def load():\n"
+        "    df = pd.read_csv('data.csv')\n"
+        "    return df['a'][0]\n"
+    )
+    broken_file = tmp_path / "broken.py"
+    broken_file.write_text("def broken(:\n")
+
+    inspector = Inspector(output_path=str(tmp_path), profile="pandas")
+    inspector.inspect(str(source_file))
+    with pytest.raises(SyntaxError):
+        inspector.inspect(str(broken_file))
+
+    summary = inspector.metrics.summary()
+    assert summary["files"] == 2
+    assert summary["stages"]["read"]["count"] == 2
+    assert summary["stages"]["parse"]["count"] == 2
+    assert summary["stages"]["detection"]["count"] == 1
+    assert set(summary["rules"]) == set(
+        inspector.rule_checker.select_rules(profile="pandas")
+    )
+
+
+def test_inspect_reports_nested_code_once(tmp_path):
+    """
+    Test that the code of a nested function is reported once, under the
+    nested function, and that module-level code is analyzed too.
+    """
+    source_file = tmp_path / "frames.py"
+    source_file.write_text(
+        "import pandas as pd\n"
+        "df = pd.read_csv('data.csv', dtype=str)\n"
+        "value = df['a'][0]\n"
+        "def outer():\n"
+        "    def inner():\n"
+        "        frame = pd.DataFrame(columns=['b'], dtype=int)\n"
+        "        return frame['b'][0]\n"
+        "    return inner\n"
+    )
+
+    inspector = Inspector(
+        output_path=str(tmp_path), rules=["chain_indexing"]
+    )
+    result = inspector.inspect(str(source_file))
+
+    assert sorted(zip(result["function_name"], result["line"])) == [
+        ("<module>", 3),
+        ("inner", 7),
+    ]
+
+
+def test_inspect_source_without_disk_io(tmp_path, mocker):
+    """
+    Test that sources held in memory, as text or bytes, are analyzed
+    without reading or writing any file.
+    """
+    source = (
+        "import pandas as pd\n"
+        "def load():\n"
+        "    df = pd.read_csv('data.csv', dtype=str)\n"
+        "    return df['a'][0]\n"
+    )
+    inspector = Inspector(output_path=str(tmp_path), profile="pandas")
+    open_file = mocker.patch("builtins.open")
+
+    from_text = inspector.inspect_source(source, "<snippet>")
+    from_bytes = inspector.inspect_source(
+        b"# -*- coding: latin-1 -*-\n" + source.encode("latin-1"),
+        "<snippet>",
+    )
+
+    open_file.assert_not_called()
+    assert from_text["smell_name"].tolist() == ["Chain_Indexing"]
+    assert from_text["filename"].tolist() == ["<snippet>"]
+    assert from_bytes["line"].tolist() == [5]
+    assert "read" not in inspector.metrics.summary()["stages"]
+
+
+def test_inspect_tree_skips_parsing(tmp_path, mocker):
+    """
+    Test that a tree parsed by the caller is analyzed without parsing
+    the source again.
+    """
+    source = (
+        "import pandas as pd\n"
+        "def load():\n"
+        "    df = pd.read_csv('data.csv', dtype=str)\n"
+        "    return df['a'][0]\n"
+    )
+    tree = ast.parse(source)
+    inspector = Inspector(output_path=str(tmp_path), profile="pandas")
+    parse = mocker.spy(ast, "parse")
+
+    result = inspector.inspect_tree(tree, source, "load.py")
+
+    parse.assert_not_called()
+    assert result["smell_name"].tolist() == ["Chain_Indexing"]
+    assert "parse" not in inspector.metrics.summary()["stages"]
+
+
+def test_inspect_many_combines_files_and_sources(tmp_path):
+    """
+    Test that files and sources are analyzed with a single call, in
+    order, collecting the errors instead of raising them.
+    """
+    source = (
+        "import pandas as pd\n"
+        "def load():\n"
+        "    df = pd.read_csv('data.csv', dtype=str)\n"
+        "    return df['a'][0]\n"
+    )
+    source_file = tmp_path / "load.py"
+    source_file.write_text(source)
+
+    inspector = Inspector(output_path=str(tmp_path), profile="pandas")
+    smells, fragments, errors = inspector.inspect_many(
+        [
+            ("first.py", source),
+            str(source_file),
+            ("broken.py", "def broken(:\n"),
+            ("last.py", source.encode()),
+        ],
+        include_callgraph=True,
+    )
+
+    assert smells["filename"].tolist() == [
+        "first.py",
+        str(source_file),
+        "last.py",
+    ]
+    assert set(smells["smell_name"]) == {"Chain_Indexing"}
+    assert set(fragments) == {"first.py", str(source_file), "last.py"}
+    assert list(errors) == ["broken.py"]
+    assert isinstance(errors["broken.py"], SyntaxError)
+
+
+def test_inspect_many_in_parallel(tmp_path):
+    """
+    Test that worker processes report the same smells, in the same order,
+    and that their timings are merged.
+    """
+    items = [
+        (
+            f"file_{i}.py",
+            "import pandas as pd\n"
+            f"def load_{i}():\n"
+            "    df = pd.read_csv('data.csv', dtype=str)\n"
+            "    return df['a'][0]\n",
+        )
+        for i in range(5)
+    ]
+
+    sequential = Inspector(output_path=str(tmp_path), profile="pandas")
+    expected, _, _ = sequential.inspect_many(items)
+    inspector = Inspector(output_path=str(tmp_path), profile="pandas")
+    smells, _, errors = inspector.inspect_many(items, jobs=2)
+
+    assert smells.equals(expected)
+    assert errors == {}
+    assert inspector.metrics.summary()["files"] == 5
+
+
+def test_collect_returns_collected_smells(tmp_path):
+    """
+    Test that `collect` returns the smells found by `inspect`, as
+    collected, without building a DataFrame.
+    """
+    source_file = tmp_path / "load.py"
+    source_file.write_text(
+        "import pandas as pd\n"
+        "def load():\n"
+        "    df = pd.read_csv('data.csv', dtype=str)\n"
+        "    return df['a'][0]\n"
+    )
+    inspector = Inspector(output_path=str(tmp_path), profile="pandas")
+
+    smells, fragment = inspector.collect(
+        str(source_file), include_callgraph=True
+    )
+
+    assert isinstance(smells, SmellCollector)
+    assert [row["smell_name"] for row in smells.rows()] == ["Chain_Indexing"]
+    assert fragment is not None
+    assert smells.to_dataframe().equals(inspector.inspect(str(source_file)))
+
+
+def test_close_closes_the_result_cache(tmp_path):
+    """
+    Test that `close` closes the result cache, and that the Inspector
+    keeps analyzing files without it.
+    """
+    source_file = tmp_path / "load.py"
+    source_file.write_text("import os\n")
+    inspector = Inspector(
+        output_path=str(tmp_path), cache_dir=str(tmp_path / "cache")
+    )
+    cache = inspector.cache
+
+    inspector.close()
+    inspector.close()
+
+    assert inspector.cache is None
+    assert cache._connection is None
+    assert inspector.inspect(str(source_file)).empty
+
+
+def test_dictionaries_are_cached_in_the_cache_dir(tmp_path, monkeypatch):
+    """
+    Test that the compiled dictionaries are cached next to the results,
+    not inside the package.
+    """
+    from code_extractor import dictionary_index
+
+    monkeypatch.setattr(dictionary_index, "_LOADED", {})
+    cache_dir = tmp_path / "cache"
+
+    inspector = Inspector(
+        output_path=str(tmp_path), cache_dir=str(cache_dir), profile="pandas"
+    )
+    inspector.close()
+
+    assert len(list(cache_dir.glob("dictionaries-*.bin"))) == 1
@@ -1,9 +1,24 @@
+import json
 import os
 import shutil
 import pytest
 import pandas as pd
 from unittest.mock import ANY, MagicMock, patch
+from components.analysis_pipeline import AnalysisPipeline
 from components.project_analyzer import ProjectAnalyzer
+from components.result_cache import ResultCache
+from components.result_sink import ResultSink
+from components.smell_collector import SmellCollector
+from utils.file_utils import FileUtils
+
+
+def collected(df):
+    """
+    Returns the smells of a DataFrame as collected by the Inspector.
+    """
+    smells = SmellCollector()
+    smells.extend_frame(df)
+    return smells
 
 
 @pytest.fixture
@@ -33,7 +48,7 @@ def mock_file_related_methods(monkeypatch):
     monkeypatch.setattr("os.listdir", lambda path: ["project1", "project2"])
     monkeypatch.setattr(
         "utils.file_utils.FileUtils.get_python_files",
-        lambda path: ["file1.py"],
+        lambda path, *args, **kwargs: ["file1.py"],
     )
     monkeypatch.setattr(
         "utils.file_utils.FileUtils.initialize_log", lambda path: None
@@ -57,13 +72,6 @@ def test_analyze_project(
         shutil.rmtree(output_dir)
     output_dir.mkdir(parents=True)
 
-    monkeypatch.setattr(
-        "components.project_analyzer.ProjectAnalyzer._save_results",
-        lambda self, df, path, report_format="csv": df.to_csv(
-            output_dir / "overview.csv", index=False
-        ),
-    )
-
     # Mock inspection results for two files
     df1 = pd.DataFrame(
         {
@@ -87,19 +95,19 @@ def test_analyze_project(
     )
 
     mock_inspection_results = [
-        (df1, {"file": "file1.py", "nodes": [], "edges": []}),
-        (df2, {"file": "file2.py", "nodes": [], "edges": []}),
+        (collected(df1), {"file": "file1.py", "nodes": [], "edges": []}),
+        (collected(df2), {"file": "file2.py", "nodes": [], "edges": []}),
     ]
 
-    # Mock inspect method to return the inspection results
-    project_analyzer.inspector.inspect = MagicMock(
+    # Mock collect method to return the inspection results
+    project_analyzer.inspector.collect = MagicMock(
         side_effect=mock_inspection_results
     )
 
     # Mock the get_python_files method to return both files
     monkeypatch.setattr(
         "utils.file_utils.FileUtils.get_python_files",
-        lambda _: ["file1.py", "file2.py"],
+        lambda path, *args, **kwargs: ["file1.py", "file2.py"],
     )
 
     # Run the method
@@ -110,11 +118,11 @@ def test_analyze_project(
 
     # Assertions
     assert total_smells == 2  # Expecting 2 smells (from file1.py and file2.py)
-    project_analyzer.inspector.inspect.assert_any_call(
-        "file1.py", include_callgraph=True
+    project_analyzer.inspector.collect.assert_any_call(
+        "file1.py", include_callgraph=True, include_hash=True
     )
-    project_analyzer.inspector.inspect.assert_any_call(
-        "file2.py", include_callgraph=True
+    project_analyzer.inspector.collect.assert_any_call(
+        "file2.py", include_callgraph=True, include_hash=True
     )
 
     mock_project_path = "test/unit_testing/components/mock_project_path"
@@ -134,14 +142,7 @@ def test_analyze_projects_sequential(
         shutil.rmtree(output_dir)
     output_dir.mkdir(parents=True)
 
-    monkeypatch.setattr(
-        "components.project_analyzer.ProjectAnalyzer._save_results",
-        lambda self, df, path, report_format="csv": df.to_csv(
-            output_dir / "overview.csv", index=False
-        ),
-    )
-
-    # Mock the inspector's inspect method
+    # Mock the inspector's collect method
     mock_inspection_results = pd.DataFrame(
         {
             "filename": ["file1.py"],
@@ -150,9 +151,9 @@ def test_analyze_projects_sequential(
             "line": [10],
         }
     )
-    project_analyzer.inspector.inspect = MagicMock(
+    project_analyzer.inspector.collect = MagicMock(
         return_value=(
-            mock_inspection_results,
+            collected(mock_inspection_results),
             {"file": "file1.py", "nodes": [], "edges": []},
         )
     )
@@ -165,8 +166,8 @@ def test_analyze_projects_sequential(
     )
 
     # Ensure inspect was called
-    project_analyzer.inspector.inspect.assert_called_with(
-        "file1.py", include_callgraph=True
+    project_analyzer.inspector.collect.assert_called_with(
+        "file1.py", include_callgraph=True, include_hash=True
     )
 
     mock_project_path = "test/unit_testing/components/mock_project_path"
@@ -209,6 +210,7 @@ def test_merge_all_results(monkeypatch, project_analyzer):
         input_dir=os.path.join(project_analyzer.output_path, "project_details"),
         output_dir=project_analyzer.output_path,
         report_format="csv",
+        partition_by_smell=False,
     )
 
 
@@ -234,20 +236,14 @@ def test_analyze_projects_parallel(
     monkeypatch.setattr("os.path.exists", lambda path: True)
     monkeypatch.setattr("os.path.isdir", lambda path: True)
 
-    # Mock the inspector's inspect method
-    project_analyzer.inspector.inspect = MagicMock(
+    # Mock the inspector's collect method
+    project_analyzer.inspector.collect = MagicMock(
         return_value=(
-            mock_inspection_results,
+            collected(mock_inspection_results),
             {"file": "file1.py", "nodes": [], "edges": []},
         )
     )
 
-    # Mock save results method
-    monkeypatch.setattr(
-        "components.project_analyzer.ProjectAnalyzer._save_results",
-        lambda self, df, path, report_format="csv": None,
-    )
-
     # Mock ThreadPoolExecutor to avoid threading and run tasks synchronously
     with patch("concurrent.futures.ThreadPoolExecutor") as MockExecutor:
         mock_executor = MagicMock()
@@ -264,7 +260,7 @@ def test_analyze_projects_parallel(
             )
 
         # Ensure the inspector's inspect method was called the expected number of times
-        assert project_analyzer.inspector.inspect.call_count == 2
+        assert project_analyzer.inspector.collect.call_count == 2
         assert mock_print.call_count > 0
 
 
@@ -276,7 +272,7 @@ def test_exception_handling_in_inspect(
     """
 
     # Simulate an exception in the inspect method
-    project_analyzer.inspector.inspect = MagicMock(
+    project_analyzer.inspector.collect = MagicMock(
         side_effect=FileNotFoundError
     )
 
@@ -309,15 +305,8 @@ def test_analyze_project_with_errors(
         shutil.rmtree(output_dir)
     output_dir.mkdir(parents=True)
 
-    monkeypatch.setattr(
-        "components.project_analyzer.ProjectAnalyzer._save_results",
-        lambda self, df, path, report_format="csv": df.to_csv(
-            output_dir / "overview.csv", index=False
-        ),
-    )
-
     # Mocking a SyntaxError for a specific file
-    project_analyzer.inspector.inspect = MagicMock(side_effect=SyntaxError)
+    project_analyzer.inspector.collect = MagicMock(side_effect=SyntaxError)
 
     # Run the method (simulate failure for file1.py)
     project_analyzer.analyze_project(
@@ -348,14 +337,7 @@ def test_analyze_projects_sequential_save_results(
         shutil.rmtree(output_dir)
     output_dir.mkdir(parents=True)
 
-    monkeypatch.setattr(
-        "components.project_analyzer.ProjectAnalyzer._save_results",
-        lambda self, df, path, report_format="csv": df.to_csv(
-            output_dir / "overview.csv", index=False
-        ),
-    )
-
-    # Mock the inspector's inspect method
+    # Mock the inspector's collect method
     mock_inspection_results = pd.DataFrame(
         {
             "filename": ["file1.py"],
@@ -364,9 +346,9 @@ def test_analyze_projects_sequential_save_results(
             "line": [10],
         }
     )
-    project_analyzer.inspector.inspect = MagicMock(
+    project_analyzer.inspector.collect = MagicMock(
         return_value=(
-            mock_inspection_results,
+            collected(mock_inspection_results),
             {"file": "file1.py", "nodes": [], "edges": []},
         )
     )
@@ -414,10 +396,10 @@ def test_analyze_projects_parallel_thread_safety(
         }
     )
 
-    # Mock the inspector's inspect method
-    project_analyzer.inspector.inspect = MagicMock(
+    # Mock the inspector's collect method
+    project_analyzer.inspector.collect = MagicMock(
         return_value=(
-            mock_inspection_results,
+            collected(mock_inspection_results),
             {"file": "file1.py", "nodes": [], "edges": []},
         )
     )
@@ -458,16 +440,10 @@ def test_analyze_project_empty_directory(
         shutil.rmtree(output_dir)
     output_dir.mkdir(parents=True)
 
-    monkeypatch.setattr(
-        "components.project_analyzer.ProjectAnalyzer._save_results",
-        lambda self, df, path, report_format="csv": df.to_csv(
-            output_dir / "overview.csv", index=False
-        ),
-    )
-
     # Mock get_python_files to return an empty list
     monkeypatch.setattr(
-        "utils.file_utils.FileUtils.get_python_files", lambda _: []
+        "utils.file_utils.FileUtils.get_python_files",
+        lambda path, *args, **kwargs: [],
     )
 
     project_path = "test/unit_testing/components/mock_project_path"
@@ -478,3 +454,412 @@ def test_analyze_project_empty_directory(
     assert f"The project '{project_path}' contains no Python files." == str(
         excinfo.value
     )
+
+
+def test_analyze_project_with_jobs(tmp_path):
+    """
+    Test that analyzing files in worker processes gives the same results,
+    in the same order, as analyzing them in the current process.
+    """
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    for index in range(4):
+        (project_path / f"module{index}.py").write_text(
+            "import pandas as pd\n"
+            f"def load{index}():\n"
+            "    df = pd.read_csv('data.csv')\n"
+            "    return df['a'][0]\n"
+        )
+    (project_path / "broken.py").write_text("def broken(:\n")
+
+    results = {}
+    for jobs in (1, 2):
+        output_path = tmp_path / f"output_{jobs}"
+        analyzer = ProjectAnalyzer(str(output_path), jobs=jobs)
+        total_smells = analyzer.analyze_project(
+            str(project_path), enable_callgraph=True
+        )
+        analyzer.close()
+
+        overview = pd.read_csv(output_path / "output" / "overview.csv")
+        errors = (output_path / "output" / "error.txt").read_text()
+        callgraph = (output_path / "output" / "callgraph.json").read_text()
+        results[jobs] = (total_smells, overview, errors, callgraph)
+
+    assert results[1][0] == results[2][0] > 0
+    pd.testing.assert_frame_equal(results[1][1], results[2][1])
+    assert "broken.py" in results[2][2]
+    assert results[1][3] == results[2][3]
+
+
+def test_analyze_projects_parallel_reassembles_projects(tmp_path):
+    """
+    Test that scheduling the files of all the projects on a shared pool,
+    largest first, reassembles each project's results in file order.
+    """
+    base_path = tmp_path / "projects"
+    for project, count in (("big", 6), ("small", 1)):
+        project_path = base_path / project
+        project_path.mkdir(parents=True)
+        for index in range(count):
+            padding = "\n" * (index * 200)
+            (project_path / f"module{index}.py").write_text(
+                "import pandas as pd\n"
+                f"def load{index}():\n"
+                "    df = pd.read_csv('data.csv')\n"
+                f"    return df['a'][0]\n{padding}"
+            )
+
+    results = {}
+    for workers in (1, 2):
+        output_path = tmp_path / f"output_{workers}"
+        log_path = base_path / "execution_log.txt"
+        if log_path.exists():
+            log_path.unlink()
+        analyzer = ProjectAnalyzer(str(output_path))
+        analyzer.analyze_projects_parallel(
+            str(base_path), workers, enable_callgraph=True
+        )
+        analyzer.close()
+
+        details = output_path / "output" / "project_details"
+        results[workers] = {
+            path.name: path.read_text() for path in details.iterdir()
+        }
+
+    assert sorted(results[2]) == [
+        "big_callgraph.json",
+        "big_results.csv",
+        "small_callgraph.json",
+        "small_results.csv",
+    ]
+    assert results[1] == results[2]
+    details = tmp_path / "output_2" / "output" / "project_details"
+    big = pd.read_csv(details / "big_results.csv")
+    expected = [
+        os.path.basename(filename)
+        for filename in FileUtils.get_python_files(str(base_path / "big"))
+    ]
+    files = [os.path.basename(filename) for filename in big["filename"]]
+    assert list(dict.fromkeys(files)) == expected
+
+
+def test_analyze_project_prefilter_counts_worker_skips(tmp_path, capsys):
+    """
+    Test that files skipped by the prefilter in worker processes are
+    counted and reported in the run summary.
+    """
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    (project_path / "frames.py").write_text(
+        "import pandas as pd\n"
+        "def load():\n"
+        "    df = pd.read_csv('data.csv')\n"
+        "    return df['a'][0]\n"
+    )
+    for index in range(3):
+        (project_path / f"plain{index}.py").write_text(
+            f"import os\ndef run{index}():\n    return os.sep\n"
+        )
+
+    analyzer = ProjectAnalyzer(
+        str(tmp_path / "output"), jobs=2, prefilter=True
+    )
+    total_smells = analyzer.analyze_project(str(project_path))
+    analyzer.close()
+
+    assert total_smells > 0
+    assert analyzer.prefiltered_files == 3
+    assert "Files skipped by the prefilter: 3" in capsys.readouterr().out
+
+
+def test_run_metrics_include_worker_timings(tmp_path):
+    """
+    Test that the timings of the files analyzed by worker processes are
+    saved to the run metrics, next to the overview.
+    """
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    for index in range(3):
+        (project_path / f"frames{index}.py").write_text(
+            "import pandas as pd\n"
+            f"def load{index}():\n"
+            "    df = pd.read_csv('data.csv')\n"
+            "    return df['a'][0]\n"
+        )
+
+    analyzer = ProjectAnalyzer(str(tmp_path / "output"), jobs=2)
+    analyzer.analyze_project(str(project_path))
+    analyzer.close()
+    path = analyzer.save_metrics()
+
+    with open(path) as file:
+        metrics = json.load(file)
+    assert os.path.dirname(path) == analyzer.output_path
+    assert metrics["files"] == 3
+    assert metrics["stages"]["parse"]["count"] == 3
+    assert metrics["stages"]["write"]["count"] == 3
+    assert metrics["rules"]["chain_indexing"]["count"] == 3
+    assert len(metrics["slowest_files"]) == 3
+
+
+def test_analyze_project_with_thread_executor(tmp_path):
+    """
+    Test that analyzing files in worker threads gives the same results
+    as analyzing them in the current thread.
+    """
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    for index in range(3):
+        (project_path / f"module{index}.py").write_text(
+            "import pandas as pd\n"
+            f"def load{index}():\n"
+            "    df = pd.read_csv('data.csv')\n"
+            "    return df['a'][0]\n"
+        )
+
+    overviews = {}
+    for jobs, executor in ((1, "process"), (2, "thread")):
+        output_path = tmp_path / f"output_{executor}"
+        analyzer = ProjectAnalyzer(
+            str(output_path), jobs=jobs, executor=executor
+        )
+        analyzer.analyze_project(str(project_path))
+        analyzer.close()
+        overviews[executor] = pd.read_csv(
+            output_path / "output" / "overview.csv"
+        )
+
+    assert len(overviews["thread"]) == 6
+    pd.testing.assert_frame_equal(overviews["process"], overviews["thread"])
+
+    with pytest.raises(ValueError, match="Unknown executor"):
+        ProjectAnalyzer(str(tmp_path / "output"), executor="fiber")
+
+
+def write_modules(project_path, count):
+    project_path.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        (project_path / f"module{index}.py").write_text(
+            "import pandas as pd\n"
+            f"def load{index}():\n"
+            "    df = pd.read_csv('data.csv')\n"
+            "    return df['a'][0]\n"
+        )
+
+
+def interrupt_at(mocker, analyzer, filename):
+    """
+    Interrupts the analyses of an analyzer when they reach a file.
+    """
+    collect = analyzer.inspector.collect
+
+    def interrupted(name, **kwargs):
+        if name == filename:
+            raise KeyboardInterrupt
+        return collect(name, **kwargs)
+
+    mocker.patch.object(analyzer.inspector, "collect", side_effect=interrupted)
+
+
+def test_analyze_project_resumes_completed_files(tmp_path, mocker):
+    """
+    Test that a resumed analysis only analyzes the files that changed
+    since the previous run, and those after them, and writes the same
+    results as a full run.
+    """
+    project_path = tmp_path / "project"
+    write_modules(project_path, 4)
+    filenames = FileUtils.get_python_files(str(project_path))
+
+    # A run interrupted before its last file
+    analyzer = ProjectAnalyzer(str(tmp_path / "first"))
+    interrupt_at(mocker, analyzer, filenames[3])
+    with pytest.raises(KeyboardInterrupt):
+        analyzer.analyze_project(str(project_path), enable_callgraph=True)
+
+    with open(filenames[2], "a") as file:
+        file.write("\n")
+    full = ProjectAnalyzer(str(tmp_path / "full"))
+    expected_smells = full.analyze_project(
+        str(project_path), enable_callgraph=True
+    )
+
+    resumed = ProjectAnalyzer(str(tmp_path / "first"), resume=True)
+    collect = mocker.spy(resumed.inspector, "collect")
+    total_smells = resumed.analyze_project(
+        str(project_path), enable_callgraph=True, resume=True
+    )
+
+    assert [call.args[0] for call in collect.call_args_list] == filenames[2:]
+    assert total_smells == expected_smells
+    for name in ("overview.csv", "callgraph.json"):
+        assert (tmp_path / "first" / "output" / name).read_text() == (
+            tmp_path / "full" / "output" / name
+        ).read_text()
+    # The report is complete: its journal is removed
+    output = tmp_path / "first" / "output"
+    assert not (output / "_overview.csv.journal").exists()
+
+
+def test_journal_hashes_come_from_the_inspection(tmp_path, mocker):
+    """
+    Test that the files are only read by the inspection, which returns
+    the hashes journaled with the results.
+    """
+    project_path = tmp_path / "project"
+    write_modules(project_path, 3)
+    filenames = FileUtils.get_python_files(str(project_path))
+    content_hash = mocker.spy(AnalysisPipeline, "_content_hash")
+    record_file = mocker.spy(ResultSink, "record_file")
+
+    ProjectAnalyzer(str(tmp_path / "output")).analyze_project(
+        str(project_path)
+    )
+
+    content_hash.assert_not_called()
+    records = [call.args[1] for call in record_file.call_args_list]
+    hashes = []
+    for filename in filenames:
+        with open(filename) as file:
+            hashes.append(ResultCache.content_hash(file.read()))
+    assert [record["hash"] for record in records] == hashes
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_analyze_projects_resume(tmp_path, mocker, parallel):
+    """
+    Test that resuming multiple projects, in any mode, skips the logged
+    projects and the completed files of the others.
+    """
+    base_path = tmp_path / "projects"
+    write_modules(base_path / "done", 2)
+    write_modules(base_path / "partial", 3)
+
+    def analyze(analyzer, resume):
+        if parallel:
+            analyzer.analyze_projects_parallel(
+                str(base_path), 1, resume=resume
+            )
+        else:
+            analyzer.analyze_projects_sequential(str(base_path), resume)
+
+    analyze(ProjectAnalyzer(str(tmp_path / "full")), resume=False)
+    full_details = tmp_path / "full" / "output" / "project_details"
+    expected = (full_details / "partial_results.csv").read_text()
+
+    # Only the first file of the second project was saved before a crash
+    (base_path / "execution_log.txt").write_text("")
+    filenames = FileUtils.get_python_files(str(base_path / "partial"))
+    analyzer = ProjectAnalyzer(str(tmp_path / "output"))
+    analyzer.CHECKPOINT_INTERVAL = 1
+    interrupt_at(mocker, analyzer, filenames[1])
+    with pytest.raises(KeyboardInterrupt):
+        analyze(analyzer, resume=False)
+    assert (base_path / "execution_log.txt").read_text() == "done\n"
+    details = tmp_path / "output" / "output" / "project_details"
+    partial = details / "partial_results.csv"
+    with open(partial, "a") as file:
+        file.write("partial,row")
+
+    analyzer = ProjectAnalyzer(str(tmp_path / "output"), resume=True)
+    collect = mocker.spy(analyzer.inspector, "collect")
+    analyze(analyzer, resume=True)
+
+    analyzed = sorted(
+        os.path.basename(call.args[0]) for call in collect.call_args_list
+    )
+    assert analyzed == sorted(os.path.basename(f) for f in filenames[1:])
+    assert partial.read_text() == expected
+    assert (details / "done_results.csv").exists()
+    assert (base_path / "execution_log.txt").read_text() == "done\npartial\n"
+
+
+def test_parquet_journals_are_skipped_by_dataset_readers(tmp_path, mocker):
+    """
+    Test that the journal of an interrupted project, inside its Parquet
+    partition, does not break reading the project details as a dataset.
+    """
+    pytest.importorskip("pyarrow")
+    base_path = tmp_path / "projects"
+    write_modules(base_path / "alpha", 2)
+    write_modules(base_path / "beta", 2)
+
+    # The project analyzed last is interrupted
+    first, last = [
+        name for name in os.listdir(base_path) if (base_path / name).is_dir()
+    ]
+    analyzer = ProjectAnalyzer(str(tmp_path / "output"))
+    analyzer.CHECKPOINT_INTERVAL = 1
+    filenames = FileUtils.get_python_files(str(base_path / last))
+    interrupt_at(mocker, analyzer, filenames[1])
+    with pytest.raises(KeyboardInterrupt):
+        analyzer.analyze_projects_sequential(
+            str(base_path), report_format="parquet"
+        )
+
+    details = tmp_path / "output" / "output" / "project_details"
+    assert (details / f"project={last}" / "_results.parquet.journal").exists()
+    frame = pd.read_parquet(details)
+    assert frame["project"].astype(str).unique().tolist() == [first]
+
+
+def test_shards_partition_the_files(tmp_path, mocker):
+    """
+    Test that the shards of a project analyze disjoint sets of files
+    covering the whole project.
+    """
+    project_path = tmp_path / "project"
+    write_modules(project_path, 8)
+
+    analyzed = []
+    for shard_index in range(3):
+        analyzer = ProjectAnalyzer(
+            str(tmp_path / f"shard{shard_index}"),
+            shard_index=shard_index,
+            shard_count=3,
+        )
+        collect = mocker.spy(analyzer.inspector, "collect")
+        analyzer.analyze_project(str(project_path))
+        analyzed.append({call.args[0] for call in collect.call_args_list})
+
+    assert set.union(*analyzed) == set(
+        FileUtils.get_python_files(str(project_path))
+    )
+    assert sum(len(files) for files in analyzed) == 8
+
+    with pytest.raises(ValueError, match="Invalid shard"):
+        ProjectAnalyzer(
+            str(tmp_path / "invalid"), shard_index=3, shard_count=3
+        )
+
+
+@pytest.mark.parametrize(
+    "jobs, executor", [(1, "process"), (2, "process"), (2, "thread")]
+)
+def test_close_closes_the_result_caches(tmp_path, jobs, executor):
+    """
+    Test that closing the analyzer closes the result cache of every
+    Inspector, so that the cache database is checkpointed and no
+    write-ahead log is left next to it.
+    """
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    for index in range(3):
+        (project_path / f"module{index}.py").write_text(
+            f"import os\ndef run{index}():\n    return os.sep\n"
+        )
+    cache_dir = tmp_path / "cache"
+
+    analyzer = ProjectAnalyzer(
+        str(tmp_path / "output"),
+        jobs=jobs,
+        executor=executor,
+        cache_dir=str(cache_dir),
+    )
+    analyzer.analyze_project(str(project_path))
+    analyzer.close()
+
+    assert analyzer.inspector.cache is None
+    assert (cache_dir / "results.sqlite").exists()
+    assert not (cache_dir / "results.sqlite-wal").exists()
@@ -0,0 +1,183 @@
+import ast
+import json
+import zlib
+import pytest
+from components.inspector import Inspector
+from components.result_cache import ResultCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    result_cache = ResultCache(str(tmp_path / "cache"))
+    yield result_cache
+    result_cache.close()
+
+
+@pytest.fixture
+def smells():
+    return [
+        ["file.py", "my_function", "smell1", 3, "description1", "info1"],
+        ["file.py", "my_function", "smell2", 5, "description2", "info2"],
+    ]
+
+
+def test_get_missing_entry(cache):
+    """
+    Test that unknown files are cache misses.
+    """
+    assert cache.get("file.py", "hash", "fingerprint") is None
+
+
+def test_put_and_get(cache, smells):
+    """
+    Test that stored results are returned for the same key.
+    """
+    fragment = {"file": "file.py", "nodes": [], "edges": []}
+    cache.put("file.py", "hash", "fingerprint", smells, fragment)
+
+    assert cache.get("file.py", "hash", "fingerprint") == (smells, fragment)
+    assert cache.get("file.py", "other", "fingerprint") is None
+    assert cache.get("file.py", "hash", "other") is None
+    assert cache.get("other.py", "hash", "fingerprint") is None
+
+
+def test_callgraph_required(cache, smells):
+    """
+    Test that entries without a call graph fragment do not satisfy
+    lookups that need it.
+    """
+    cache.put("file.py", "hash", "fingerprint", smells)
+
+    assert cache.get("file.py", "hash", "fingerprint") == (smells, None)
+    assert (
+        cache.get("file.py", "hash", "fingerprint", include_callgraph=True)
+        is None
+    )
+
+
+def test_results_persist(tmp_path, smells):
+    """
+    Test that results are available after reopening the cache.
+    """
+    cache_dir = str(tmp_path / "cache")
+    first = ResultCache(cache_dir)
+    first.put("file.py", "hash", "fingerprint", smells)
+    first.close()
+
+    second = ResultCache(cache_dir)
+    assert second.get("file.py", "hash", "fingerprint") == (smells, None)
+    second.close()
+
+
+def test_size_based_eviction(tmp_path, smells):
+    """
+    Test that the least recently used entries are evicted first.
+    """
+    cache = ResultCache(str(tmp_path / "cache"), max_size=1)
+    cache.put("a.py", "hash", "fingerprint", smells)
+    cache.put("b.py", "hash", "fingerprint", smells)
+
+    assert cache.get("a.py", "hash", "fingerprint") is None
+    assert cache.get("b.py", "hash", "fingerprint") is None
+    cache.close()
+
+    # Room for two entries and a half
+    entry_size = len(zlib.compress(json.dumps(smells).encode("utf-8")))
+    cache = ResultCache(str(tmp_path / "lru"), max_size=entry_size * 5 // 2)
+    cache.put("a.py", "hash", "fingerprint", smells)
+    cache.put("b.py", "hash", "fingerprint", smells)
+    cache.get("a.py", "hash", "fingerprint")  # a.py is now the most recent
+    cache.put("c.py", "hash", "fingerprint", smells)
+
+    assert cache.get("b.py", "hash", "fingerprint") is None
+    assert cache.get("a.py", "hash", "fingerprint") is not None
+    assert cache.get("c.py", "hash", "fingerprint") is not None
+    cache.close()
+
+
+def test_hits_are_not_written(tmp_path, smells):
+    """
+    Test that cache hits do not write to the database, and that their
+    recency is stored when the cache is closed.
+    """
+    cache_dir = str(tmp_path / "cache")
+    cache = ResultCache(cache_dir)
+    cache.put("a.py", "hash", "fingerprint", smells)
+    cache.put("b.py", "hash", "fingerprint", smells)
+    changes = cache._connection.total_changes
+
+    assert cache.get("a.py", "hash", "fingerprint") is not None
+    assert cache._connection.total_changes == changes
+    cache.close()
+    cache.close()
+
+    cache = ResultCache(cache_dir)
+    (least_recent,) = cache._connection.execute(
+        "SELECT key FROM results ORDER BY last_used LIMIT 1"
+    ).fetchone()
+    assert least_recent == cache._key("b.py", "hash", "fingerprint")
+    cache.close()
+
+
+def test_fingerprint_tracks_files(tmp_path):
+    """
+    Test that the fingerprint changes with the content of the files.
+    """
+    rules = tmp_path / "rules.py"
+    dictionary = tmp_path / "models.csv"
+    rules.write_text("RULES = 1\n")
+    dictionary.write_text("method,library\nfit,sklearn\n")
+
+    first = ResultCache.fingerprint([str(rules)], [str(dictionary)])
+    assert first == ResultCache.fingerprint([str(rules)], [str(dictionary)])
+
+    dictionary.write_text("method,library\npredict,sklearn\n")
+    assert first != ResultCache.fingerprint([str(rules)], [str(dictionary)])
+
+
+def test_fingerprint_tracks_settings(tmp_path):
+    """
+    Test that the fingerprint changes with the selection of rules.
+    """
+    rules = tmp_path / "rules.py"
+    rules.write_text("RULES = 1\n")
+
+    all_rules = ResultCache.fingerprint([str(rules)], [], ["A", "B"])
+    assert all_rules != ResultCache.fingerprint([str(rules)], [], ["A"])
+    assert all_rules != ResultCache.fingerprint([str(rules)], [], ["AB"])
+
+
+def test_inspector_reuses_cached_results(tmp_path, mocker):
+    """
+    Test that the Inspector does not parse unchanged files again.
+    """
+    source_file = tmp_path / "file.py"
+    source_file.write_text(
+        "import pandas as pd\n"
+        "def main():\n"
+        "    df = pd.read_csv('data.csv')\n"
+        "    return df['a'][0]\n"
+    )
+    cache_dir = str(tmp_path / "cache")
+
+    first = Inspector(str(tmp_path / "output"), cache_dir=cache_dir)
+    expected, fragment = first.inspect(
+        str(source_file), include_callgraph=True
+    )
+    first.cache.close()
+
+    parse = mocker.patch("ast.parse", side_effect=ast.parse)
+    second = Inspector(str(tmp_path / "output"), cache_dir=cache_dir)
+    result, cached_fragment = second.inspect(
+        str(source_file), include_callgraph=True
+    )
+
+    parse.assert_not_called()
+    assert not expected.empty
+    assert result.to_dict("records") == expected.to_dict("records")
+    assert cached_fragment == fragment
+
+    source_file.write_text("def main():\n    return 1\n")
+    assert second.inspect(str(source_file)).empty
+    parse.assert_called_once()
+    second.cache.close()
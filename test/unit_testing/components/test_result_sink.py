@@ -0,0 +1,319 @@
+import json
+import pandas as pd
+import pytest
+from components.result_sink import (
+    CsvResultSink,
+    JsonLinesResultSink,
+    JsonResultSink,
+    ParquetResultSink,
+    ResultSink,
+)
+from components.smell_collector import SmellCollector
+
+
+@pytest.fixture
+def smells_df():
+    """
+    Fixture providing the smells of a file, as returned by the Inspector.
+    """
+    return pd.DataFrame(
+        {
+            "filename": ["file1.py", "file1.py"],
+            "function_name": ["func1", "func2"],
+            "smell_name": ["smell1", "smell2"],
+            "line": [10, 20],
+            "description": ["desc, with comma", 'desc "quoted"'],
+            "additional_info": ["info1", None],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "report_format, sink_class",
+    [
+        ("csv", CsvResultSink),
+        ("json", JsonResultSink),
+        ("jsonl", JsonLinesResultSink),
+        ("parquet", ParquetResultSink),
+    ],
+)
+def test_open_selects_sink(tmp_path, report_format, sink_class):
+    """
+    Test that each report format gets its sink and file extension.
+    """
+    sink = ResultSink.open(str(tmp_path / "overview"), report_format)
+
+    assert isinstance(sink, sink_class)
+    assert sink.path == str(tmp_path / "overview") + sink_class.extension
+
+
+def test_csv_sink_matches_dataframe_export(tmp_path, smells_df):
+    """
+    Test that streaming to CSV writes the same file as exporting the
+    whole DataFrame with pandas.
+    """
+    sink = ResultSink.open(str(tmp_path / "streamed"), "csv", buffer_size=1)
+    sink.write_frame(smells_df.iloc[:1])
+    sink.write_frame(smells_df.iloc[1:])
+    sink.close()
+
+    smells_df.to_csv(tmp_path / "exported.csv", index=False)
+    assert (tmp_path / "streamed.csv").read_bytes() == (
+        tmp_path / "exported.csv"
+    ).read_bytes()
+    assert len(sink) == 2
+
+
+def test_json_sinks_write_records(tmp_path, smells_df):
+    """
+    Test that the JSON sinks write one record per smell.
+    """
+    for report_format in ("json", "jsonl"):
+        sink = ResultSink.open(str(tmp_path / "overview"), report_format)
+        sink.write_frame(smells_df)
+        sink.close()
+
+    with open(tmp_path / "overview.json") as file:
+        records = json.load(file)
+    with open(tmp_path / "overview.jsonl") as file:
+        lines = [json.loads(line) for line in file]
+
+    assert records == lines
+    assert records[0]["line"] == 10
+    assert records[1]["additional_info"] is None
+    pd.testing.assert_frame_equal(
+        pd.read_json(tmp_path / "overview.json"), pd.read_json(
+            tmp_path / "overview.jsonl", lines=True
+        )
+    )
+
+
+def test_buffer_is_bounded(tmp_path):
+    """
+    Test that rows are written to the file once the buffer is full.
+    """
+    sink = CsvResultSink(str(tmp_path / "overview.csv"), buffer_size=2)
+    collector = SmellCollector()
+    collector.add("file.py", "func", "smell", 1, "desc", "info")
+
+    sink.write_collector(collector)
+    assert not (tmp_path / "overview.csv").exists()
+
+    sink.write_collector(collector)
+    assert sink.rows_written == 2
+    sink.checkpoint()
+    assert len(pd.read_csv(tmp_path / "overview.csv")) == 2
+
+    sink.close()
+
+
+def test_empty_sink_writes_no_file(tmp_path):
+    """
+    Test that a sink without rows does not create a report.
+    """
+    sink = ResultSink.open(str(tmp_path / "overview"), "json")
+    sink.write_frame(pd.DataFrame())
+    sink.close()
+
+    assert len(sink) == 0
+    assert not (tmp_path / "overview.json").exists()
+
+
+def test_missing_columns_are_empty(tmp_path):
+    """
+    Test that columns missing from a DataFrame are written as empty values.
+    """
+    sink = ResultSink.open(str(tmp_path / "overview"), "csv")
+    sink.write_frame(pd.DataFrame({"filename": ["file.py"], "line": [3]}))
+    sink.close()
+
+    df = pd.read_csv(tmp_path / "overview.csv")
+    assert list(df.columns) == list(SmellCollector.COLUMNS)
+    assert df["line"].tolist() == [3]
+    assert df["smell_name"].isna().all()
+
+
+def test_discard_removes_partial_file(tmp_path, smells_df):
+    """
+    Test that discarding a sink removes the rows written so far.
+    """
+    sink = ResultSink.open(str(tmp_path / "overview"), "csv", buffer_size=1)
+    sink.write_frame(smells_df)
+    assert (tmp_path / "overview.csv").exists()
+
+    sink.discard()
+
+    assert not (tmp_path / "overview.csv").exists()
+    assert len(sink) == 0
+
+
+def write_files(sink, filenames):
+    """
+    Writes two smells per file, recording each file in the journal.
+    """
+    for filename in filenames:
+        collector = SmellCollector()
+        for line in (1, 2):
+            collector.add(filename, "func", "smell", line, "desc", "info")
+        sink.write_collector(collector)
+        sink.record_file({"file": filename, "hash": filename, "rows": 2})
+
+
+@pytest.mark.parametrize("report_format", ["csv", "json", "jsonl"])
+def test_resume_truncates_partial_output(tmp_path, report_format):
+    """
+    Test that resuming an interrupted sink keeps the rows of the
+    journaled files only, and completes the same report as a full run.
+    """
+    files = ["a.py", "b.py", "c.py", "d.py"]
+    sink = ResultSink.open(str(tmp_path / "full"), report_format)
+    write_files(sink, files)
+    sink.close(keep_journal=True)
+
+    # A run interrupted after a checkpoint and another, unsaved, file
+    sink = ResultSink.open(str(tmp_path / "resumed"), report_format)
+    write_files(sink, files[:2])
+    sink.checkpoint()
+    write_files(sink, files[2:3])
+    sink.flush()
+    sink._file.close()
+
+    sink = ResultSink.open(str(tmp_path / "resumed"), report_format)
+    records = sink.resume(
+        lambda index, record: record["file"] == files[index]
+    )
+    assert [record["file"] for record in records] == files[:2]
+    assert len(sink) == 4
+
+    write_files(sink, files[2:])
+    sink.close(keep_journal=True)
+
+    extension = sink.extension
+    assert (tmp_path / f"resumed{extension}").read_bytes() == (
+        tmp_path / f"full{extension}"
+    ).read_bytes()
+    assert (tmp_path / f"_resumed{extension}.journal").read_text() == (
+        tmp_path / f"_full{extension}.journal"
+    ).read_text()
+
+
+def test_resume_stops_at_changed_file(tmp_path):
+    """
+    Test that resuming drops the rows of the first file that is no longer
+    current and of all the files after it.
+    """
+    sink = ResultSink.open(str(tmp_path / "overview"))
+    write_files(sink, ["a.py", "b.py", "c.py"])
+    sink.close(keep_journal=True)
+
+    sink = ResultSink.open(str(tmp_path / "overview"))
+    records = sink.resume(lambda index, record: record["file"] != "b.py")
+    sink.close(keep_journal=True)
+
+    assert [record["file"] for record in records] == ["a.py"]
+    df = pd.read_csv(tmp_path / "overview.csv")
+    assert df["filename"].tolist() == ["a.py", "a.py"]
+
+    # Without current files, nothing is kept
+    sink = ResultSink.open(str(tmp_path / "overview"))
+    assert sink.resume(lambda index, record: False) == []
+    sink.close(keep_journal=True)
+    assert not (tmp_path / "overview.csv").exists()
+    assert (tmp_path / "_overview.csv.journal").read_text() == ""
+
+
+def test_complete_report_leaves_no_journal(tmp_path):
+    """
+    Test that the journal is removed once the report is complete,
+    including the journal of the resumed run.
+    """
+    sink = ResultSink.open(str(tmp_path / "overview"))
+    write_files(sink, ["a.py", "b.py"])
+    sink.checkpoint()
+    assert (tmp_path / "_overview.csv.journal").exists()
+    sink.close(keep_journal=True)
+
+    sink = ResultSink.open(str(tmp_path / "overview"))
+    assert len(sink.resume(lambda index, record: True)) == 2
+    write_files(sink, ["c.py"])
+    sink.close()
+
+    assert not (tmp_path / "_overview.csv.journal").exists()
+    df = pd.read_csv(tmp_path / "overview.csv")
+    assert df["filename"].unique().tolist() == ["a.py", "b.py", "c.py"]
+
+
+def test_sink_without_records_writes_no_journal(tmp_path, smells_df):
+    """
+    Test that only sinks recording files write a journal.
+    """
+    with ResultSink.open(str(tmp_path / "overview")) as sink:
+        sink.write_frame(smells_df)
+
+    assert not (tmp_path / "_overview.csv.journal").exists()
+
+
+def test_parquet_sink_writes_row_groups(tmp_path, smells_df):
+    """
+    Test that streaming to Parquet writes a row group per flush, with
+    dictionary-encoded smell names, and reads back as the DataFrame.
+    """
+    pq = pytest.importorskip("pyarrow.parquet")
+    sink = ResultSink.open(
+        str(tmp_path / "overview"), "parquet", buffer_size=1
+    )
+    sink.write_frame(smells_df)
+    sink.close()
+
+    metadata = pq.ParquetFile(tmp_path / "overview.parquet").metadata
+    smell_name = SmellCollector.COLUMNS.index("smell_name")
+    assert metadata.num_row_groups == 2
+    assert "RLE_DICTIONARY" in (
+        metadata.row_group(0).column(smell_name).encodings
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "overview.parquet"),
+        smells_df,
+        check_dtype=False,
+    )
+
+
+def test_parquet_sink_resumes_from_scratch(tmp_path):
+    """
+    Test that resuming an interrupted Parquet report, which has no
+    footer, analyzes all of its files again.
+    """
+    pytest.importorskip("pyarrow")
+    with ResultSink.open(str(tmp_path / "overview"), "parquet") as sink:
+        write_files(sink, ["a.py", "b.py"])
+    # A run interrupted before the footer was written
+    report = tmp_path / "overview.parquet"
+    report.write_bytes(report.read_bytes()[: report.stat().st_size // 2])
+
+    sink = ResultSink.open(str(tmp_path / "overview"), "parquet")
+    assert sink.resume(lambda index, record: True) == []
+    assert not (tmp_path / "overview.parquet").exists()
+
+    write_files(sink, ["a.py"])
+    sink.close()
+    df = pd.read_parquet(tmp_path / "overview.parquet")
+    assert df["filename"].tolist() == ["a.py", "a.py"]
+
+
+def test_recording_files_does_not_flush(tmp_path):
+    """
+    Test that recorded files stay buffered until a checkpoint, which
+    journals the size of the report after the rows of each file.
+    """
+    sink = ResultSink.open(str(tmp_path / "overview"), "csv")
+    write_files(sink, ["a.py", "b.py"])
+
+    assert not (tmp_path / "overview.csv").exists()
+
+    sink.checkpoint()
+    report = (tmp_path / "overview.csv").read_bytes()
+    journal = (tmp_path / "_overview.csv.journal").read_text()
+    offsets = [json.loads(line)["offset"] for line in journal.splitlines()]
+    sink.close()
+
+    assert offsets == [report.index(b"b.py"), len(report)]
@@ -1,7 +1,7 @@
 import pytest
-import pandas as pd
 import ast
 from components.rule_checker import RuleChecker
+from components.smell_collector import SmellCollector
 
 
 @pytest.fixture
@@ -23,24 +23,19 @@ def mock_ast_node(mocker):
 
 
 @pytest.fixture
-def df_output():
-    return pd.DataFrame(
-        columns=[
-            "filename",
-            "function_name",
-            "smell_name",
-            "line",
-            "description",
-            "additional_info",
-        ]
-    )
+def collector():
+    return SmellCollector()
 
 
-def test_rule_check(mocker, mock_rule_checker, mock_ast_node, df_output):
+def test_rule_check(mocker, mock_rule_checker, mock_ast_node, collector):
     # Mock the classes for DataFrameConversionAPIMisused and ChainIndexingSmell
     mock_dataframe_conversion = mocker.Mock()
     mock_chain_indexing = mocker.Mock()
 
+    # Legacy rules without node types are run through their own detect
+    mock_dataframe_conversion.node_types = ()
+    mock_chain_indexing.node_types = ()
+
     # Mocking the return value of detect for
     #  DataFrameConversionAPIMisused
     #  (no smells for now)
@@ -120,15 +115,15 @@ def test_rule_check(mocker, mock_rule_checker, mock_ast_node, df_output):
     filename = "mock_file.py"
     function_name = "my_function"
     result = mock_rule_checker.rule_check(
-        mock_ast_node, extracted_data, filename, function_name, df_output
+        mock_ast_node, extracted_data, filename, function_name, collector
     )
 
     # Debug prints
     print("Mock detect return values:")
     print(mock_dataframe_conversion.detect.return_value)
     print(mock_chain_indexing.detect.return_value)
-    print("Result DataFrame:")
-    print(result)
+    print("Result smells:")
+    print(list(result.rows()))
 
     # Assertions to verify if the smells were added correctly
     assert (
@@ -136,7 +131,7 @@ def test_rule_check(mocker, mock_rule_checker, mock_ast_node, df_output):
     )  # Expecting one smell (chained indexing) to be detected
 
 
-def test_no_smells(mocker, mock_rule_checker, mock_ast_node, df_output):
+def test_no_smells(mocker, mock_rule_checker, mock_ast_node, collector):
     # Mock the chain indexing detection method to return no smells
     mock_chain_smell = mocker.patch(
         "detection_rules.api_specific.chain_indexing_smell.ChainIndexingSmell",
@@ -161,8 +156,105 @@ def test_no_smells(mocker, mock_rule_checker, mock_ast_node, df_output):
         extracted_data=extracted_data,
         filename=filename,
         function_name=function_name,
-        df_output=df_output,
+        collector=collector,
     )
 
     # Assertions
     assert len(result) == 0  # No smells detected
+
+
+def test_rules_skipped_without_required_libraries(
+    mocker, mock_rule_checker, mock_ast_node, collector
+):
+    # Rules about libraries the file does not import are not applied
+    mock_pandas_rule = mocker.Mock(node_types=())
+    mock_pandas_rule.applies_to.side_effect = lambda libraries: (
+        "pandas" in libraries
+    )
+    mock_pandas_rule.detect.return_value = [
+        {
+            "name": "pandas_smell",
+            "line": 1,
+            "description": "desc",
+            "additional_info": "info",
+        }
+    ]
+    mock_rule_checker.smells = [mock_pandas_rule]
+
+    assert not mock_rule_checker.applies_to({"os": "os"})
+    result = mock_rule_checker.rule_check(
+        mock_ast_node, {"libraries": {"os": "os"}}, "file.py", "f", collector
+    )
+    assert len(result) == 0
+    mock_pandas_rule.detect.assert_not_called()
+
+    assert mock_rule_checker.applies_to({"pandas": "pd"})
+    result = mock_rule_checker.rule_check(
+        mock_ast_node, {"libraries": {"pandas": "pd"}}, "file.py", "f", result
+    )
+    assert len(result) == 1
+
+
+def test_default_rules_require_libraries(mock_rule_checker):
+    # Files importing none of the analyzed libraries are skipped
+    assert not mock_rule_checker.applies_to({})
+    assert not mock_rule_checker.applies_to({"os": "os", "sys": "sys"})
+    assert mock_rule_checker.applies_to({"torch.nn": "nn"})
+    assert all(smell.required_libraries for smell in mock_rule_checker.smells)
+
+
+def test_rule_ids_match_smell_names():
+    # Rule identifiers are the lowercase names of the smells
+    checker = RuleChecker(output_path="output")
+    assert [smell.name.lower() for smell in checker.smells] == list(
+        RuleChecker.RULES
+    )
+    assert [smell.rule_id for smell in checker.smells] == list(
+        RuleChecker.RULES
+    )
+
+
+def test_select_rules():
+    # Explicit rules, profiles and skipped rules are combined
+    assert RuleChecker.select_rules(rules=["Chain_Indexing"]) == [
+        "chain_indexing"
+    ]
+    assert RuleChecker.select_rules(skip_rules=["memory_not_freed"]) == [
+        rule for rule in RuleChecker.RULES if rule != "memory_not_freed"
+    ]
+    assert RuleChecker.select_rules(profile="pytorch") == [
+        "gradients_not_cleared_before_backward_propagation",
+        "pytorch_call_method_misused",
+        "deterministic_algorithm_option_not_used",
+        "hyperparameters_not_explicitly_set",
+    ]
+    assert RuleChecker.select_rules(
+        rules=["chain_indexing"],
+        skip_rules=["hyperparameters_not_explicitly_set"],
+        profile="tensorflow",
+    ) == [
+        "chain_indexing",
+        "tensor_array_not_used",
+        "broadcasting_feature_not_used",
+        "memory_not_freed",
+    ]
+
+
+def test_select_unknown_rules():
+    with pytest.raises(ValueError, match="Unknown rules: not_a_rule"):
+        RuleChecker.select_rules(rules=["not_a_rule"])
+    with pytest.raises(ValueError, match="Unknown profile: sklearn"):
+        RuleChecker.select_rules(profile="sklearn")
+
+
+def test_selected_rules_only(mocker):
+    # Only the selected rules are instantiated
+    unnecessary_iteration = mocker.spy(
+        RuleChecker.RULES["unnecessary_iteration"], "__init__"
+    )
+    checker = RuleChecker(output_path="output", rules=["chain_indexing"])
+
+    assert [smell.name for smell in checker.smells] == ["Chain_Indexing"]
+    unnecessary_iteration.assert_not_called()
+    assert checker.requires_data("dataframe_variables")
+    assert not checker.requires_data("model_methods")
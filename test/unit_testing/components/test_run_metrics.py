@@ -0,0 +1,112 @@
+import json
+import pickle
+from components.run_metrics import RunMetrics
+
+
+def test_statistics_per_rule_and_stage():
+    """
+    Test that the timings are aggregated per rule and per stage.
+    """
+    metrics = RunMetrics()
+    for index in range(1, 21):
+        metrics.add_file(
+            f"file{index}.py",
+            {"parse": index / 1000, "detection": index / 100},
+            {"chain_indexing": index / 100},
+        )
+    metrics.add_stage("write", 0.5)
+
+    summary = metrics.summary()
+
+    assert summary["files"] == 20
+    assert summary["rules"]["chain_indexing"] == {
+        "count": 20,
+        "total": 2.1,
+        "p50": 0.1,
+        "p95": 0.19,
+        "max": 0.2,
+    }
+    assert summary["stages"]["parse"]["max"] == 0.02
+    assert summary["stages"]["write"]["count"] == 1
+
+
+def test_slowest_files():
+    """
+    Test that only the slowest files are kept, slowest first.
+    """
+    metrics = RunMetrics(slowest_files=2)
+    metrics.add_file("fast.py", {"parse": 0.1})
+    metrics.add_file("slow.py", {"parse": 0.5, "detection": 1.0})
+    metrics.add_file("medium.py", {"parse": 0.3})
+
+    slowest = metrics.summary()["slowest_files"]
+
+    assert [entry["filename"] for entry in slowest] == [
+        "slow.py",
+        "medium.py",
+    ]
+    assert slowest[0]["seconds"] == 1.5
+    assert slowest[0]["stages"] == {"parse": 0.5, "detection": 1.0}
+
+
+def test_merge_worker_metrics():
+    """
+    Test that the metrics of worker processes can be combined.
+    """
+    metrics = RunMetrics(slowest_files=1)
+    metrics.add_file("a.py", {"parse": 0.1}, {"chain_indexing": 0.1})
+    worker = pickle.loads(pickle.dumps(RunMetrics(slowest_files=1)))
+    worker.add_file("b.py", {"parse": 0.2}, {"memory_not_freed": 0.3})
+
+    metrics.merge(worker)
+    summary = metrics.summary()
+
+    assert summary["files"] == 2
+    assert summary["stages"]["parse"]["count"] == 2
+    assert set(summary["rules"]) == {"chain_indexing", "memory_not_freed"}
+    assert summary["slowest_files"][0]["filename"] == "b.py"
+
+
+def test_save_and_report(tmp_path):
+    """
+    Test that the metrics are saved as JSON and formatted as tables.
+    """
+    metrics = RunMetrics()
+    metrics.add_file("a.py", {"parse": 0.1}, {"chain_indexing": 0.05})
+
+    path = metrics.save(str(tmp_path))
+    with open(path) as file:
+        saved = json.load(file)
+    report = metrics.format_report()
+
+    assert path == str(tmp_path / "run_metrics.json")
+    assert saved["rules"]["chain_indexing"]["total"] == 0.05
+    assert "chain_indexing" in report
+    assert "Slowest files:" in report
+    assert "a.py" in report
+
+
+def test_combine_summaries():
+    """
+    Test that the summaries of concurrent runs are combined.
+    """
+    first = RunMetrics()
+    first.add_file("a.py", {"parse": 0.1}, {"chain_indexing": 0.1})
+    second = RunMetrics()
+    second.add_file("b.py", {"parse": 0.3}, {"chain_indexing": 0.2})
+    second.add_file("c.py", {"parse": 0.2}, {"memory_not_freed": 0.1})
+
+    combined = RunMetrics.combine(
+        [first.summary(), second.summary()], slowest_files=2
+    )
+
+    assert combined["files"] == 3
+    assert combined["stages"]["parse"]["count"] == 3
+    assert combined["stages"]["parse"]["total"] == 0.6
+    assert combined["stages"]["parse"]["max"] == 0.3
+    assert combined["rules"]["chain_indexing"]["count"] == 2
+    assert set(combined["rules"]) == {"chain_indexing", "memory_not_freed"}
+    assert [entry["filename"] for entry in combined["slowest_files"]] == [
+        "b.py",
+        "c.py",
+    ]
@@ -0,0 +1,145 @@
+import json
+import pandas as pd
+import pytest
+from components.project_analyzer import ProjectAnalyzer
+from components.shard_merger import ShardMerger
+
+
+def write_modules(project_path, count):
+    """
+    Writes modules with smells, each calling the previous one.
+    """
+    project_path.mkdir(parents=True)
+    for index in range(count):
+        lines = ["import pandas as pd"]
+        if index:
+            lines.append(f"from module{index - 1} import load{index - 1}")
+        lines += [f"def load{index}():", "    df = pd.read_csv('data.csv')"]
+        if index:
+            lines.append(f"    load{index - 1}()")
+        lines.append("    return df['a'][0]")
+        (project_path / f"module{index}.py").write_text("\n".join(lines))
+
+
+def rows(path):
+    """
+    Returns the rows of a CSV report, whatever their order.
+    """
+    frame = pd.read_csv(path)
+    return sorted(map(tuple, frame.astype(str).values.tolist()))
+
+
+def test_merge_shards_of_a_project(tmp_path):
+    """
+    Test that the merged shards of a project match a single run, with
+    the rows and the call graph (including the calls across files of
+    different shards) in the same order.
+    """
+    project_path = tmp_path / "project"
+    write_modules(project_path, 12)
+
+    ProjectAnalyzer(str(tmp_path / "full")).analyze_project(
+        str(project_path), enable_callgraph=True
+    )
+    shards = []
+    for shard_index in range(2):
+        shard = str(tmp_path / f"shard{shard_index}")
+        ProjectAnalyzer(
+            shard, shard_index=shard_index, shard_count=2
+        ).analyze_project(str(project_path), enable_callgraph=True)
+        shards.append(shard)
+
+    ShardMerger(shards, str(tmp_path / "merged")).merge()
+
+    merged = tmp_path / "merged" / "output"
+    full = tmp_path / "full" / "output"
+    pd.testing.assert_frame_equal(
+        pd.read_csv(merged / "overview.csv"),
+        pd.read_csv(full / "overview.csv"),
+    )
+    with open(full / "callgraph.json") as file:
+        assert json.load(file)["edges"]
+    assert (merged / "callgraph.json").read_bytes() == (
+        full / "callgraph.json"
+    ).read_bytes()
+
+
+def test_merge_shards_of_projects(tmp_path):
+    """
+    Test that the merged shards of multiple projects hold the detailed
+    results of every project and their overview.
+    """
+    base_path = tmp_path / "projects"
+    for name in ("alpha", "beta", "gamma", "delta"):
+        write_modules(base_path / name, 2)
+
+    analyzer = ProjectAnalyzer(str(tmp_path / "full"))
+    analyzer.analyze_projects_sequential(str(base_path))
+    analyzer.merge_all_results()
+    shards = []
+    for shard_index in range(2):
+        shard = str(tmp_path / f"shard{shard_index}")
+        analyzer = ProjectAnalyzer(
+            shard, shard_index=shard_index, shard_count=2
+        )
+        analyzer.analyze_projects_sequential(str(base_path))
+        analyzer.merge_all_results()
+        shards.append(shard)
+    # The journal of a project interrupted in a shard is not merged
+    details = tmp_path / "shard0" / "output" / "project_details"
+    (details / "_zeta_results.csv.journal").write_text("")
+
+    ShardMerger(shards, str(tmp_path / "merged")).merge()
+
+    merged = tmp_path / "merged" / "output"
+    full = tmp_path / "full" / "output"
+    assert sorted(p.name for p in (merged / "project_details").iterdir()) == (
+        sorted(p.name for p in (full / "project_details").iterdir())
+    )
+    assert rows(merged / "overview.csv") == rows(full / "overview.csv")
+
+
+def test_merge_missing_shard(tmp_path):
+    """
+    Test that merging fails if the output of a shard is missing.
+    """
+    with pytest.raises(FileNotFoundError, match="Shard output not found"):
+        ShardMerger(
+            [str(tmp_path / "missing")], str(tmp_path / "merged")
+        ).merge()
+
+
+def test_merge_parquet_shards_of_projects(tmp_path):
+    """
+    Test that the Parquet partitions of the projects of every shard are
+    merged into the overview dataset.
+    """
+    pytest.importorskip("pyarrow")
+    base_path = tmp_path / "projects"
+    for name in ("alpha", "beta", "gamma"):
+        write_modules(base_path / name, 2)
+
+    shards = []
+    for shard_index in range(2):
+        shard = str(tmp_path / f"shard{shard_index}")
+        analyzer = ProjectAnalyzer(
+            shard, shard_index=shard_index, shard_count=2
+        )
+        analyzer.analyze_projects_sequential(
+            str(base_path), report_format="parquet"
+        )
+        shards.append(shard)
+
+    ShardMerger(shards, str(tmp_path / "merged")).merge(
+        report_format="parquet"
+    )
+
+    overview = pd.read_parquet(
+        tmp_path / "merged" / "output" / "overview.parquet"
+    )
+    assert sorted(overview["project"].astype(str).unique()) == [
+        "alpha",
+        "beta",
+        "gamma",
+    ]
+    assert len(overview) == 12
@@ -0,0 +1,104 @@
+import pandas as pd
+import pytest
+from components.smell_collector import SmellCollector
+
+
+@pytest.fixture
+def detected_smells():
+    return [
+        {
+            "name": "smell1",
+            "line": 10,
+            "description": "description1",
+            "additional_info": "info1",
+        },
+        {
+            "name": "smell2",
+            "line": 15,
+            "description": "description2",
+            "additional_info": "info2",
+        },
+    ]
+
+
+def test_add_smells(detected_smells):
+    """
+    Test that the smells of a rule are collected in order.
+    """
+    collector = SmellCollector()
+    collector.add_smells("file.py", "my_function", detected_smells)
+
+    assert len(collector) == 2
+    rows = list(collector.rows())
+    assert rows[0] == {
+        "filename": "file.py",
+        "function_name": "my_function",
+        "smell_name": "smell1",
+        "line": 10,
+        "description": "description1",
+        "additional_info": "info1",
+    }
+    assert rows[1]["line"] == 15
+
+
+def test_to_dataframe(detected_smells):
+    """
+    Test the conversion of the collected smells to a DataFrame.
+    """
+    collector = SmellCollector()
+    collector.add_smells("file.py", "my_function", detected_smells)
+
+    df = collector.to_dataframe()
+
+    assert list(df.columns) == list(SmellCollector.COLUMNS)
+    assert df["smell_name"].tolist() == ["smell1", "smell2"]
+    assert df["line"].tolist() == [10, 15]
+
+
+def test_empty_collector_to_dataframe():
+    """
+    Test that an empty collector converts to an empty DataFrame.
+    """
+    df = SmellCollector().to_dataframe()
+
+    assert df.empty
+    assert list(df.columns) == list(SmellCollector.COLUMNS)
+
+
+def test_extend(detected_smells):
+    """
+    Test that collectors can be merged.
+    """
+    first = SmellCollector()
+    first.add_smells("a.py", "f", detected_smells[:1])
+    second = SmellCollector()
+    second.add_smells("b.py", "g", detected_smells[1:])
+
+    first.extend(second)
+
+    assert [row["filename"] for row in first.rows()] == ["a.py", "b.py"]
+    assert len(second) == 1
+
+
+def test_extend_frame_with_missing_columns():
+    """
+    Test that DataFrame rows are appended and missing columns left empty.
+    """
+    collector = SmellCollector()
+    collector.extend_frame(
+        pd.DataFrame(
+            [{"filename": "file.py", "smell_name": "smell1", "line": 3}]
+        )
+    )
+
+    row = next(collector.rows())
+    assert row["filename"] == "file.py"
+    assert row["line"] == 3
+    assert row["function_name"] is None
+
+
+def test_records_have_no_instance_dict():
+    """
+    Test that the collector does not carry a per-instance dictionary.
+    """
+    assert not hasattr(SmellCollector(), "__dict__")
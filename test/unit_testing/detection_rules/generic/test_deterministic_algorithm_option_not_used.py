@@ -96,3 +96,29 @@ def test_detect_with_alias(smell_detector):
         in result[0]["additional_info"]
     )
     assert result[0]["line"] == 3  # Line where the smell occurs
+
+
+def test_detect_with_imported_function(smell_detector):
+    """
+    Test the detect method when `use_deterministic_algorithms` is imported
+    from PyTorch under another name.
+    """
+    code = (
+        "from torch import use_deterministic_algorithms as deterministic\n"
+        "def main():\n"
+        "    deterministic(True)\n"
+    )
+    tree = ast.parse(code)
+    extracted_data = {
+        "libraries": {"torch.use_deterministic_algorithms": "deterministic"},
+        "library_by_alias": {
+            "deterministic": "torch.use_deterministic_algorithms"
+        },
+    }
+
+    result = smell_detector.detect(tree, extracted_data)
+    assert len(result) == 1
+    assert (
+        "Using `torch.use_deterministic_algorithms(True)`"
+        in result[0]["additional_info"]
+    )
@@ -0,0 +1,277 @@
+import ast
+import pytest
+from detection_rules.rule_dispatcher import (
+    FunctionTraversal,
+    RuleDispatcher,
+    ScopePartition,
+)
+from detection_rules.api_specific.chain_indexing_smell import (
+    ChainIndexingSmell,
+)
+from detection_rules.generic.unnecessary_iteration import (
+    UnnecessaryIterationSmell,
+)
+
+
+@pytest.fixture
+def tree():
+    code = (
+        "import pandas as pd\n"
+        "def main():\n"
+        "    df = pd.DataFrame()\n"
+        "    for index, row in df.iterrows():\n"
+        "        value = df['a'][0]\n"
+    )
+    return ast.parse(code)
+
+
+@pytest.fixture
+def extracted_data():
+    return {
+        "libraries": {"pandas": "pd"},
+        "dataframe_variables": ["df"],
+    }
+
+
+def test_traversal_matches_ast_walk(tree):
+    """
+    Test that the traversal visits nodes in the same order as ast.walk.
+    """
+    traversal = FunctionTraversal(tree)
+    assert list(traversal.walk()) == list(ast.walk(tree))
+
+
+def test_traversal_ancestors(tree):
+    """
+    Test that the ancestors of a node are yielded innermost first.
+    """
+    traversal = FunctionTraversal(tree)
+    nodes = list(traversal.walk())
+    subscript = next(
+        node
+        for node in nodes
+        if isinstance(node, ast.Subscript)
+        and isinstance(node.value, ast.Subscript)
+    )
+
+    ancestors = list(traversal.ancestors(subscript))
+    assert isinstance(ancestors[0], ast.Assign)
+    assert isinstance(ancestors[1], ast.For)
+    assert isinstance(ancestors[2], ast.FunctionDef)
+    assert ancestors[-1] is tree
+    assert traversal.parent(tree) is None
+
+
+def test_traversal_blocks_and_loops():
+    """
+    Test that the loops, `with` statements and functions enclosing a node
+    are indexed innermost first.
+    """
+    code = (
+        "def main():\n"
+        "    with open('f') as file:\n"
+        "        while True:\n"
+        "            for line in file:\n"
+        "                total = line\n"
+    )
+    tree = ast.parse(code)
+    traversal = FunctionTraversal(tree)
+    nodes = list(traversal.walk())
+    assign = next(node for node in nodes if isinstance(node, ast.Assign))
+    function = tree.body[0]
+
+    blocks = traversal.blocks(assign)
+    assert [type(block) for block in blocks] == [
+        ast.For,
+        ast.While,
+        ast.With,
+        ast.FunctionDef,
+    ]
+    assert traversal.blocks(assign.targets[0]) == blocks
+    assert list(traversal.enclosing_loops(assign)) == list(blocks[:2])
+    assert traversal.in_loop(assign)
+    assert not traversal.in_loop(function.body[0])
+    assert traversal.blocks(tree) == ()
+
+
+def test_traversal_is_assigned():
+    """
+    Test that only expressions used as the value of an assignment are
+    reported as assigned.
+    """
+    code = "df = df.drop('a')\ndf.drop('b')\nprint(df.drop('c'))\n"
+    traversal = FunctionTraversal(ast.parse(code))
+    calls = {
+        node.args[0].value: node
+        for node in traversal.walk()
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+    }
+
+    assert traversal.is_assigned(calls["a"])
+    assert not traversal.is_assigned(calls["b"])
+    assert not traversal.is_assigned(calls["c"])
+
+
+def test_traversal_qualified_name():
+    """
+    Test that called names are resolved through the imports, once per
+    node and alias map.
+    """
+    code = "np.linalg.norm(x)\nSVC()\nget()().fit()\n"
+    traversal = FunctionTraversal(ast.parse(code))
+    calls = [
+        node for node in traversal.walk() if isinstance(node, ast.Call)
+    ]
+    library_by_alias = {"np": "numpy", "SVC": "sklearn.svm.SVC"}
+
+    names = [
+        traversal.qualified_name(call.func, library_by_alias)
+        for call in calls
+    ]
+    assert names == [
+        "numpy.linalg.norm",
+        "sklearn.svm.SVC",
+        "fit",
+        "",  # The function of `get()()` is not a name
+        "get",
+    ]
+    # Names are memoized by node, for the same alias map only
+    assert traversal.qualified_name(calls[0].func, library_by_alias) == (
+        "numpy.linalg.norm"
+    )
+    assert traversal.qualified_name(calls[0].func, {}) == "np.linalg.norm"
+    assert traversal.qualified_name(calls[0].func, {"np": "jax.numpy"}) == (
+        "jax.numpy.linalg.norm"
+    )
+
+
+def test_scope_partition_qualnames():
+    """
+    Test that functions, methods and nested functions are scopes named
+    as in `__qualname__`, followed by the module.
+    """
+    code = (
+        "class Model:\n"
+        "    def fit(self):\n"
+        "        def step():\n"
+        "            pass\n"
+        "async def load():\n"
+        "    pass\n"
+    )
+    partition = ScopePartition(ast.parse(code))
+
+    assert [scope.qualname for scope in partition.scopes] == [
+        "load",
+        "Model.fit",
+        "Model.fit.<locals>.step",
+        "<module>",
+    ]
+    assert [scope.name for scope in partition.scopes] == [
+        "load",
+        "fit",
+        "step",
+        "<module>",
+    ]
+
+
+def test_scope_partition_assigns_nodes_once():
+    """
+    Test that every node belongs to exactly one scope, its innermost
+    enclosing function.
+    """
+    code = (
+        "x = [i for i in range(3)]\n"
+        "def outer():\n"
+        "    a = 1\n"
+        "    def inner():\n"
+        "        b = 2\n"
+    )
+    tree = ast.parse(code)
+    partition = ScopePartition(tree)
+    scopes = {scope.qualname: scope for scope in partition.scopes}
+
+    nodes = [node for scope in partition.scopes for node in scope.nodes]
+    assert sorted(map(id, nodes)) == sorted(map(id, ast.walk(tree)))
+
+    def names(scope):
+        return {
+            node.id for node in scope.nodes if isinstance(node, ast.Name)
+        }
+
+    assert names(scopes["<module>"]) == {"x", "i", "range"}
+    assert names(scopes["outer"]) == {"a"}
+    assert names(scopes["outer.<locals>.inner"]) == {"b"}
+
+
+def test_scope_traversal_stops_at_scope():
+    """
+    Test that the ancestors of a node stop at the node of its scope.
+    """
+    code = "def outer():\n    def inner():\n        return 1\n"
+    partition = ScopePartition(ast.parse(code))
+    inner = partition.scopes[1]
+    traversal = partition.traversal(inner)
+    constant = next(
+        node for node in traversal.walk() if isinstance(node, ast.Constant)
+    )
+
+    ancestors = list(traversal.ancestors(constant))
+    assert isinstance(ancestors[0], ast.Return)
+    assert ancestors[-1] is inner.node
+    assert traversal.parent(inner.node) is None
+
+
+def test_dispatch_returns_results_per_rule(tree, extracted_data):
+    """
+    Test that the dispatcher returns the smells of each rule, in order.
+    """
+    dispatcher = RuleDispatcher(
+        [ChainIndexingSmell(), UnnecessaryIterationSmell()]
+    )
+
+    results = dispatcher.dispatch(tree, extracted_data)
+
+    assert len(results) == 2
+    assert [smell["line"] for smell in results[0]] == [5]
+    assert [smell["line"] for smell in results[1]] == [4]
+
+
+def test_dispatch_skips_rules_without_state(tree):
+    """
+    Test that rules whose preconditions are not met report no smells.
+    """
+    dispatcher = RuleDispatcher([ChainIndexingSmell()])
+
+    results = dispatcher.dispatch(tree, {"libraries": {}})
+
+    assert results == [[]]
+
+
+def test_dispatch_reports_errors(tree, extracted_data, mocker):
+    """
+    Test that a failing rule is reported and does not affect the others.
+    """
+    failing = ChainIndexingSmell()
+    mocker.patch.object(failing, "visit", side_effect=ValueError("boom"))
+    on_error = mocker.Mock()
+    dispatcher = RuleDispatcher([failing, UnnecessaryIterationSmell()])
+
+    results = dispatcher.dispatch(tree, extracted_data, on_error=on_error)
+
+    on_error.assert_called_once()
+    assert on_error.call_args[0][0] is failing
+    assert results[0] == []
+    assert len(results[1]) == 1
+
+
+def test_dispatch_raises_without_error_handler(tree, extracted_data, mocker):
+    """
+    Test that rule errors are raised when no handler is given.
+    """
+    failing = ChainIndexingSmell()
+    mocker.patch.object(failing, "visit", side_effect=ValueError("boom"))
+    dispatcher = RuleDispatcher([failing])
+
+    with pytest.raises(ValueError, match="boom"):
+        dispatcher.dispatch(tree, extracted_data)
@@ -0,0 +1,140 @@
+import ast
+import sys
+import types
+import pytest
+from importlib.metadata import EntryPoint
+from components.rule_checker import RuleChecker
+from detection_rules import smell as smell_module
+from detection_rules.rule_registry import BUILTIN_RULES, RuleRegistry
+from detection_rules.smell import Smell
+
+
+@pytest.fixture
+def registry(monkeypatch, mocker):
+    # A registry of the built-in rules, without installed plugins, in
+    # which the rules defined by the tests register themselves
+    registry = RuleRegistry(BUILTIN_RULES)
+    monkeypatch.setattr(smell_module, "RULES", registry)
+    mocker.patch("importlib.metadata.entry_points", return_value=[])
+    return registry
+
+
+def define_rule(rule_id):
+    # The identifier is set once the class is defined, so that the rule
+    # does not register itself
+    class SlowLoopSmell(Smell):
+        def __init__(self):
+            super().__init__(name="Slow_Loop", description="Slow loop.")
+
+        node_types = (ast.For,)
+        required_libraries = ("numpy",)
+        cost = "medium"
+
+        def visit(self, node, state, traversal):
+            state["smells"].append(self.format_smell(line=node.lineno))
+
+    SlowLoopSmell.rule_id = rule_id
+    return SlowLoopSmell
+
+
+def plugin_module(monkeypatch, rule_id):
+    # Defines the rule in an importable module, as a plugin package would
+    module = types.ModuleType("slow_loop_plugin")
+    monkeypatch.setitem(sys.modules, "slow_loop_plugin", module)
+    module.SlowLoopSmell = define_rule(rule_id)
+    module.SlowLoopSmell.__module__ = "slow_loop_plugin"
+    module.SlowLoopSmell.__qualname__ = "SlowLoopSmell"
+    return module
+
+
+def test_listing_rules_imports_none(registry):
+    assert list(registry) == list(BUILTIN_RULES)
+    assert not any(registry.is_loaded(rule) for rule in registry)
+
+    chain_indexing = registry["chain_indexing"]
+
+    assert chain_indexing.rule_id == "chain_indexing"
+    assert registry.is_loaded("chain_indexing")
+    assert not registry.is_loaded("memory_not_freed")
+
+
+def test_rules_register_themselves(registry):
+    class CustomSmell(Smell):
+        rule_id = "custom_rule"
+
+    assert list(registry)[-1] == "custom_rule"
+    assert registry["custom_rule"] is CustomSmell
+
+    # Subclasses without an identifier are not registered
+    class HelperSmell(Smell):
+        pass
+
+    assert len(registry) == len(BUILTIN_RULES) + 1
+
+    with pytest.raises(ValueError, match="already registered"):
+
+        class ChainIndexingSmell(Smell):
+            rule_id = "chain_indexing"
+
+
+def test_entry_point_rules(registry, monkeypatch, mocker):
+    module = plugin_module(monkeypatch, "slow_loop")
+    mocker.patch(
+        "importlib.metadata.entry_points",
+        return_value=[
+            EntryPoint(
+                name="slow_loop",
+                value="slow_loop_plugin:SlowLoopSmell",
+                group=RuleRegistry.ENTRY_POINT_GROUP,
+            ),
+            EntryPoint(
+                name="chain_indexing",
+                value="slow_loop_plugin:SlowLoopSmell",
+                group=RuleRegistry.ENTRY_POINT_GROUP,
+            ),
+        ],
+    )
+
+    assert list(registry) == [*BUILTIN_RULES, "slow_loop"]
+    assert not registry.is_loaded("slow_loop")
+    assert registry.metadata("slow_loop") == {
+        "id": "slow_loop",
+        "target": "slow_loop_plugin:SlowLoopSmell",
+        "required_libraries": ("numpy",),
+        "node_types": ("For",),
+        "cost": "medium",
+    }
+    assert registry["slow_loop"] is module.SlowLoopSmell
+    # Plugins cannot replace the built-in rules
+    assert registry["chain_indexing"].__name__ == "ChainIndexingSmell"
+
+
+def test_entry_point_with_other_identifier(registry, monkeypatch, mocker):
+    plugin_module(monkeypatch, "fast_loop")
+    mocker.patch(
+        "importlib.metadata.entry_points",
+        return_value=[
+            EntryPoint(
+                name="slow_loop",
+                value="slow_loop_plugin:SlowLoopSmell",
+                group=RuleRegistry.ENTRY_POINT_GROUP,
+            )
+        ],
+    )
+
+    with pytest.raises(TypeError, match="declares the identifier"):
+        registry["slow_loop"]
+
+
+def test_rule_checker_applies_plugins(registry, monkeypatch):
+    plugin_module(monkeypatch, "slow_loop")
+    registry.register_lazy("slow_loop", "slow_loop_plugin:SlowLoopSmell")
+    monkeypatch.setattr(RuleChecker, "RULES", registry)
+
+    checker = RuleChecker(output_path="output", rules=["slow_loop"])
+
+    assert RuleChecker.select_rules(skip_rules=["slow_loop"]) == list(
+        BUILTIN_RULES
+    )
+    assert [smell.rule_id for smell in checker.smells] == ["slow_loop"]
+    assert not registry.is_loaded("chain_indexing")
@@ -156,3 +156,24 @@ def test_menu(mocker):
 
     choice = generator.menu()
     assert choice == "1"
+
+
+def test_load_parquet_project_details(tmp_path, mock_data):
+    """
+    Test that the Parquet results of the project partitions are found
+    and loaded.
+    """
+    pytest.importorskip("pyarrow")
+    details = tmp_path / "project_details"
+    for project in ("alpha", "beta"):
+        partition = details / f"project={project}"
+        partition.mkdir(parents=True)
+        mock_data.to_parquet(partition / "results.parquet")
+    generator = ReportGenerator(input_path=str(tmp_path))
+
+    file_paths = generator._find_project_details()
+    df = generator._load_data(file_paths)
+
+    assert len(file_paths) == 2
+    assert all(path.endswith("results.parquet") for path in file_paths)
+    assert len(df) == len(mock_data) * 2
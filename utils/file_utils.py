@@ -1,6 +1,15 @@
+import csv
+import hashlib
+import json
 import os
 import shutil
-import pandas as pd
+from urllib.parse import quote
+from components.result_sink import (
+    ParquetResultSink,
+    ResultSink,
+    require_pyarrow,
+)
+from utils.file_discovery import FileDiscovery
 
 
 class FileUtils:
@@ -38,134 +47,276 @@ class FileUtils:
         return output_path
 
     @staticmethod
-    def _normalize_exclude_paths(exclude_paths, base_path: str) -> list[str]:
-        if not exclude_paths:
-            return []
+    def get_python_files(
+        path: str, exclude_paths=None, gitignore: bool = True, workers: int = 1
+    ) -> list[str]:
+        """
+        Retrieves all Python files from the specified path, skipping
+        vendored directories and the paths ignored by `.gitignore` files
+        (see `FileDiscovery`).
 
-        normalized = []
-        for p in exclude_paths:
-            if not p:
-                continue
-            abs_p = (
-                os.path.abspath(os.path.join(base_path, p))
-                if not os.path.isabs(p)
-                else os.path.abspath(p)
-            )
-            normalized.append(os.path.normpath(abs_p))
-        return normalized
+        Parameters:
+        - path (str): Path to search for Python files.
+        - exclude_paths: Optional list of paths or glob patterns (absolute
+          or relative to `path`) to exclude from discovery.
+        - gitignore (bool): Whether to honor the `.gitignore` files.
+        - workers (int): Number of threads listing directories.
 
-    @staticmethod
-    def _is_excluded(file_path: str, excluded_paths: list[str]) -> bool:
-        if not excluded_paths:
-            return False
-        f = os.path.normpath(os.path.abspath(file_path))
-        for ex in excluded_paths:
-            if f == ex or f.startswith(ex + os.sep):
-                return True
-        return False
+        Returns:
+        - list[str]: List of Python file paths.
+        """
+        return FileDiscovery(
+            exclude_paths, gitignore=gitignore, workers=workers
+        ).discover(path)
 
     @staticmethod
-    def get_python_files(path: str, exclude_paths=None) -> list[str]:
+    def shard_of(key: str, shard_count: int) -> int:
         """
-        Retrieves all Python files from the specified path.
+        Assigns a file or a project to a shard, by a stable hash of its
+        key: every machine, run and Python process agrees on the shard.
 
         Parameters:
-        - path (str): Path to search for Python files.
-        - exclude_paths: Optional list of paths (absolute or relative to `path`)
-          to exclude from discovery.
+        - key (str): The path of the file, relative to the project and
+          with `/` separators, or the name of the project.
+        - shard_count (int): The number of shards.
 
         Returns:
-        - list[str]: List of Python file paths.
+        - int: The index of the shard, from 0 to `shard_count - 1`.
         """
-        result = []
-        base_path = path if os.path.isdir(path) else os.path.dirname(path)
-        excluded = FileUtils._normalize_exclude_paths(exclude_paths, base_path)
-
-        if os.path.isfile(path) and path.endswith(".py"):
-            if FileUtils._is_excluded(path, excluded):
-                return []
-            return [path]
-
-        for root, dirs, files in os.walk(path):
-            if "venv" in dirs:
-                dirs.remove("venv")
-            if "lib" in dirs:
-                dirs.remove("lib")
-
-            # prune excluded directories
-            dirs[:] = [
-                d
-                for d in dirs
-                if not FileUtils._is_excluded(os.path.join(root, d), excluded)
-            ]
-
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = os.path.abspath(os.path.join(root, file))
-                    if FileUtils._is_excluded(file_path, excluded):
-                        continue
-                    result.append(file_path)
-
-        return result
+        digest = hashlib.sha256(key.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % shard_count
 
     @staticmethod
-    def merge_results(input_dir: str, output_dir: str, report_format: str = "csv"):
+    def merge_results(
+        input_dir: str,
+        output_dir: str,
+        report_format: str = "csv",
+        partition_by_smell: bool = False,
+    ):
         """
         Merges analysis results from multiple projects into a single report.
 
+        Results are streamed to the report one project file at a time, so
+        the merged results are never held in memory all together.
+
         Parameters:
         - input_dir (str): Directory containing analysis results.
         - output_dir (str): Directory where the merged results will be saved.
-        - report_format (str): "csv" (default) or "json".
+        - report_format (str): "csv" (default), "json", "jsonl" or
+          "parquet".
+        - partition_by_smell (bool): Whether to partition a Parquet
+          overview by smell, besides by project.
         """
-        dataframes = []
-
-        if report_format == "json":
-            print(f"Looking for JSON files in directory: {input_dir}")
+        extension = FileUtils.results_extension(report_format)
+        label = extension[1:].upper()
+        print(f"Looking for {label} files in directory: {input_dir}")
+
+        file_paths = [
+            os.path.join(subdir, file)
+            for subdir, _, files in os.walk(input_dir)
+            for file in files
+            if file.endswith(extension)
+        ]
+        if report_format == "parquet":
+            FileUtils._merge_parquet_dataset(
+                file_paths, input_dir, output_dir, partition_by_smell
+            )
         else:
-            print(f"Looking for CSV files in directory: {input_dir}")
-
-        for subdir, _, files in os.walk(input_dir):
-            for file in files:
-                if report_format == "json" and file.endswith(".json"):
-                    file_path = os.path.join(subdir, file)
-                    try:
-                        df = pd.read_json(file_path)
-                        if not df.empty:
-                            dataframes.append(df)
-                        else:
-                            print(f"Skipping empty JSON: {file_path}")
-                    except Exception as e:
-                        print(f"Failed to read {file_path}: {e}")
-
-                if report_format != "json" and file.endswith(".csv"):
-                    file_path = os.path.join(subdir, file)
-                    try:
-                        df = pd.read_csv(file_path)
-                        if not df.empty:
-                            dataframes.append(df)
-                        else:
-                            print(f"Skipping empty CSV: {file_path}")
-                    except Exception as e:
-                        print(f"Failed to read {file_path}: {e}")
-
-        if dataframes:
-            combined_df = pd.concat(dataframes, ignore_index=True)
-            os.makedirs(output_dir, exist_ok=True)
-
-            if report_format == "json":
-                out_path = os.path.join(output_dir, "overview.json")
-                combined_df.to_json(out_path, orient="records", indent=2)
-                print(f"Merged results saved to {out_path}")
-            else:
-                out_path = os.path.join(output_dir, "overview.csv")
-                combined_df.to_csv(out_path, index=False)
-                print(f"Merged results saved to {out_path}")
+            FileUtils.merge_result_files(file_paths, output_dir, report_format)
+
+    @staticmethod
+    def merge_result_files(
+        file_paths: list[str],
+        output_dir: str,
+        report_format: str = "csv",
+        row_positions: list[list[int]] | None = None,
+    ):
+        """
+        Merges result files, in order, into the overview report of a
+        directory.
+
+        Parameters:
+        - file_paths (list[str]): Paths of the result files.
+        - output_dir (str): Directory where the merged results will be saved.
+        - report_format (str): "csv" (default), "json", "jsonl" or
+          "parquet".
+        - row_positions (list[list[int]] | None): The position of every
+          row of each file. If given, rows are merged in position order
+          (rows with the same position keep their order) instead of file
+          order.
+        """
+        extension = FileUtils.results_extension(report_format)
+        label = extension[1:].upper()
+        merged = None
+        positioned = []
+
+        for index, file_path in enumerate(file_paths):
+            try:
+                records = FileUtils._read_results(file_path, extension)
+            except Exception as e:
+                print(f"Failed to read {file_path}: {e}")
+                continue
+            if not records:
+                print(f"Skipping empty {label}: {file_path}")
+                continue
+
+            if merged is None:
+                os.makedirs(output_dir, exist_ok=True)
+                merged = ResultSink.open(
+                    os.path.join(output_dir, "overview"),
+                    report_format,
+                    columns=records[0].keys(),
+                )
+            if row_positions is not None:
+                if len(row_positions[index]) == len(records):
+                    positioned.extend(zip(row_positions[index], records))
+                    continue
+                # The rows cannot be placed: they are merged in file order
+                print(f"Rows of {file_path} merged in file order.")
+                merged.write_rows(
+                    tuple(record.get(column) for column in merged.columns)
+                    for _, record in positioned
+                )
+                positioned, row_positions = [], None
+            merged.write_rows(
+                tuple(record.get(column) for column in merged.columns)
+                for record in records
+            )
+
+        if positioned:
+            positioned.sort(key=lambda item: item[0])
+            merged.write_rows(
+                tuple(record.get(column) for column in merged.columns)
+                for _, record in positioned
+            )
+        if merged is not None:
+            merged.close()
+            print(f"Merged results saved to {merged.path}")
         else:
-            if report_format == "json":
-                print("No valid JSON files found to merge.")
-            else:
-                print("No valid CSV files found to merge.")
+            print(f"No valid {label} files found to merge.")
+
+    @staticmethod
+    def results_extension(report_format: str) -> str:
+        """
+        Returns the extension of the result files of a report format.
+        """
+        return {
+            "json": ".json",
+            "jsonl": ".jsonl",
+            "parquet": ".parquet",
+        }.get(report_format, ".csv")
+
+    @staticmethod
+    def project_results_path(
+        details_dir: str, project_name: str, report_format: str = "csv"
+    ) -> str:
+        """
+        Returns the path of the detailed results of a project, without
+        extension (see `ResultSink.open`).
+
+        Parquet results are partitioned by project, in the `project=<name>`
+        folders of a Hive-style dataset, so that they can be read (and
+        filtered by project) as a single table.
+
+        Parameters:
+        - details_dir (str): The directory of the detailed results.
+        - project_name (str): The name of the project.
+        - report_format (str): "csv" (default), "json", "jsonl" or
+          "parquet".
+
+        Returns:
+        - str: The path of the results of the project.
+        """
+        if report_format == "parquet":
+            partition = f"project={quote(project_name, safe='')}"
+            return os.path.join(details_dir, partition, "results")
+        return os.path.join(details_dir, f"{project_name}_results")
+
+    @staticmethod
+    def _merge_parquet_dataset(
+        file_paths: list[str],
+        input_dir: str,
+        output_dir: str,
+        partition_by_smell: bool = False,
+    ):
+        """
+        Merges the Parquet results of the projects into the overview
+        dataset (`overview.parquet`), partitioned by project and, if
+        requested, by smell. Record batches are streamed from the results
+        to the overview, never loading the whole table.
+
+        Parameters:
+        - file_paths (list[str]): Paths of the result files, in their
+          `project=<name>` folders.
+        - input_dir (str): The directory of the project folders.
+        - output_dir (str): Directory where the merged results will be saved.
+        - partition_by_smell (bool): Whether to partition by smell, besides
+          by project.
+        """
+        if not file_paths:
+            print("No valid PARQUET files found to merge.")
+            return
+
+        pa = require_pyarrow()
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(
+            file_paths,
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([("project", pa.string())]), flavor="hive"
+            ),
+            partition_base_dir=input_dir,
+        )
+        if dataset.count_rows() == 0:
+            print("No valid PARQUET files found to merge.")
+            return
+
+        overview_path = os.path.join(output_dir, "overview.parquet")
+        if os.path.isdir(overview_path):
+            shutil.rmtree(overview_path)
+        elif os.path.exists(overview_path):
+            os.remove(overview_path)
+
+        columns = dataset.schema.names
+        ds.write_dataset(
+            dataset,
+            overview_path,
+            format="parquet",
+            partitioning=["project"]
+            + (["smell_name"] if partition_by_smell else []),
+            partitioning_flavor="hive",
+            file_options=ds.ParquetFileFormat().make_write_options(
+                use_dictionary=[
+                    column
+                    for column in ParquetResultSink.DICTIONARY_COLUMNS
+                    if column in columns
+                ]
+            ),
+            preserve_order=True,
+        )
+        print(f"Merged results saved to {overview_path}")
+
+    @staticmethod
+    def _read_results(file_path: str, extension: str) -> list[dict]:
+        """
+        Reads the records of a results file.
+
+        Parameters:
+        - file_path (str): Path of the results file.
+        - extension (str): Extension of the results format.
+
+        Returns:
+        - list[dict]: The records of the file, one per code smell.
+        """
+        if extension == ".parquet":
+            return require_pyarrow().parquet.read_table(file_path).to_pylist()
+        with open(file_path, "r", encoding="utf-8", newline="") as file:
+            if extension == ".csv":
+                return list(csv.DictReader(file))
+            if extension == ".jsonl":
+                return [json.loads(line) for line in file if line.strip()]
+            return json.load(file)
 
     @staticmethod
     def initialize_log(log_path: str):
@@ -211,6 +362,24 @@ class FileUtils:
         except FileNotFoundError:
             return ""
 
+    @staticmethod
+    def get_logged_projects(log_path: str) -> set[str]:
+        """
+        Retrieves the names of all the projects logged in the execution log,
+        whatever the order they completed in.
+
+        Parameters:
+        - log_path (str): Path to the log file.
+
+        Returns:
+        - set[str]: Names of the logged projects (empty if there is no log).
+        """
+        try:
+            with open(log_path, "r") as log_file:
+                return {line.strip() for line in log_file if line.strip()}
+        except FileNotFoundError:
+            return set()
+
     @staticmethod
     def synchronized_append_to_log(log_path: str, project_name: str, lock):
         """
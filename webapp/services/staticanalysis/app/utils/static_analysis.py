@@ -1,5 +1,4 @@
 import os
-import tempfile
 import pandas as pd
 
 try:
@@ -17,14 +16,11 @@ inspector = Inspector(output_path=OUTPUT_DIR)
 
 
 def detect_static(code_snippet: str) -> dict:
-    temp_file_path = None
     try:
-        # Create a temporary file to analyze the code snippet
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as temp_file:
-            temp_file.write(code_snippet)
-            temp_file_path = temp_file.name
-
-        smells_df: pd.DataFrame = inspector.inspect(temp_file_path)
+        # The snippet is analyzed in memory, without a temporary file
+        smells_df: pd.DataFrame = inspector.inspect_source(
+            code_snippet, "<snippet>"
+        )
 
         # Handle cases with no results
         if smells_df.empty:
@@ -45,10 +41,3 @@ def detect_static(code_snippet: str) -> dict:
 
     except Exception as e:
         return {"success": False, "response": str(e)}
-
-    finally:
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.remove(temp_file_path)
-            except OSError:
-                pass
\ No newline at end of file